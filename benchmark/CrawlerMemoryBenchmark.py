@@ -0,0 +1,49 @@
+"""
+Benchmark that reports the memory used per crawler by a glob.
+
+Usage: python CrawlerMemoryBenchmark.py [totalFiles]
+"""
+import os
+import sys
+import shutil
+import tempfile
+import tracemalloc
+
+# querying root directory
+root = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.insert(1, os.path.join(root, "src", "lib"))
+
+from kombi.Crawler.Fs import FsCrawler  # noqa: E402
+
+def run(totalFiles):
+    """
+    Run the benchmark printing the memory used per crawler.
+    """
+    tempDirectory = tempfile.mkdtemp()
+    try:
+        # creating an image sequence and a few ascii files per shot
+        for shotIndex in range(max(1, totalFiles // 1000)):
+            shotDirectory = os.path.join(tempDirectory, "shot{:03d}".format(shotIndex), "plates")
+            os.makedirs(shotDirectory)
+            for frame in range(1000):
+                open(os.path.join(shotDirectory, "plate_v001.{:04d}.exr".format(frame)), "w").close()
+            for name in ("info.json", "notes.txt"):
+                open(os.path.join(shotDirectory, name), "w").close()
+
+        crawler = FsCrawler.createFromPath(tempDirectory)
+
+        tracemalloc.start()
+        crawlers = crawler.glob()
+        usedMemory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        print("crawlers: {}".format(len(crawlers)))
+        print("bytes per crawler: {}".format(usedMemory // len(crawlers)))
+        print("crawler instance __dict__: {}".format(hasattr(crawlers[-1], '__dict__')))
+        print("path holder instance __dict__: {}".format(hasattr(crawlers[-1].pathHolder(), '__dict__')))
+    finally:
+        shutil.rmtree(tempDirectory)
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
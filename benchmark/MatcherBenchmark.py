@@ -0,0 +1,94 @@
+"""
+Benchmark that reports the time spent matching crawlers against matchers.
+
+The compiled matcher is compared against the previous implementation (which
+resolved the registered types and the glob patterns for every evaluation).
+
+Usage: python MatcherBenchmark.py [totalEvaluations]
+"""
+import os
+import sys
+import time
+from fnmatch import fnmatch
+
+# querying root directory
+root = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.insert(1, os.path.join(root, "src", "lib"))
+
+from kombi.Crawler import Crawler, Matcher  # noqa: E402
+from kombi.Crawler.Fs import FsCrawler  # noqa: E402
+
+def legacyMatch(matcher, crawler):
+    """
+    Return a boolean telling if the crawler matches (previous implementation).
+    """
+    foundType = not matcher.matchTypes()
+    for matchType in matcher.matchTypes():
+        if crawler.var('type') in Crawler.registeredSubTypes(matchType):
+            foundType = True
+            break
+
+    if not foundType:
+        return False
+
+    for varName in matcher.matchVarNames():
+        varNameParts = varName.split('=')
+        if len(varNameParts) > 1 and crawler.var('type') not in Crawler.registeredSubTypes(varNameParts[0]):
+            continue
+
+        if varNameParts[-1] not in crawler.varNames():
+            return False
+
+        matchVarValue = matcher.matchVar(varName)
+        if not isinstance(matchVarValue, (list, tuple)):
+            matchVarValue = [matchVarValue]
+
+        foundValue = False
+        for value in matchVarValue:
+            if fnmatch(str(crawler.var(varNameParts[-1])), str(value)):
+                foundValue = True
+                break
+
+        if not foundValue:
+            return False
+
+    return True
+
+def run(totalEvaluations):
+    """
+    Run the benchmark printing the time spent by each implementation.
+    """
+    matchers = [
+        Matcher(['exr']),
+        Matcher(['exr', 'dpx'], {'ext': ['exr', 'dpx']}),
+        Matcher(['file'], {'name': 'plate_*', 'exr=padding': 4}),
+        Matcher(['directory', 'jpg']),
+        Matcher([], {'imageType': 'sequence', 'frame': '1*'})
+    ]
+
+    totalCrawlers = max(1, totalEvaluations // len(matchers))
+    crawlers = []
+    for index in range(totalCrawlers):
+        crawlers.append(
+            FsCrawler.createFromPath(
+                "/tmp/shot{:03d}/plate_v001.{:04d}.exr".format(index // 1000, index % 1000),
+                "exr"
+            )
+        )
+
+    print("evaluations: {}".format(len(crawlers) * len(matchers)))
+    results = []
+    for name, matchFunction in (("legacy", legacyMatch), ("compiled", Matcher.match)):
+        startTime = time.time()
+        total = 0
+        for matcher in matchers:
+            for crawler in crawlers:
+                total += matchFunction(matcher, crawler)
+        results.append(total)
+        print("{}: {:.3f}s ({} matches)".format(name, time.time() - startTime, total))
+
+    assert results[0] == results[1], "Implementations have different results!"
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
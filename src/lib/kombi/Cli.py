@@ -5,6 +5,8 @@ import subprocess
 import fileinput
 from .Crawler.Fs.FsCrawler import FsCrawler
 from .Crawler.Fs.DirectoryCrawler import DirectoryCrawler
+from .Crawler.Fs.CrawlIndex import CrawlIndex
+from .Crawler.Fs.CrawlSnapshot import CrawlSnapshot
 from .Crawler import Crawler
 from .TaskHolder.Loader import Loader
 from .TaskHolder.Dispatcher import Dispatcher
@@ -37,6 +39,15 @@ class Cli(object):
             help='path for a file or directory. If empty it uses stdin.'
         )
 
+        self.__parser.add_argument(
+            '--snapshot',
+            metavar='SNAPSHOT',
+            default='',
+            help='path for a crawl snapshot file. When defined only the crawlers that '
+                 'changed since the snapshot are dispatched (the snapshot is updated '
+                 'after the dispatch).'
+        )
+
     def run(self, args, outStream=sys.stdout, errStream=subprocess.STDOUT):
         """
         Execute the configuration.
@@ -67,14 +78,33 @@ class Cli(object):
         dispatcher.setStdout(outStream)
         dispatcher.setStderr(errStream)
 
-        # dispatching task holders
+        # dispatching task holders (the groups are shared by all of them)
+        crawlerGroups = Crawler.group(crawlers)
+
+        # incremental mode: only dispatching the groups containing
+        # crawlers that changed since the previous snapshot
+        snapshot = None
+        if parseArgs.snapshot:
+            snapshot = CrawlSnapshot.create(crawlers)
+            added, removed, modified = snapshot.diff(CrawlSnapshot.load(parseArgs.snapshot))
+            changedPaths = set(added)
+            changedPaths.update(modified)
+
+            crawlerGroups = list(filter(
+                lambda x: any(crawler.var('fullPath') in changedPaths for crawler in x),
+                crawlerGroups
+            ))
+
         for taskHolder in loader.taskHolders():
-            for crawlersGroup in Crawler.group(crawlers):
+            for crawlersGroup in crawlerGroups:
                 dispatcher.dispatch(
                     taskHolder,
                     crawlersGroup
                 )
 
+        if snapshot is not None:
+            snapshot.save(parseArgs.snapshot)
+
     def __loadCrawlers(self, sourcePaths):
         """
         Return the source crawlers.
@@ -82,10 +112,16 @@ class Cli(object):
         crawlers = []
         globDirectoryCrawlers = True
 
+        # using the persistent crawl index when its cache
+        # directory is defined (KOMBI_CRAWL_INDEX_DIR)
+        crawlIndex = None
+        if CrawlIndex.defaultCacheDirectory():
+            crawlIndex = CrawlIndex()
+
         # source through argument
         if sourcePaths:
             for sourcePath in sourcePaths:
-                crawler = FsCrawler.createFromPath(sourcePath)
+                crawler = FsCrawler.createFromPath(sourcePath, crawlIndex=crawlIndex)
                 crawlers.append(crawler)
 
         # source through stdin
@@ -108,7 +144,7 @@ class Cli(object):
 
                 # otherwise when stdin is reading a list of paths
                 else:
-                    crawler = FsCrawler.createFromPath(crawlerFullPath)
+                    crawler = FsCrawler.createFromPath(crawlerFullPath, crawlIndex=crawlIndex)
 
                 crawlers.append(crawler)
         else:
@@ -116,10 +152,13 @@ class Cli(object):
 
         # when a directory is detected as input. We glob
         # by default. The only exception is when
-        # the crawler type is defined (reading a kombi output)
+        # the crawler type is defined (reading a kombi output).
+        # The crawlers are grouped (sorted) before the dispatch, so
+        # the whole result is needed anyway: using glob (threaded
+        # and optionally sharded walk) rather than iterGlob
         if globDirectoryCrawlers:
             for crawler in list(crawlers):
                 if isinstance(crawler, DirectoryCrawler):
-                    crawlers += crawler.glob()
+                    crawlers.extend(crawler.glob())
 
         return crawlers
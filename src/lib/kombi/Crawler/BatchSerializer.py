@@ -0,0 +1,249 @@
+import json
+import zlib
+
+# compatibility with python 2/3
+try:
+    basestring
+except NameError:
+    basestring = str
+
+try:
+    unicode
+except NameError:
+    unicode = str
+
+class BatchSerializerError(Exception):
+    """Batch Serializer Error."""
+
+class BatchSerializerFormatError(BatchSerializerError):
+    """Batch Serializer Format Error."""
+
+class BatchSerializer(object):
+    """
+    Compact binary serialization for a list of crawler contents.
+
+    The contents of a crawler are described by a dict containing "vars",
+    "contextVarNames" and "tags" (the same information used by Crawler.toJson).
+    The binary layout is:
+
+        magic (8 bytes) + version (1 byte) + zlib(body)
+
+    Where the body contains a string table followed by the crawler records. All
+    strings (var names, tag names, crawler types and string values) are stored
+    once in the table and referenced by index. String values containing a "/"
+    are split at the last separator, therefore paths under the same directory
+    share the same prefix entry. Integers are stored as variable length
+    integers, any other value (float, bool, None, list, dict) is stored as
+    inline json.
+
+    All integers used by the layout are unsigned LEB128 (zig-zag encoded for
+    the int values).
+    """
+
+    magic = b'KOMBICB\x00'
+    version = 1
+
+    # value kinds
+    __stringKind = 0
+    __pathKind = 1
+    __intKind = 2
+    __jsonKind = 3
+
+    @classmethod
+    def dump(cls, contentsList):
+        """
+        Return the binary data (bytes) about the input list of crawler contents.
+        """
+        strings = []
+        stringIndexes = {}
+
+        def stringIndex(value):
+            if not isinstance(value, unicode):
+                value = value.decode('utf-8')
+
+            index = stringIndexes.get(value)
+            if index is None:
+                index = len(strings)
+                stringIndexes[value] = index
+                strings.append(value)
+            return index
+
+        records = bytearray()
+        cls.__writeInt(records, len(contentsList))
+        for contents in contentsList:
+            contextVarNames = set(contents['contextVarNames'])
+
+            # vars
+            cls.__writeInt(records, len(contents['vars']))
+            for varName, varValue in contents['vars'].items():
+                cls.__writeInt(records, stringIndex(varName))
+                cls.__writeValue(
+                    records,
+                    varValue,
+                    stringIndex,
+                    1 if varName in contextVarNames else 0
+                )
+
+            # tags
+            cls.__writeInt(records, len(contents['tags']))
+            for tagName, tagValue in contents['tags'].items():
+                cls.__writeInt(records, stringIndex(tagName))
+                cls.__writeValue(records, tagValue, stringIndex)
+
+        # string table
+        body = bytearray()
+        cls.__writeInt(body, len(strings))
+        for value in strings:
+            cls.__writeBytes(body, value.encode('utf-8'))
+        body += records
+
+        return cls.magic + bytearray([cls.version]) + zlib.compress(bytes(body))
+
+    @classmethod
+    def load(cls, data):
+        """
+        Return a list of crawler contents from the binary data created by dump.
+        """
+        if not cls.isBinary(data):
+            raise BatchSerializerFormatError(
+                'Data is not in the binary batch format!'
+            )
+
+        version = bytearray(data[len(cls.magic):len(cls.magic) + 1])[0]
+        if version != cls.version:
+            raise BatchSerializerFormatError(
+                'Unsupported binary batch format version: {}'.format(version)
+            )
+
+        body = bytearray(zlib.decompress(bytes(data[len(cls.magic) + 1:])))
+        offset = [0]
+
+        # string table
+        strings = []
+        for i in range(cls.__readInt(body, offset)):
+            strings.append(cls.__readBytes(body, offset).decode('utf-8'))
+
+        # records
+        result = []
+        for i in range(cls.__readInt(body, offset)):
+            contents = {
+                "vars": {},
+                "contextVarNames": [],
+                "tags": {}
+            }
+
+            for j in range(cls.__readInt(body, offset)):
+                varName = strings[cls.__readInt(body, offset)]
+                varValue, isContextVar = cls.__readValue(body, offset, strings)
+                contents['vars'][varName] = varValue
+                if isContextVar:
+                    contents['contextVarNames'].append(varName)
+
+            for j in range(cls.__readInt(body, offset)):
+                tagName = strings[cls.__readInt(body, offset)]
+                contents['tags'][tagName] = cls.__readValue(body, offset, strings)[0]
+
+            result.append(contents)
+
+        return result
+
+    @classmethod
+    def isBinary(cls, data):
+        """
+        Return a boolean telling if the input data is in the binary batch format.
+        """
+        return isinstance(data, (bytes, bytearray)) and bytes(data[:len(cls.magic)]) == cls.magic
+
+    @classmethod
+    def __writeValue(cls, output, value, stringIndex, flag=0):
+        """
+        Write a value (prefixed by its kind and flag).
+        """
+        if isinstance(value, basestring):
+            parts = value.rsplit('/', 1)
+            if len(parts) > 1:
+                cls.__writeInt(output, (cls.__pathKind << 1) | flag)
+                cls.__writeInt(output, stringIndex(parts[0]))
+                cls.__writeInt(output, stringIndex(parts[1]))
+            else:
+                cls.__writeInt(output, (cls.__stringKind << 1) | flag)
+                cls.__writeInt(output, stringIndex(value))
+
+        # bool is a subclass of int, therefore it needs to be serialized as json
+        elif isinstance(value, int) and not isinstance(value, bool):
+            cls.__writeInt(output, (cls.__intKind << 1) | flag)
+            cls.__writeInt(output, (value << 1) if value >= 0 else ((-value << 1) - 1))
+
+        else:
+            cls.__writeInt(output, (cls.__jsonKind << 1) | flag)
+            cls.__writeBytes(output, json.dumps(value).encode('utf-8'))
+
+    @classmethod
+    def __readValue(cls, data, offset, strings):
+        """
+        Return a tuple containing the value and its flag.
+        """
+        header = cls.__readInt(data, offset)
+        kind = header >> 1
+        flag = header & 1
+
+        if kind == cls.__stringKind:
+            value = strings[cls.__readInt(data, offset)]
+        elif kind == cls.__pathKind:
+            value = strings[cls.__readInt(data, offset)]
+            value += '/' + strings[cls.__readInt(data, offset)]
+        elif kind == cls.__intKind:
+            value = cls.__readInt(data, offset)
+            value = (value >> 1) if not value & 1 else -((value + 1) >> 1)
+        elif kind == cls.__jsonKind:
+            value = json.loads(cls.__readBytes(data, offset).decode('utf-8'))
+        else:
+            raise BatchSerializerFormatError(
+                'Invalid value kind: {}'.format(kind)
+            )
+
+        return value, flag
+
+    @staticmethod
+    def __writeInt(output, value):
+        """
+        Write an unsigned variable length integer.
+        """
+        while value > 0x7f:
+            output.append((value & 0x7f) | 0x80)
+            value >>= 7
+        output.append(value)
+
+    @staticmethod
+    def __readInt(data, offset):
+        """
+        Read an unsigned variable length integer (the offset is updated in place).
+        """
+        result = 0
+        shift = 0
+        while True:
+            byte = data[offset[0]]
+            offset[0] += 1
+            result |= (byte & 0x7f) << shift
+            if not byte & 0x80:
+                return result
+            shift += 7
+
+    @classmethod
+    def __writeBytes(cls, output, value):
+        """
+        Write a length prefixed sequence of bytes.
+        """
+        cls.__writeInt(output, len(value))
+        output += value
+
+    @classmethod
+    def __readBytes(cls, data, offset):
+        """
+        Read a length prefixed sequence of bytes (the offset is updated in place).
+        """
+        size = cls.__readInt(data, offset)
+        result = bytes(data[offset[0]:offset[0] + size])
+        offset[0] += size
+
+        return result
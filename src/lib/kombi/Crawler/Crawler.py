@@ -1,8 +1,14 @@
 import os
+import copy
 import json
+import fnmatch
 import traceback
 from collections import OrderedDict
+from .PathHolder import PathHolder
 from .VarExtractor import VarExtractor
+from .Walker import Walker
+from .CrawlerGroup import CrawlerGroup
+from .BatchSerializer import BatchSerializer
 
 # compatibility with python 2/3
 try:
@@ -10,6 +16,11 @@ try:
 except NameError:
     basestring = str
 
+try:
+    from sys import intern
+except ImportError:
+    pass
+
 class CrawlerError(Exception):
     """Crawler Error."""
 
@@ -30,24 +41,53 @@ class Crawler(object):
     Abstracted Crawler.
     """
 
+    __slots__ = ('__vars', '__contextVars', '__inheritedVars', '__sharedVars', '__tags', '__globCache', '__testResult')
+
     __registeredTypes = OrderedDict()
+    __dispatchIndex = {}
+    __registryVersion = 0
+    __serializationFormatEnvName = 'KOMBI_CRAWLER_SERIALIZATION'
+
+    # shared by the crawlers without context flags (never modified)
+    __emptyContextVars = {}
 
-    def __init__(self, name, parentCrawler=None):
+    # Optional static selectors used by Crawler.create to narrow down the
+    # crawler types that are tested against a path holder: a list of
+    # lower case extensions (testExtensions) and whether the path must be
+    # a directory (testIsDirectory). A type that declares a selector must
+    # always fail the test for paths outside of it. The selectors are
+    # inherited, so derived classes that extend the test (rather than
+    # restricting it) need to override them. None means no restriction.
+    testExtensions = None
+    testIsDirectory = None
+
+    def __init__(self, name, parentCrawler=None, testResult=None):
         """
         Create a crawler.
+
+        The testResult is the object returned by the test of the crawler type
+        when it's not a plain boolean (passed by Crawler.create), it's only
+        available during the construction of the crawler (see testResult).
         """
+        self.__testResult = testResult
+
+        # the variables are stored in layers: the local layer (vars and
+        # context flags assigned to this crawler) and a read-only chain of layers
+        # inherited from the parent crawlers (__inheritedVars), which is
+        # shared by all crawlers created under the same parent. The local
+        # layer is copied on write once it has been shared with a child.
         self.__vars = {}
-        self.__tags = {}
-        self.__contextVarNames = set()
+        self.__contextVars = Crawler.__emptyContextVars
+        self.__inheritedVars = None
+        self.__sharedVars = None
+        self.__tags = None
 
         # passing variables
         if parentCrawler:
             assert isinstance(parentCrawler, Crawler), \
                 "Invalid crawler type!"
 
-            for varName in parentCrawler.varNames():
-                isContextVar = (varName in parentCrawler.contextVarNames())
-                self.setVar(varName, parentCrawler.var(varName), isContextVar)
+            self.__inheritedVars = parentCrawler.__shareVars()
 
             self.setVar(
                 'fullPath',
@@ -62,36 +102,71 @@ class Crawler(object):
         self.setVar('name', name)
         self.__globCache = None
 
+    def testResult(self):
+        """
+        Return the object returned by the test of the crawler type (or None).
+
+        Crawler types can return a match object from the test (any truthy value
+        other than True), for instance the result of parsing the name, so the
+        constructor can reuse it rather than computing it again. It is only
+        available while the crawler is being created by Crawler.create.
+        """
+        return self.__testResult
+
     def isLeaf(self):
         """
         For re-implementation: Return a boolean telling if the crawler is leaf.
         """
         return True
 
-    def children(self):
+    def children(self, dataFilter=None):
         """
         Return a list of crawlers.
+
+        The optional dataFilter is a callable that receives the data used to
+        create each child (for instance a PathHolder), children whose data is
+        rejected don't need to be created. It is only a hint, implementations
+        that don't support it return all children.
         """
         assert not self.isLeaf(), "Can't compute children from a leaf crawler!"
 
-        result = self._computeChildren()
+        if dataFilter is None:
+            result = self._computeChildren()
+        else:
+            result = self._computeFilteredChildren(dataFilter)
         for crawler in result:
             assert isinstance(crawler, Crawler), \
                 "Invalid Crawler Type"
 
         return result
 
+    def _computeFilteredChildren(self, dataFilter):
+        """
+        For re-implementation: Return the children accepted by the data filter.
+
+        By default it ignores the filter (see children).
+        """
+        return self._computeChildren()
+
     def varNames(self):
         """
         Return a list of variable names assigned to the crawler.
         """
-        return list(self.__vars.keys())
+        if self.__inheritedVars is None:
+            return list(self.__vars.keys())
+
+        return list(self.__mergedLayers(0).keys())
 
     def contextVarNames(self):
         """
         Return a list of variable names that are defined as context variables.
         """
-        return list(self.__contextVarNames)
+        if self.__inheritedVars is None:
+            contextVars = self.__contextVars
+        else:
+            contextVars = self.__mergedLayers(1)
+
+        return [name for name, isContextVar in contextVars.items() if isContextVar]
 
     def assignVars(self, varExtractor):
         """
@@ -112,10 +187,23 @@ class Crawler(object):
         """
         Set a value for a variable.
         """
-        if isContextVar:
-            self.__contextVarNames.add(name)
-        elif name in self.__contextVarNames:
-            self.__contextVarNames.remove(name)
+        # var names are repeated across all crawlers
+        if isinstance(name, str):
+            name = intern(name)
+
+        # the local layer is shared with the children, copying it
+        # before the modification
+        if self.__sharedVars is not None:
+            self.__vars = dict(self.__vars)
+            self.__contextVars = dict(self.__contextVars)
+            self.__sharedVars = None
+
+        # context flags are only stored for context vars, or to
+        # override an inherited context var
+        if isContextVar or self.__contextVars.get(name) or (name not in self.__contextVars and self.__isInheritedContextVar(name)):
+            if self.__contextVars is Crawler.__emptyContextVars:
+                self.__contextVars = {}
+            self.__contextVars[name] = isContextVar
 
         self.__vars[name] = value
 
@@ -123,30 +211,72 @@ class Crawler(object):
         """
         Return the value for a variable.
         """
-        if name not in self.__vars:
-            raise CrawlerInvalidVarError(
-                'Variable not found "{0}"'.format(name)
-            )
+        if name in self.__vars:
+            return self.__vars[name]
+
+        layer = self.__inheritedVars
+        while layer is not None:
+            if name in layer[0]:
+                return layer[0][name]
+            layer = layer[2]
+
+        raise CrawlerInvalidVarError(
+            'Variable not found "{0}"'.format(name)
+        )
+
+    def hasVar(self, name):
+        """
+        Return a boolean telling if the variable is assigned to the crawler.
 
-        return self.__vars[name]
+        Same as testing against varNames (lazy variables that have not been
+        computed yet are not included) without merging all the variables.
+        """
+        if name in self.__vars:
+            return True
+
+        layer = self.__inheritedVars
+        while layer is not None:
+            if name in layer[0]:
+                return True
+            layer = layer[2]
+
+        return False
+
+    @classmethod
+    def lazyVarNames(cls):
+        """
+        Return a frozenset containing the names of the vars computed on demand (by var).
+
+        These vars are only assigned once they are queried, therefore they
+        are not part of varNames until then.
+        """
+        return frozenset()
 
     def tagNames(self):
         """
         Return a list of tag names assigned to the crawler.
         """
+        if self.__tags is None:
+            return []
+
         return self.__tags.keys()
 
     def setTag(self, name, value):
         """
         Set a value for a tag.
         """
+        # most of the crawlers don't have tags, creating
+        # the dict on demand
+        if self.__tags is None:
+            self.__tags = {}
+
         self.__tags[name] = value
 
     def tag(self, name):
         """
         Return the value for a tag.
         """
-        if name not in self.__tags:
+        if self.__tags is None or name not in self.__tags:
             raise CrawlerInvalidTagError(
                 'Tag not found "{0}"'.format(name)
             )
@@ -156,61 +286,148 @@ class Crawler(object):
     def clone(self):
         """
         Return a cloned instance about the current crawler.
-        """
-        return Crawler.createFromJson(self.toJson())
 
-    def toJson(self):
-        """
-        Serialize the crawler to json (it can be recovered later using fromJson).
+        The clone is created without running the constructor (and without
+        touching the disk). The vars are shared with the clone until one
+        of them is modified (copy-on-write), the tags are copied and the
+        var values themselves are not copied (shallow). Use toJson/createFromJson
+        to transport crawlers across processes instead.
         """
-        crawlerContents = {
-            "vars": {},
-            "contextVarNames": [],
-            "tags": {}
-        }
+        result = copy.copy(self)
 
-        for varName in self.varNames():
-            crawlerContents['vars'][varName] = self.var(varName)
+        # sharing the local vars, both crawlers copy them before
+        # the next modification
+        if self.__sharedVars is None:
+            self.__sharedVars = (self.__vars, self.__contextVars, self.__inheritedVars)
+        result.__sharedVars = self.__sharedVars
 
-        for varName in self.contextVarNames():
-            crawlerContents['contextVarNames'].append(varName)
+        if self.__tags is not None:
+            result.__tags = dict(self.__tags)
+        result.__globCache = None
 
-        for tagName in self.tagNames():
-            crawlerContents['tags'][tagName] = self.tag(tagName)
+        return result
 
+    def toJson(self):
+        """
+        Serialize the crawler to json (it can be recovered later using fromJson).
+        """
         return json.dumps(
-            crawlerContents,
+            self.__contents(),
             indent=4,
             separators=(',', ': ')
         )
 
-    def glob(self, filterTypes=[], useCache=True):
+    def glob(self, filterTypes=[], useCache=True, workers=None, maxDepth=None, excludeDirs=[], descendFilter=None, processes=None, skipDuplicates=False):
         """
         Return a list of all crawlers found recursively under this path.
 
         Filter result list by crawler type (str) or class type (both include derived classes).
-        """
-        if self.__globCache is None or not useCache:
-            # Recursively collect all children crawlers
-            self.__globCache = Crawler.__collectCrawlers(self)
 
-        if not filterTypes:
-            return self.__globCache
+        The children are computed in parallel using up to "workers" threads (when
+        not supplied it uses Walker.defaultWorkers). The walk can also be sharded
+        across up to "processes" processes (when not supplied it uses
+        Walker.defaultProcesses). The result is always returned in the same
+        (depth-first) order regardless of the number of workers and processes.
+
+        The walk can be pruned by:
+            - maxDepth: maximum depth (1 means only the children of this crawler)
+            - excludeDirs: glob patterns for the directories (non-leaf crawlers)
+              that are left out together with everything under them. Patterns
+              containing "/" are matched against the full path, otherwise
+              against the base name
+            - descendFilter: callable receiving a non-leaf crawler (or a list of
+              glob patterns) telling if the crawlers under it should be visited
+
+        The filter types are pushed down to the walk: files that cannot produce
+        any of the filter types (based on the static selectors of the registered
+        types) are never turned into crawlers. Only the complete tree is cached,
+        when the cache is available the pruning is done in memory.
+
+        When skipDuplicates is enabled the crawlers pointing to data already
+        found by the walk (same "device" and "inode", for instance hardlinks
+        and symlinks) are skipped, including everything under them. The
+        tree is always walked in this case (see Walker.walk).
+        """
+        isPruned = maxDepth is not None or excludeDirs or descendFilter is not None
+        subClasses = Crawler.__filterClasses(filterTypes) if filterTypes else None
+
+        if self.__globCache is not None and useCache and not skipDuplicates:
+            result = self.__globCache
+            if isPruned:
+                result = Crawler.__pruneCrawlers(
+                    self.var('fullPath'),
+                    result,
+                    maxDepth,
+                    Crawler.__excludeDirsFilter(excludeDirs),
+                    Crawler.__descendFilter(descendFilter)
+                )
 
-        filteredCrawlers = set()
-        for filterType in filterTypes:
-            subClasses = tuple(Crawler.registeredSubclasses(filterType))
-            filteredCrawlers.update(
-                filter(lambda x: isinstance(x, subClasses), self.__globCache)
+        elif isPruned or subClasses is not None or skipDuplicates:
+            excludeFilter = Crawler.__excludeDirsFilter(excludeDirs)
+            result = Walker(workers, processes).walk(
+                self,
+                maxDepth,
+                Crawler.__walkDescendFilter(excludeFilter, Crawler.__descendFilter(descendFilter)),
+                Crawler.__walkDataFilter(excludeDirs, filterTypes),
+                skipDuplicates
             )
-        return list(filteredCrawlers)
+            if excludeFilter is not None:
+                result = [x for x in result if not excludeFilter(x)]
+
+        else:
+            # Recursively collect all children crawlers
+            self.__globCache = Walker(workers, processes).walk(self)
+            result = self.__globCache
+
+        if subClasses is None:
+            return result
+
+        # filtering in place to keep the order of the result
+        return list(filter(lambda x: isinstance(x, subClasses), result))
+
+    def _setGlobCache(self, crawlers):
+        """
+        Replace the crawlers cached by glob (None invalidates the cache).
+
+        Used by the implementations that keep the glob result up to date
+        incrementally (for instance, watched directory crawlers).
+        """
+        self.__globCache = crawlers
+
+    def iterGlob(self, filterTypes=[], depthFirst=True, maxDepth=None, excludeDirs=[], descendFilter=None, skipDuplicates=False):
+        """
+        Return a generator that yields all crawlers found recursively under this path.
+
+        Differently from glob, the crawlers are yielded as soon as they are found
+        and they are not cached. Filter result by crawler type (str) or class
+        type (both include derived classes). The walk is pruned the same
+        way as glob (maxDepth, excludeDirs, descendFilter, filter types and
+        skipDuplicates).
+        """
+        subClasses = Crawler.__filterClasses(filterTypes) if filterTypes else None
+        excludeFilter = Crawler.__excludeDirsFilter(excludeDirs)
+        crawlers = Walker.iterWalk(
+            self,
+            depthFirst,
+            maxDepth,
+            Crawler.__walkDescendFilter(excludeFilter, Crawler.__descendFilter(descendFilter)),
+            Crawler.__walkDataFilter(excludeDirs, filterTypes),
+            skipDuplicates
+        )
+
+        for crawler in crawlers:
+            if excludeFilter is not None and excludeFilter(crawler):
+                continue
+
+            if subClasses is None or isinstance(crawler, subClasses):
+                yield crawler
 
     def __repr__(self):
         """
         Return a string representation for the crawler.
         """
         return "{}({})".format(
-            self.__class__.__name__ if 'type' not in self.varNames() else self.var('type'),
+            self.__class__.__name__ if not self.hasVar('type') else self.var('type'),
             self.var('fullPath')
         )
 
@@ -230,7 +447,7 @@ class Crawler(object):
         Create a crawler for the input data.
         """
         result = None
-        for registeredName in reversed(Crawler.__registeredTypes.keys()):
+        for registeredName in Crawler.__dispatchTypes(data):
             crawlerTypeClass = Crawler.__registeredTypes[registeredName]
             passedTest = False
 
@@ -248,10 +465,14 @@ class Crawler(object):
                     )
                 )
 
-            # creating crawler
+            # creating crawler (handing off the test result to the
+            # constructor when it's a match object)
             if passedTest:
                 try:
-                    result = crawlerTypeClass(data, parentCrawler)
+                    if passedTest is True:
+                        result = crawlerTypeClass(data, parentCrawler)
+                    else:
+                        result = crawlerTypeClass(data, parentCrawler, testResult=passedTest)
                 except Exception as err:
                     traceback.print_exc()
 
@@ -263,6 +484,7 @@ class Crawler(object):
                         )
                     )
                 else:
+                    result.__testResult = None
                     result.setVar('type', registeredName)
                 break
 
@@ -285,6 +507,17 @@ class Crawler(object):
             "Invalid crawler class!"
 
         Crawler.__registeredTypes[name] = crawlerClass
+        Crawler.__dispatchIndex = {}
+        Crawler.__registryVersion += 1
+
+    @staticmethod
+    def registryVersion():
+        """
+        Return a number that changes every time a crawler type gets registered.
+
+        It can be used to invalidate data computed from the registered types.
+        """
+        return Crawler.__registryVersion
 
     @staticmethod
     def registeredType(name):
@@ -330,7 +563,58 @@ class Crawler(object):
         """
         Create a crawler based on the jsonContents (serialized via toJson).
         """
-        contents = json.loads(jsonContents)
+        return Crawler.__createFromContents(json.loads(jsonContents))
+
+    @staticmethod
+    def dumpMany(crawlers, binary=None):
+        """
+        Serialize a list of crawlers (it can be recovered later using loadMany).
+
+        The result is returned as bytes. By default (binary=None) the format is
+        driven by the environment variable KOMBI_CRAWLER_SERIALIZATION
+        ("json" or "binary"). The json format is a readable list of crawlers
+        serialized via toJson, the binary format is a compact representation
+        (see BatchSerializer) intended for large lists of crawlers.
+        """
+        if binary is None:
+            binary = Crawler.serializationFormat() == 'binary'
+
+        if binary:
+            return BatchSerializer.dump(
+                list(map(lambda x: x.__contents(), crawlers))
+            )
+
+        return json.dumps(
+            list(map(lambda x: x.toJson(), crawlers))
+        ).encode('utf-8')
+
+    @staticmethod
+    def loadMany(contents):
+        """
+        Return a list of crawlers from the contents serialized via dumpMany.
+
+        The format (json or binary) is detected automatically.
+        """
+        if BatchSerializer.isBinary(contents):
+            return list(map(Crawler.__createFromContents, BatchSerializer.load(contents)))
+
+        if isinstance(contents, bytes):
+            contents = contents.decode('utf-8')
+
+        return list(map(Crawler.createFromJson, json.loads(contents)))
+
+    @staticmethod
+    def serializationFormat():
+        """
+        Return the default format used by dumpMany (KOMBI_CRAWLER_SERIALIZATION).
+        """
+        return os.environ.get(Crawler.__serializationFormatEnvName, 'json')
+
+    @staticmethod
+    def __createFromContents(contents):
+        """
+        Create a crawler based on the contents (vars, contextVarNames and tags).
+        """
         crawlerType = contents["vars"]["type"]
         fullPath = contents["vars"]["fullPath"]
 
@@ -338,8 +622,9 @@ class Crawler(object):
         crawler = Crawler.__registeredTypes[crawlerType](fullPath)
 
         # setting vars
+        contextVarNames = set(contents["contextVarNames"])
         for varName, varValue in contents["vars"].items():
-            isContextVar = (varName in contents["contextVarNames"])
+            isContextVar = (varName in contextVarNames)
             crawler.setVar(varName, varValue, isContextVar)
 
         # setting tags
@@ -358,24 +643,47 @@ class Crawler(object):
         sorted alphabetically using the path by default. If you want to do a custom
         sorting, take a look at: Crawler.sortGroup
         """
-        groupedCrawlers = OrderedDict()
+        return list(Crawler.iterGroup(crawlers, tag))
+
+    @staticmethod
+    def iterGroup(crawlers, tag='group'):
+        """
+        Return a generator that yields the crawlers grouped by the input tag.
+
+        Same result as group (CrawlerGroup lists), however the groups are only
+        created as they are consumed. The group and path of each crawler are
+        queried once and all groups are sorted together in a single pass.
+        """
+        groupIndexes = {}
+        groupedKeys = []
         uniqueCrawlers = []
         for crawler in crawlers:
-            if tag in crawler.tagNames():
-                groupName = crawler.tag(tag)
-                if groupName not in groupedCrawlers:
-                    groupedCrawlers[groupName] = []
-                groupedCrawlers[groupName].append(crawler)
+            tags = crawler.__tags
+            if tags is not None and tag in tags:
+                groupIndex = groupIndexes.setdefault(tags[tag], len(groupIndexes))
+                groupedKeys.append(
+                    (groupIndex, crawler.var('fullPath'), len(groupedKeys), crawler)
+                )
             else:
-                uniqueCrawlers.append([crawler])
+                uniqueCrawlers.append(crawler)
 
-        # sorting crawlers
-        groupedSorted = Crawler.sortGroup(
-            groupedCrawlers.values(),
-            key=lambda x: x.var('fullPath')
-        )
+        # the position in the key avoids comparing the crawlers when the
+        # paths are the same (keeping their original order)
+        groupedKeys.sort()
+
+        start = 0
+        total = len(groupedKeys)
+        while start < total:
+            groupIndex = groupedKeys[start][0]
+            end = start + 1
+            while end < total and groupedKeys[end][0] == groupIndex:
+                end += 1
+
+            yield CrawlerGroup(groupedKeys[x][3] for x in range(start, end))
+            start = end
 
-        return groupedSorted + uniqueCrawlers
+        for crawler in uniqueCrawlers:
+            yield CrawlerGroup([crawler])
 
     @staticmethod
     def sortGroup(crawlers, key=None, reverse=False):
@@ -387,21 +695,261 @@ class Crawler(object):
             result.append(list(sorted(group, key=key, reverse=reverse)))
         return result
 
+    def __contents(self):
+        """
+        Return a dict containing the vars, context var names and tags of the crawler.
+        """
+        crawlerContents = {
+            "vars": {},
+            "contextVarNames": [],
+            "tags": {}
+        }
+
+        for varName in self.varNames():
+            crawlerContents['vars'][varName] = self.var(varName)
+
+        for varName in self.contextVarNames():
+            crawlerContents['contextVarNames'].append(varName)
+
+        for tagName in self.tagNames():
+            crawlerContents['tags'][tagName] = self.tag(tagName)
+
+        return crawlerContents
+
+    def __shareVars(self):
+        """
+        Return the read-only chain of variable layers passed to the children.
+
+        A layer is represented by a tuple (vars, contextVars, parentLayer).
+        """
+        if not self.__vars and not self.__contextVars:
+            return self.__inheritedVars
+
+        if self.__sharedVars is None:
+            self.__sharedVars = (self.__vars, self.__contextVars, self.__inheritedVars)
+
+        return self.__sharedVars
+
+    def __mergedLayers(self, index):
+        """
+        Return a dict merging the contents of all variable layers (vars: 0, contextVars: 1).
+        """
+        layers = [(self.__vars, self.__contextVars)]
+        layer = self.__inheritedVars
+        while layer is not None:
+            layers.append(layer)
+            layer = layer[2]
+
+        result = {}
+        for layer in reversed(layers):
+            result.update(layer[index])
+
+        return result
+
+    def __isInheritedContextVar(self, name):
+        """
+        Return a boolean telling if the var is a context var inherited from the parent crawlers.
+        """
+        layer = self.__inheritedVars
+        while layer is not None:
+            if name in layer[1]:
+                return layer[1][name]
+            layer = layer[2]
+
+        return False
+
+    @staticmethod
+    def __dispatchTypes(data):
+        """
+        Return the registered names that need to be tested for the data (in test order).
+
+        For path holders the result is looked up in the dispatch index by
+        extension and directory flag, skipping the types which the
+        static selectors (testExtensions, testIsDirectory) rule out.
+        """
+        if isinstance(data, PathHolder):
+            key = (data.ext(), data.isDirectory())
+        else:
+            key = None
+
+        result = Crawler.__dispatchIndex.get(key)
+        if result is None:
+            result = []
+            for registeredName in reversed(Crawler.__registeredTypes.keys()):
+                crawlerTypeClass = Crawler.__registeredTypes[registeredName]
+
+                if key is not None:
+                    if crawlerTypeClass.testIsDirectory not in (None, key[1]):
+                        continue
+
+                    if crawlerTypeClass.testExtensions is not None and key[0] not in crawlerTypeClass.testExtensions:
+                        continue
+
+                result.append(registeredName)
+
+            result = tuple(result)
+            Crawler.__dispatchIndex[key] = result
+
+        return result
+
     @staticmethod
-    def __collectCrawlers(crawler):
+    def createFilter(filterTypes):
         """
-        Recursively collect crawlers.
+        Return a callable telling if Crawler.create can produce any of the filter types for the data.
+
+        The callable is based on the static selectors of the registered types
+        (testExtensions, testIsDirectory), therefore it can reject a path
+        holder without testing the crawler types.
         """
-        if crawler.isLeaf():
-            return []
+        subClasses = Crawler.__filterClasses(filterTypes)
+        results = {}
 
+        def createFilter(data):
+            dispatchTypes = Crawler.__dispatchTypes(data)
+            result = results.get(dispatchTypes)
+            if result is None:
+                result = any(
+                    issubclass(Crawler.__registeredTypes[x], subClasses) for x in dispatchTypes
+                )
+                results[dispatchTypes] = result
+            return result
+
+        return createFilter
+
+    @staticmethod
+    def __pruneCrawlers(rootPath, crawlers, maxDepth, excludeFilter, descendFilter):
+        """
+        Return the crawlers (in depth-first order) accepted by the pruning options.
+        """
         result = []
-        for childCrawler in crawler.children():
-            result.append(childCrawler)
-            result += Crawler.__collectCrawlers(childCrawler)
+        skipPrefix = None
+        rootDepth = rootPath.rstrip('/').count('/')
+        for crawler in crawlers:
+            fullPath = crawler.var('fullPath')
+
+            # skipping everything under a pruned crawler
+            if skipPrefix is not None:
+                if fullPath.startswith(skipPrefix):
+                    continue
+                skipPrefix = None
+
+            depth = fullPath.rstrip('/').count('/') - rootDepth
+
+            if maxDepth is not None and depth > maxDepth:
+                continue
+
+            if not crawler.isLeaf():
+                if excludeFilter is not None and excludeFilter(crawler):
+                    skipPrefix = fullPath.rstrip('/') + '/'
+                    continue
+
+                if (maxDepth is not None and depth == maxDepth) or \
+                        (descendFilter is not None and not descendFilter(crawler)):
+                    skipPrefix = fullPath.rstrip('/') + '/'
+
+            result.append(crawler)
 
         return result
 
+    @staticmethod
+    def __excludeDirsFilter(excludeDirs):
+        """
+        Return a callable telling if a non-leaf crawler is excluded (None when there is nothing to exclude).
+        """
+        if not excludeDirs:
+            return None
+
+        matchPath = Crawler.__pathPatternsMatcher(excludeDirs)
+        return lambda crawler: not crawler.isLeaf() and matchPath(crawler.var('fullPath'))
+
+    @staticmethod
+    def __descendFilter(descendFilter):
+        """
+        Return the descend filter as a callable (it can be defined as a list of glob patterns).
+        """
+        if descendFilter is None or callable(descendFilter):
+            return descendFilter
+
+        matchPath = Crawler.__pathPatternsMatcher(descendFilter)
+        return lambda crawler: matchPath(crawler.var('fullPath'))
+
+    @staticmethod
+    def __walkDescendFilter(excludeFilter, descendFilter):
+        """
+        Return the descend filter used by the walker (combining the exclusion).
+        """
+        if excludeFilter is None:
+            return descendFilter
+
+        if descendFilter is None:
+            return lambda crawler: not excludeFilter(crawler)
+
+        return lambda crawler: not excludeFilter(crawler) and descendFilter(crawler)
+
+    @staticmethod
+    def __walkDataFilter(excludeDirs, filterTypes):
+        """
+        Return the data filter used by the walker to avoid creating crawlers (or None).
+        """
+        if not excludeDirs and not filterTypes:
+            return None
+
+        matchPath = Crawler.__pathPatternsMatcher(excludeDirs) if excludeDirs else None
+        createFilter = Crawler.createFilter(filterTypes) if filterTypes else None
+
+        def dataFilter(data):
+            if not isinstance(data, PathHolder):
+                return True
+
+            # directories are always created (unless excluded), since
+            # the crawlers under them may match the filter types
+            if data.isDirectory():
+                return matchPath is None or not matchPath(data.path())
+
+            return createFilter is None or createFilter(data)
+
+        return dataFilter
+
+    @staticmethod
+    def __pathPatternsMatcher(patterns):
+        """
+        Return a callable telling if a path matches any of the glob patterns.
+
+        Patterns containing "/" are matched against the full path, otherwise
+        against the base name.
+        """
+        if isinstance(patterns, basestring):
+            patterns = [patterns]
+
+        fullPathPatterns = tuple(filter(lambda x: '/' in x, patterns))
+        namePatterns = tuple(filter(lambda x: '/' not in x, patterns))
+
+        def matchPath(path):
+            path = path.rstrip('/')
+            name = os.path.basename(path)
+            for pattern in namePatterns:
+                if fnmatch.fnmatch(name, pattern):
+                    return True
+
+            for pattern in fullPathPatterns:
+                if fnmatch.fnmatch(path, pattern):
+                    return True
+
+            return False
+
+        return matchPath
+
+    @staticmethod
+    def __filterClasses(filterTypes):
+        """
+        Return a tuple containing the registered subclasses for the filter types.
+        """
+        result = set()
+        for filterType in filterTypes:
+            result.update(Crawler.registeredSubclasses(filterType))
+
+        return tuple(result)
+
     @staticmethod
     def __baseClass(baseClassOrTypeName):
         """
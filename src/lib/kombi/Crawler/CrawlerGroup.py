@@ -0,0 +1,41 @@
+class CrawlerGroup(list):
+    """
+    List of crawlers returned by Crawler.group.
+
+    Besides the list interface (so it can be passed directly to task holders
+    and dispatchers), it provides the frame range about the crawlers in the group.
+    """
+
+    __slots__ = ('__frameRange',)
+
+    def __init__(self, *args, **kwargs):
+        """
+        Create a crawler group.
+        """
+        super(CrawlerGroup, self).__init__(*args, **kwargs)
+
+        self.__frameRange = None
+
+    def frameRange(self):
+        """
+        Return a tuple (firstFrame, lastFrame) about the crawlers in the group.
+
+        Image sequence crawlers provide the range through the firstFrame
+        and lastFrame vars, otherwise it is computed from the frame var of
+        the crawlers. It returns None when the crawlers are not frames of a
+        sequence. The range is computed once (the group should not be modified
+        after querying it).
+        """
+        if self.__frameRange is None and self:
+            firstCrawler = self[0]
+            if firstCrawler.hasVar('firstFrame') and firstCrawler.hasVar('lastFrame'):
+                self.__frameRange = (firstCrawler.var('firstFrame'), firstCrawler.var('lastFrame'))
+
+            elif firstCrawler.hasVar('frame'):
+                frames = [x.var('frame') for x in self if x.hasVar('frame')]
+                self.__frameRange = (min(frames), max(frames))
+
+            else:
+                self.__frameRange = ()
+
+        return self.__frameRange or None
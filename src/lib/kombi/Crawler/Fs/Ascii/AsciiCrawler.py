@@ -1,3 +1,5 @@
+import mmap
+from contextlib import contextmanager
 from ..FileCrawler import FileCrawler
 
 class AsciiCrawler(FileCrawler):
@@ -5,12 +7,17 @@ class AsciiCrawler(FileCrawler):
     Abstracted ascii crawler.
     """
 
+    __slots__ = ('__parsedContents',)
+
     def __init__(self, *args, **kwargs):
         """
         Create a ascii crawler.
         """
         super(AsciiCrawler, self).__init__(*args, **kwargs)
-        self.__parsedContents = None
+
+        # the parsed contents are stored in a list shared by
+        # the clones, so they are only parsed once
+        self.__parsedContents = []
 
         self.setVar('category', 'ascii')
 
@@ -26,8 +33,43 @@ class AsciiCrawler(FileCrawler):
     def contents(self):
         """
         Return the parsed contents.
+
+        The contents are shared with the clones of the crawler (they
+        should not be modified in place).
         """
         if not self.__parsedContents:
-            self.__parsedContents = self._runParser()
+            self.__parsedContents.append(self._runParser())
+
+        return self.__parsedContents[0]
+
+    def isParsed(self):
+        """
+        Return a boolean telling if the contents have been parsed already.
+        """
+        return bool(self.__parsedContents)
+
+    def iterLines(self):
+        """
+        Return a generator that yields the lines of the file (without reading the whole file).
+        """
+        with open(self.var('filePath'), 'r') as f:
+            for line in f:
+                yield line
+
+    @contextmanager
+    def mappedContents(self):
+        """
+        Return a context manager providing read-only access to the bytes of the file (memory-mapped).
+        """
+        with open(self.var('filePath'), 'rb') as f:
+            # empty files cannot be mapped
+            try:
+                mappedFile = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                yield b''
+                return
 
-        return self.__parsedContents
+            try:
+                yield mappedFile
+            finally:
+                mappedFile.close()
@@ -1,11 +1,94 @@
+import re
 import json
 from .AsciiCrawler import AsciiCrawler
 
 class JsonCrawler(AsciiCrawler):
     """
     Json crawler.
+
+    Besides parsing the whole document (contents), the members of a json object
+    can be queried one by one (queryKeys, iterItems), so only a single value is
+    materialized at the time instead of the whole document (the text of the
+    file is still read at once).
     """
 
+    __slots__ = ()
+
+    testExtensions = ('json',)
+
+    __decoder = json.JSONDecoder()
+    __whitespaceRegex = re.compile(r'[ \t\n\r]*')
+
+    def queryKeys(self, keys):
+        """
+        Return a dict containing the values for the top level keys of the json object.
+
+        The keys that are not found are not included in the result. The values
+        of the other keys are discarded right away. The whole object is scanned,
+        since a duplicated key resolves to its last value (same as contents).
+        """
+        keys = set(keys)
+        if self.isParsed():
+            contents = self.contents()
+            return dict((x, contents[x]) for x in keys if x in contents)
+
+        result = {}
+        if not keys:
+            return result
+
+        for key, value in self.iterItems():
+            if key in keys:
+                result[key] = value
+
+        return result
+
+    def iterItems(self):
+        """
+        Return a generator that yields a tuple (key, value) for the members of the json object.
+
+        Differently from contents, the values are parsed one by one (and
+        they are not cached), avoiding to materialize big documents. The text
+        of the file is read at once, since the json decoder only works over
+        strings, therefore the memory used by the text itself is not saved.
+        Duplicated keys are yielded as many times as they show up in the file.
+        """
+        if self.isParsed():
+            for item in self.contents().items():
+                yield item
+            return
+
+        with open(self.var('filePath')) as f:
+            text = f.read()
+
+        index = self.__skipWhitespace(text, 0)
+        if text[index:index + 1] != '{':
+            raise ValueError('Expecting a json object at position {}'.format(index))
+
+        index = self.__skipWhitespace(text, index + 1)
+        if text[index:index + 1] == '}':
+            return
+
+        while True:
+            if text[index:index + 1] != '"':
+                raise ValueError('Expecting a key at position {}'.format(index))
+            key, index = self.__decoder.raw_decode(text, index)
+
+            index = self.__skipWhitespace(text, index)
+            if text[index:index + 1] != ':':
+                raise ValueError('Expecting ":" at position {}'.format(index))
+
+            value, index = self.__decoder.raw_decode(text, self.__skipWhitespace(text, index + 1))
+            yield (key, value)
+
+            index = self.__skipWhitespace(text, index)
+            separator = text[index:index + 1]
+            if separator == '}':
+                return
+            elif separator != ',':
+                raise ValueError('Expecting "," or "}}" at position {}'.format(index))
+
+            index = self.__skipWhitespace(text, index + 1)
+
     def _runParser(self):
         """
         Parse the json contents.
@@ -23,6 +106,13 @@ class JsonCrawler(AsciiCrawler):
 
         return pathHolder.ext() in ['json']
 
+    @classmethod
+    def __skipWhitespace(cls, text, index):
+        """
+        Return the position of the next non-whitespace character.
+        """
+        return cls.__whitespaceRegex.match(text, index).end()
+
 
 # registration
 JsonCrawler.register(
@@ -5,6 +5,10 @@ class TxtCrawler(AsciiCrawler):
     Txt crawler.
     """
 
+    __slots__ = ()
+
+    testExtensions = ('txt',)
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
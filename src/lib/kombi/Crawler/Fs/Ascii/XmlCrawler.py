@@ -1,18 +1,27 @@
+import threading
 import xml.etree.ElementTree as ElementTree
+from collections import OrderedDict
 from .AsciiCrawler import AsciiCrawler
 
 class XmlCrawler(AsciiCrawler):
     """
     Xml crawler.
+
+    The tags are queried by streaming the file (iterparse), which stops as soon
+    as the requested tags are found. The tags found are stored in a cache shared
+    by all crawlers of the process (keyed by the path and modification time of
+    the file), so clones and deserialized crawlers don't parse the file again.
     """
 
-    def __init__(self, *args, **kwargs):
-        """
-        Constructor.
-        """
-        super(XmlCrawler, self).__init__(*args, **kwargs)
+    __slots__ = ()
 
-        self.__cache = {}
+    testExtensions = ('xml',)
+
+    # maximum number of files kept by the shared cache
+    __maxCachedFiles = 1024
+
+    __cache = OrderedDict()
+    __cacheLock = threading.Lock()
 
     def queryTag(self, tag, ignoreNameSpace=True):
         """
@@ -23,7 +32,52 @@ class XmlCrawler(AsciiCrawler):
         :param ignoreNameSpace: Flag to ignore the xml namespace
         :type ignoreNameSpace: boolean
         """
-        return self.__runQueryTag(tag, ignoreNameSpace)
+        return self.queryTags([tag], ignoreNameSpace)[tag]
+
+    def queryTags(self, tags, ignoreNameSpace=True):
+        """
+        Query the values that are related to the specified tags in a single pass.
+
+        Returns a dict where the key is the tag and the value is a tuple
+        (text, attributes) about the first element found for the tag.
+
+        :param tags: The tags to search over the xml
+        :type tags: list
+        :param ignoreNameSpace: Flag to ignore the xml namespace
+        :type ignoreNameSpace: boolean
+        """
+        filePath = self.var('filePath')
+        cacheKey = (filePath, self.pathHolder().mtimeNs(), ignoreNameSpace)
+
+        with self.__cacheLock:
+            cached = self.__cache.get(cacheKey)
+            if cached is not None:
+                self.__cache[cacheKey] = self.__cache.pop(cacheKey)
+
+        # parsing the file when a tag is not cached yet
+        if cached is None or not (cached[1] or all(tag in cached[0] for tag in tags)):
+            foundTags, complete = self.__parseTags(filePath, tags, ignoreNameSpace)
+
+            # keeping the tags found by previous queries about the same file
+            if cached is not None:
+                mergedTags = dict(cached[0])
+                mergedTags.update(foundTags)
+                foundTags = mergedTags
+            cached = (foundTags, complete)
+
+            with self.__cacheLock:
+                self.__cache.pop(cacheKey, None)
+                self.__cache[cacheKey] = cached
+                while len(self.__cache) > self.__maxCachedFiles:
+                    self.__cache.popitem(last=False)
+
+        result = {}
+        for tag in tags:
+            if tag not in cached[0]:
+                raise ValueError('No tag with the name "{}" was found'.format(tag))
+            result[tag] = cached[0][tag]
+
+        return result
 
     @classmethod
     def test(cls, pathHolder, parentCrawler, ignoreExt=False):
@@ -35,39 +89,44 @@ class XmlCrawler(AsciiCrawler):
 
         return ignoreExt or pathHolder.ext() == 'xml'
 
-    def __runQueryTag(self, tag, ignoreNameSpace, root=None):
+    @staticmethod
+    def __parseTags(filePath, tags, ignoreNameSpace):
         """
-        Run the recursion on the xml tree.
+        Stream the xml file until the tags are found.
 
-        :param tag: The tag to search over the xml
-        :type tag: str
-        :param ignoreNameSpace: Flag to ignore the xml namespace
-        :type ignoreNameSpace: boolean
-        :param root: A element tree from the xml
-        :type root: xml.etree.ElementTree
+        Returns a tuple (foundTags, complete) where foundTags is a dict containing
+        the first element (in document order) found for all tags visited by the
+        parsing and complete tells if the whole file has been parsed.
         """
-        firstCall = False
-
-        if root is None:
-            firstCall = True
-            filePath = self.var('filePath')
-
-            if filePath not in self.__cache:
-                self.__cache[filePath] = ElementTree.parse(filePath).getroot()
-            root = self.__cache[filePath]
-
-        xmlTag = root.tag.split('}')[-1] if ignoreNameSpace else root.tag
-        if tag == xmlTag:
-            return (root.text, root.attrib)
-
-        children = list(root)
-        for child in children:
-            result = self.__runQueryTag(tag, ignoreNameSpace, child)
-            if result:
-                return result
-
-        if firstCall:
-            raise ValueError('No tag with the name "{}" was found'.format(tag))
+        pendingTags = set(tags)
+        foundTags = {}
+        startedElement = None
+        complete = True
+
+        with open(filePath, 'rb') as xmlFile:
+            for event, element in ElementTree.iterparse(xmlFile, events=('start', 'end')):
+
+                # the text of an element (before its first child) is only complete
+                # when the parser moves to the next event, therefore container
+                # elements are resolved without waiting for their end
+                if startedElement is not None:
+                    foundTags[startedElement[0]] = (startedElement[1].text, startedElement[1].attrib)
+                    pendingTags.discard(startedElement[0])
+                    startedElement = None
+
+                    if not pendingTags:
+                        complete = False
+                        break
+
+                if event != 'start':
+                    continue
+
+                # only the first element (in document order) is used for a tag
+                xmlTag = element.tag.split('}')[-1] if ignoreNameSpace else element.tag
+                if xmlTag not in foundTags:
+                    startedElement = (xmlTag, element)
+
+        return (foundTags, complete)
 
 
 # registration
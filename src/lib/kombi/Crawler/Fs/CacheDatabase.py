@@ -0,0 +1,73 @@
+import os
+import sqlite3
+
+class CacheDatabase(object):
+    """
+    SQLite database used by the persistent caches (crawl index and media cache).
+
+    The connection is created on demand (creating the cache directory when
+    needed) in WAL mode, so readers are not blocked by writers. The statements
+    about the schema are executed when the connection is created. The callers
+    are responsible for serializing the access to the connection (it is not
+    bound to the thread that created it).
+    """
+
+    def __init__(self, filePath, schema, timeout=5.0):
+        """
+        Create a cache database (the file is only created when the connection is requested).
+
+        The schema is a list of statements (for instance "CREATE TABLE IF NOT
+        EXISTS ...") and the timeout is the number of seconds that concurrent
+        writers wait for each other.
+        """
+        self.__filePath = filePath
+        self.__schema = list(schema)
+        self.__timeout = timeout
+        self.__connection = None
+        self.__connectionPid = None
+
+    def filePath(self):
+        """
+        Return the path of the database file.
+        """
+        return self.__filePath
+
+    def connection(self):
+        """
+        Return the connection with the database (created on demand).
+        """
+        # connections can't be shared with forked processes
+        if self.__connection is not None and self.__connectionPid != os.getpid():
+            self.__connection = None
+
+        if self.__connection is None:
+            directory = os.path.dirname(self.__filePath)
+            if directory and not os.path.exists(directory):
+                try:
+                    os.makedirs(directory)
+                except OSError:
+                    pass
+
+            connection = sqlite3.connect(
+                self.__filePath,
+                timeout=self.__timeout,
+                check_same_thread=False
+            )
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            for statement in self.__schema:
+                connection.execute(statement)
+            connection.commit()
+
+            self.__connection = connection
+            self.__connectionPid = os.getpid()
+
+        return self.__connection
+
+    def close(self):
+        """
+        Close the connection with the database (it is opened again when requested).
+        """
+        if self.__connection is not None:
+            self.__connection.close()
+            self.__connection = None
@@ -0,0 +1,177 @@
+import os
+import json
+import hashlib
+import threading
+from ..Crawler import Crawler, CrawlerError, CrawlerTypeError
+from ..PathHolder import PathHolder
+from .CacheDatabase import CacheDatabase
+
+class CrawlIndexError(CrawlerError):
+    """Crawl Index Error."""
+
+class CrawlIndex(object):
+    """
+    Persistent index used to avoid re-crawling directories that have not changed.
+
+    The index stores the listing of each directory (the name, crawler type and
+    whether the entry is a directory) in a SQLite database located under the
+    cache directory. The entries are invalidated by the directory stat
+    information (mtime, ctime, inode and device), therefore re-crawling an
+    unchanged directory costs a single stat call instead of a full listing
+    plus testing the crawler types for each entry.
+
+    The listing is also invalidated when the registered crawler types change
+    (for instance, when a configuration defines different inline crawlers).
+
+    The crawler vars are not stored in the index, since they are inherited
+    from the parent crawler (they depend on where the crawl started). The
+    crawlers are created through their own constructors using the
+    indexed type.
+    """
+
+    __cacheDirectoryEnvName = 'KOMBI_CRAWL_INDEX_DIR'
+    __databaseName = 'crawlIndex.sqlite3'
+
+    def __init__(self, cacheDirectory=None):
+        """
+        Create a crawl index (by default under $KOMBI_CRAWL_INDEX_DIR).
+        """
+        if cacheDirectory is None:
+            cacheDirectory = self.defaultCacheDirectory()
+
+        if not cacheDirectory:
+            raise CrawlIndexError(
+                'Cache directory is not defined (${})!'.format(
+                    self.__cacheDirectoryEnvName
+                )
+            )
+
+        self.__cacheDirectory = cacheDirectory
+        self.__lock = threading.Lock()
+        self.__database = CacheDatabase(
+            os.path.join(cacheDirectory, self.__databaseName),
+            (
+                'CREATE TABLE IF NOT EXISTS directory ('
+                'path TEXT PRIMARY KEY, stat TEXT, registry TEXT, entries TEXT)',
+            )
+        )
+
+    def cacheDirectory(self):
+        """
+        Return the directory where the index database is stored.
+        """
+        return self.__cacheDirectory
+
+    def children(self, directoryCrawler, computeChildren):
+        """
+        Return the children for the directory crawler.
+
+        The children are created from the index when the directory has not
+        changed, otherwise they are computed by calling "computeChildren" and
+        the result is stored in the index.
+        """
+        path = directoryCrawler.pathHolder().path()
+        statSignature = self.__statSignature(path)
+        registrySignature = self.registrySignature()
+
+        with self.__lock:
+            row = self.__database.connection().execute(
+                'SELECT stat, registry, entries FROM directory WHERE path = ?',
+                (path,)
+            ).fetchone()
+
+        if row is not None and row[0] == statSignature and row[1] == registrySignature:
+            return self.__createChildren(directoryCrawler, json.loads(row[2]))
+
+        result = computeChildren()
+        entries = []
+        for childCrawler in result:
+            entries.append([
+                childCrawler.pathHolder().baseName(),
+                childCrawler.var('type'),
+                childCrawler.pathHolder().isDirectory()
+            ])
+
+        with self.__lock:
+            database = self.__database.connection()
+            database.execute(
+                'INSERT OR REPLACE INTO directory (path, stat, registry, entries) VALUES (?, ?, ?, ?)',
+                (path, statSignature, registrySignature, json.dumps(entries))
+            )
+            database.commit()
+
+        return result
+
+    def close(self):
+        """
+        Close the connection with the index database.
+        """
+        with self.__lock:
+            self.__database.close()
+
+    def __reduce__(self):
+        """
+        Pickle the index through its cache directory (used by the walks sharded across processes).
+        """
+        return (CrawlIndex, (self.__cacheDirectory,))
+
+    @classmethod
+    def defaultCacheDirectory(cls):
+        """
+        Return the default cache directory (KOMBI_CRAWL_INDEX_DIR) or an empty string.
+        """
+        return os.environ.get(cls.__cacheDirectoryEnvName, '')
+
+    @staticmethod
+    def registrySignature():
+        """
+        Return a signature about the crawler types currently registered.
+        """
+        signature = hashlib.md5()
+        for registeredName in Crawler.registeredNames():
+            crawlerClass = Crawler.registeredType(registeredName)
+            signature.update(
+                '{}:{}.{}:{};'.format(
+                    registeredName,
+                    crawlerClass.__module__,
+                    crawlerClass.__name__,
+                    getattr(crawlerClass, 'namePattern', '')
+                ).encode('utf-8')
+            )
+
+        return signature.hexdigest()
+
+    @staticmethod
+    def __createChildren(directoryCrawler, entries):
+        """
+        Return the children crawlers created from the indexed entries.
+        """
+        result = []
+        path = directoryCrawler.pathHolder().path()
+        for name, crawlerType, isDirectory in entries:
+            pathHolder = PathHolder(os.path.join(path, name), isDirectory)
+            try:
+                childCrawler = Crawler.registeredType(crawlerType)(pathHolder, directoryCrawler)
+            except Exception as err:
+                raise CrawlerTypeError(
+                    'Error on creating an indexed crawler "{}" for "{}"\n{}'.format(
+                        crawlerType,
+                        pathHolder.path(),
+                        str(err)
+                    )
+                )
+            childCrawler.setVar('type', crawlerType)
+            result.append(childCrawler)
+
+        return result
+
+    @staticmethod
+    def __statSignature(path):
+        """
+        Return a signature about the stat information of the path.
+        """
+        stat = os.stat(path)
+        mtime = getattr(stat, 'st_mtime_ns', int(stat.st_mtime * 1e9))
+        ctime = getattr(stat, 'st_ctime_ns', int(stat.st_ctime * 1e9))
+
+        return '{}:{}:{}:{}'.format(mtime, ctime, stat.st_ino, stat.st_dev)
@@ -0,0 +1,193 @@
+import os
+import json
+import zlib
+import struct
+import hashlib
+from ..Crawler import CrawlerError
+from ..BatchSerializer import BatchSerializer, BatchSerializerFormatError
+from .FsCrawler import FsCrawler
+
+class CrawlSnapshotError(CrawlerError):
+    """Crawl Snapshot Error."""
+
+class CrawlSnapshotFormatError(CrawlSnapshotError):
+    """Crawl Snapshot Format Error."""
+
+class CrawlSnapshot(object):
+    """
+    Snapshot about the result of a crawl, used to find what changed between two crawls.
+
+    Each crawler is stored by its full path, its type and a digest computed
+    from its vars plus the size and modification time of the file. The vars
+    computed on demand (Crawler.lazyVarNames) are not included, so the digest
+    does not depend on which of them have been queried. The digest of directory
+    crawlers ignores their stat information, since adding or removing a file
+    changes the directory mtime (the changes are reported by the children).
+
+    Comparing two snapshots (diff) is a single pass over the entries. The
+    snapshots are saved using the binary batch format (BatchSerializer), where
+    each entry is a record containing the full path, the type and the digest.
+    The crawler vars are not stored, and the string table of the batch format
+    stores each directory once, so each path costs just its base name.
+    """
+
+    # number of bytes kept from the digest of each entry (stored as an integer)
+    __digestSize = 8
+    __digestStruct = struct.Struct('<Q')
+
+    def __init__(self, entries=None):
+        """
+        Create a snapshot (use CrawlSnapshot.create or CrawlSnapshot.load instead).
+
+        The entries are a dict where the key is the full path and the value
+        is a tuple (crawlerType, digest).
+        """
+        self.__entries = entries if entries is not None else {}
+
+    def __len__(self):
+        """
+        Return the number of entries in the snapshot.
+        """
+        return len(self.__entries)
+
+    def __contains__(self, fullPath):
+        """
+        Return a boolean telling if the full path is part of the snapshot.
+        """
+        return fullPath in self.__entries
+
+    def paths(self):
+        """
+        Return a list containing the full paths in the snapshot.
+        """
+        return list(self.__entries.keys())
+
+    def crawlerType(self, fullPath):
+        """
+        Return the crawler type stored for the full path.
+        """
+        return self.__entries[fullPath][0]
+
+    def diff(self, previousSnapshot):
+        """
+        Return a tuple (added, removed, modified) comparing this snapshot against a previous one.
+
+        Each item is a list of full paths: added are the paths that are only
+        found in this snapshot, removed are the paths that are only found in
+        the previous snapshot and modified are the paths found in both with
+        a different type or digest.
+        """
+        assert isinstance(previousSnapshot, CrawlSnapshot), \
+            "Invalid CrawlSnapshot type!"
+
+        previousEntries = previousSnapshot.__entries
+        added = []
+        modified = []
+        for fullPath, entry in self.__entries.items():
+            previousEntry = previousEntries.get(fullPath)
+            if previousEntry is None:
+                added.append(fullPath)
+            elif previousEntry != entry:
+                modified.append(fullPath)
+
+        removed = [x for x in previousEntries if x not in self.__entries]
+
+        return (added, removed, modified)
+
+    def save(self, filePath):
+        """
+        Save the snapshot to a file (replaced atomically).
+        """
+        directory = os.path.dirname(filePath)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        temporaryFilePath = '{}.{}.tmp'.format(filePath, os.getpid())
+        with open(temporaryFilePath, 'wb') as f:
+            f.write(self.dump())
+
+        # os.rename does not replace an existing file on windows
+        if os.name == 'nt' and os.path.exists(filePath):
+            os.remove(filePath)
+        os.rename(temporaryFilePath, filePath)
+
+    def dump(self):
+        """
+        Return the binary data (bytes) about the snapshot.
+        """
+        contentsList = []
+        for fullPath, (crawlerType, digest) in self.__entries.items():
+            contentsList.append({
+                'vars': {
+                    'fullPath': fullPath,
+                    'type': crawlerType,
+                    'digest': self.__digestStruct.unpack(digest)[0]
+                },
+                'contextVarNames': [],
+                'tags': {}
+            })
+
+        return BatchSerializer.dump(contentsList)
+
+    @classmethod
+    def create(cls, crawlers):
+        """
+        Return a snapshot about the input crawlers.
+        """
+        entries = {}
+        for crawler in crawlers:
+            entries[crawler.var('fullPath')] = (crawler.var('type'), cls.digest(crawler))
+
+        return cls(entries)
+
+    @classmethod
+    def digest(cls, crawler):
+        """
+        Return the bytes used to detect the modifications of the crawler.
+        """
+        lazyVarNames = crawler.lazyVarNames()
+        varValues = dict(
+            (x, crawler.var(x)) for x in crawler.varNames() if x not in lazyVarNames
+        )
+
+        stat = None
+        if isinstance(crawler, FsCrawler) and not crawler.pathHolder().isDirectory():
+            pathHolder = crawler.pathHolder()
+            try:
+                stat = [pathHolder.size(), pathHolder.mtimeNs()]
+            except OSError:
+                pass
+
+        data = json.dumps([varValues, stat], sort_keys=True, default=repr)
+        return hashlib.md5(data.encode('utf-8')).digest()[:cls.__digestSize]
+
+    @classmethod
+    def load(cls, filePath):
+        """
+        Return a snapshot loaded from a file (an empty snapshot when the file does not exist).
+        """
+        if not os.path.exists(filePath):
+            return cls()
+
+        with open(filePath, 'rb') as f:
+            return cls.loads(f.read())
+
+    @classmethod
+    def loads(cls, data):
+        """
+        Return a snapshot from the binary data created by dump.
+        """
+        entries = {}
+        try:
+            for contents in BatchSerializer.load(data):
+                snapshotVars = contents['vars']
+                entries[snapshotVars['fullPath']] = (
+                    snapshotVars['type'],
+                    cls.__digestStruct.pack(snapshotVars['digest'])
+                )
+        except (BatchSerializerFormatError, zlib.error, IndexError, KeyError, struct.error) as err:
+            raise CrawlSnapshotFormatError(
+                'Data is not in the crawl snapshot format: {}'.format(err)
+            )
+
+        return cls(entries)
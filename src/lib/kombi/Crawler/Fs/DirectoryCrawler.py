@@ -3,11 +3,26 @@ import re
 from .FsCrawler import FsCrawler
 from .. import Crawler, PathHolder
 
+# python 2 does not provide scandir
+try:
+    from os import scandir
+except ImportError:
+    scandir = None
+
 class DirectoryCrawler(FsCrawler):
     """
     Directory crawler.
+
+    Symlinked directories are followed, however a directory pointing to one
+    of its ancestors (symlink loop) is listed without children. The ancestors
+    are identified by their device and inode, which are passed from each
+    directory to its sub directories (see isLoop).
     """
 
+    __slots__ = ('__crawlIndex', '__watcher', '__ancestorIds')
+
+    testIsDirectory = True
+
     # checking for digits as prefix separated by x or X and finishing with digits as suffix
     __resolutionRegex = r'^[0-9]+[x|X][0-9]+$'
     __ignoreWidth = 320
@@ -18,6 +33,12 @@ class DirectoryCrawler(FsCrawler):
         Create a directory crawler.
         """
         super(DirectoryCrawler, self).__init__(*args, **kwargs)
+        self.__crawlIndex = None
+        self.__watcher = None
+
+        # linked tuples (device, inode, parent) about the ancestor
+        # directories (assigned by the parent directory crawler)
+        self.__ancestorIds = None
 
         # in case the directory has a name "<width>x<height>" lets extract
         # this information and assign that to variables
@@ -36,6 +57,96 @@ class DirectoryCrawler(FsCrawler):
         """
         return False
 
+    def setCrawlIndex(self, crawlIndex):
+        """
+        Set a crawl index used to compute the children (also used by the sub directories).
+        """
+        self.__crawlIndex = crawlIndex
+
+    def crawlIndex(self):
+        """
+        Return the crawl index used to compute the children (None when not used).
+        """
+        return self.__crawlIndex
+
+    def isLoop(self):
+        """
+        Return a boolean telling if the directory points to one of its ancestors (symlink loop).
+        """
+        if self.__ancestorIds is None:
+            return False
+
+        device, inode = self.__identity()
+        ancestorIds = self.__ancestorIds
+        while ancestorIds is not None:
+            if ancestorIds[0] == device and ancestorIds[1] == inode:
+                return True
+            ancestorIds = ancestorIds[2]
+
+        return False
+
+    def watch(self):
+        """
+        Keep the glob result up to date by watching the changes under the directory (linux only).
+
+        The tree is crawled once, after that glob (using the cache) only applies
+        the files and directories that have been created, removed or renamed
+        since the previous call. Use unwatch to release the watcher.
+        """
+        if self.__watcher is None:
+            from .DirectoryWatcher import DirectoryWatcher
+            self.__watcher = DirectoryWatcher(self)
+            self._setGlobCache(None)
+
+    def unwatch(self):
+        """
+        Stop watching the changes under the directory.
+        """
+        if self.__watcher is not None:
+            self.__watcher.close()
+            self.__watcher = None
+
+    def isWatched(self):
+        """
+        Return a boolean telling if the directory is being watched.
+        """
+        return self.__watcher is not None
+
+    def glob(self, filterTypes=[], useCache=True, workers=None, maxDepth=None, excludeDirs=[], descendFilter=None, processes=None, skipDuplicates=False, collapseSequences=False):
+        """
+        Return a list of all crawlers found recursively under this path.
+
+        For watched directories the cached result is updated with the changes
+        found since the previous call (useCache=False crawls the whole tree again).
+        """
+        if self.__watcher is not None:
+            if not useCache:
+                self.__watcher.rescan()
+            self.__watcher.update()
+            self._setGlobCache(self.__watcher.crawlers())
+            useCache = True
+
+        return super(DirectoryCrawler, self).glob(
+            filterTypes,
+            useCache,
+            workers,
+            maxDepth,
+            excludeDirs,
+            descendFilter,
+            processes,
+            skipDuplicates,
+            collapseSequences
+        )
+
+    def clone(self):
+        """
+        Return a cloned instance about the current crawler (the clone is not watched).
+        """
+        result = super(DirectoryCrawler, self).clone()
+        result.__watcher = None
+
+        return result
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
@@ -47,12 +158,79 @@ class DirectoryCrawler(FsCrawler):
 
     def _computeChildren(self):
         """
-        Return the directory contents.
+        Return the directory contents (sorted by name).
+        """
+        if self.isLoop():
+            return []
+
+        if self.__crawlIndex is None:
+            return self._assignAncestors(self.__listChildren())
+
+        result = self.__crawlIndex.children(self, self.__listChildren)
+        for childCrawler in result:
+            if isinstance(childCrawler, DirectoryCrawler):
+                childCrawler.setCrawlIndex(self.__crawlIndex)
+
+        return self._assignAncestors(result)
+
+    def _computeFilteredChildren(self, dataFilter):
+        """
+        Return the directory contents accepted by the data filter (sorted by name).
+
+        The filter is ignored when using a crawl index (the index stores
+        the complete listing).
+        """
+        if self.__crawlIndex is not None or self.isLoop():
+            return self._computeChildren()
+
+        return self._assignAncestors(self.__listChildren(dataFilter))
+
+    def _assignAncestors(self, childCrawlers):
+        """
+        Pass the identity of the directory and its ancestors to the sub directories.
+
+        Used by the implementations that create the children of the directory
+        (for instance, the directory watcher).
+        """
+        ancestorIds = None
+        for childCrawler in childCrawlers:
+            if isinstance(childCrawler, DirectoryCrawler):
+                if ancestorIds is None:
+                    ancestorIds = self.__identity() + (self.__ancestorIds,)
+                childCrawler.__ancestorIds = ancestorIds
+
+        return childCrawlers
+
+    def __identity(self):
+        """
+        Return a tuple (device, inode) identifying the directory (symlinks are resolved).
+        """
+        return (self.pathHolder().device(), self.pathHolder().inode())
+
+    def __listChildren(self, dataFilter=None):
+        """
+        Return the crawlers for the contents of the directory (sorted by name).
         """
         result = []
         currentPath = self.pathHolder().path()
-        for childFile in os.listdir(currentPath):
-            childPathHolder = PathHolder(os.path.join(currentPath, childFile))
+
+        # scandir provides the file type information (d_type) as part
+        # of the listing, avoiding an extra stat call per entry
+        if scandir is not None:
+            childPathHolders = map(
+                PathHolder.fromDirEntry,
+                sorted(scandir(currentPath), key=lambda x: x.name)
+            )
+        else:
+            childPathHolders = map(
+                lambda x: PathHolder(os.path.join(currentPath, x)),
+                sorted(os.listdir(currentPath))
+            )
+
+        if dataFilter is not None:
+            childPathHolders = filter(dataFilter, childPathHolders)
+
+        for childPathHolder in childPathHolders:
             childCrawler = Crawler.create(childPathHolder, self)
             result.append(childCrawler)
 
@@ -0,0 +1,401 @@
+import os
+import sys
+import errno
+import struct
+import ctypes
+import ctypes.util
+from bisect import bisect_left
+from ..Crawler import Crawler, CrawlerError
+from ..PathHolder import PathHolder
+from .DirectoryCrawler import DirectoryCrawler
+
+class DirectoryWatcherError(CrawlerError):
+    """Directory Watcher Error."""
+
+class DirectoryWatcherUnsupportedError(DirectoryWatcherError):
+    """Directory Watcher Unsupported Error."""
+
+class DirectoryWatcher(object):
+    """
+    Keeps the crawlers found under a directory crawler up to date using inotify.
+
+    The watcher crawls the tree once (adding an inotify watch for each
+    directory before listing it) and then applies the create, delete and
+    rename events incrementally, so querying the crawlers after changes
+    costs O(changes) instead of re-crawling the whole tree. Renames are
+    applied as a removal followed by a creation. The crawlers of files are
+    created again once they are written (closed) or their attributes change,
+    since a file can be created before its contents are written. When the
+    kernel event queue overflows the tree is crawled again.
+
+    inotify returns the same watch for all paths resolving to the same
+    directory (for instance, a directory reached through a symlink), therefore
+    the events of a watch are applied to all of its paths and the watch is
+    only removed once none of them is used.
+
+    Linux only (inotify is used through ctypes). Changes done by other
+    hosts on network file systems are not reported by inotify.
+    """
+
+    # inotify flags (see <sys/inotify.h>)
+    __inAttrib = 0x00000004
+    __inCloseWrite = 0x00000008
+    __inMovedFrom = 0x00000040
+    __inMovedTo = 0x00000080
+    __inCreate = 0x00000100
+    __inDelete = 0x00000200
+    __inDeleteSelf = 0x00000400
+    __inMoveSelf = 0x00000800
+    __inQueueOverflow = 0x00004000
+    __inIgnored = 0x00008000
+    __inOnlyDir = 0x01000000
+    __inIsDir = 0x40000000
+    __watchMask = __inCreate | __inDelete | __inMovedFrom | __inMovedTo | \
+        __inCloseWrite | __inAttrib | __inDeleteSelf | __inMoveSelf | __inOnlyDir
+
+    __eventHeader = struct.Struct('iIII')
+    __readSize = 64 * 1024
+    __libc = None
+
+    def __init__(self, directoryCrawler):
+        """
+        Create a watcher for the directory crawler (it crawls the tree).
+        """
+        libc = self.__loadLibc()
+        if libc is None:
+            raise DirectoryWatcherUnsupportedError(
+                'Directory watcher requires inotify (linux)!'
+            )
+
+        fd = libc.inotify_init1(os.O_NONBLOCK | getattr(os, 'O_CLOEXEC', 0))
+        if fd < 0:
+            raise DirectoryWatcherError(
+                'Cannot initialize inotify: {}'.format(os.strerror(ctypes.get_errno()))
+            )
+
+        self.__fd = fd
+        self.__rootCrawler = directoryCrawler
+        self.__rootPath = directoryCrawler.pathHolder().path()
+        self.__watchPaths = {}
+        self.__watchDescriptors = {}
+        self.__directoryCrawlers = {}
+        self.__children = {}
+        self.__crawlers = None
+
+        self.rescan()
+
+    def directoryCrawler(self):
+        """
+        Return the directory crawler being watched.
+        """
+        return self.__rootCrawler
+
+    def crawlers(self):
+        """
+        Return a list of all crawlers found under the directory (same order used by glob).
+
+        The pending events are not applied, call update first.
+        """
+        if self.__crawlers is None:
+            result = []
+            stack = [iter(self.__children.get(id(self.__rootCrawler), []))]
+            while stack:
+                for childCrawler in stack[-1]:
+                    result.append(childCrawler)
+                    if id(childCrawler) in self.__children:
+                        stack.append(iter(self.__children[id(childCrawler)]))
+                        break
+                else:
+                    stack.pop()
+            self.__crawlers = result
+
+        return self.__crawlers
+
+    def update(self):
+        """
+        Apply the pending events, returns a boolean telling if the crawlers have changed.
+        """
+        events = self.__readEvents()
+        changed = False
+        for wd, mask, name in events:
+            if mask & self.__inQueueOverflow:
+                self.rescan()
+                return True
+
+            paths = self.__watchPaths.get(wd)
+            if paths is None:
+                continue
+
+            if mask & self.__inIgnored:
+                del self.__watchPaths[wd]
+                for path in paths:
+                    if self.__watchDescriptors.get(path) == wd:
+                        del self.__watchDescriptors[path]
+                continue
+
+            # the watched directory itself has been removed or renamed
+            if mask & (self.__inDeleteSelf | self.__inMoveSelf):
+                if self.__rootPath in paths:
+                    self.rescan()
+                    return True
+                continue
+
+            # events about the watched directory itself (for instance, attrib)
+            if not name:
+                continue
+
+            # the paths of the watch can change while the event is applied
+            for path in list(paths):
+                changed = self.__applyEvent(path, mask, name) or changed
+
+        if changed:
+            self.__crawlers = None
+
+        return changed
+
+    def rescan(self):
+        """
+        Crawl the whole tree again (the watches are recreated).
+        """
+        for wd in list(self.__watchPaths.keys()):
+            self.__loadLibc().inotify_rm_watch(self.__fd, wd)
+
+        self.__watchPaths = {}
+        self.__watchDescriptors = {}
+        self.__directoryCrawlers = {}
+        self.__children = {}
+        self.__crawlers = None
+
+        # discarding the events about the previous watches
+        self.__readEvents()
+
+        if os.path.isdir(self.__rootPath):
+            self.__watchTree(self.__rootCrawler)
+
+    def close(self):
+        """
+        Release the inotify resources used by the watcher.
+        """
+        if self.__fd is not None:
+            os.close(self.__fd)
+            self.__fd = None
+
+    @classmethod
+    def isSupported(cls):
+        """
+        Return a boolean telling if the directory watcher is supported by the platform.
+        """
+        return cls.__loadLibc() is not None
+
+    def __applyEvent(self, path, mask, name):
+        """
+        Apply an event about an entry of the watched directory, returns a boolean telling if the crawlers have changed.
+        """
+        # symlinks are not flagged as directories by inotify, therefore
+        # only the directory flag can be trusted
+        childPath = os.path.join(path, name)
+        isDirectory = True if mask & self.__inIsDir else None
+        if mask & (self.__inCreate | self.__inMovedTo):
+            self.__addPath(path, childPath, isDirectory)
+            return True
+
+        # the stat information of the file (cached by the path holder)
+        # and the vars computed from the contents are outdated
+        elif mask & (self.__inCloseWrite | self.__inAttrib):
+            if not isDirectory:
+                self.__addPath(path, childPath, isDirectory)
+                return True
+
+        elif mask & (self.__inDelete | self.__inMovedFrom):
+            return self.__removePath(path, childPath)
+
+        return False
+
+    def __watchTree(self, crawler):
+        """
+        Add the watches and compute the children for the crawler recursively.
+        """
+        stack = [crawler]
+        while stack:
+            currentCrawler = stack.pop()
+
+            # the watch is added before listing the directory, therefore
+            # entries created during the listing are not lost. Directories
+            # pointing to one of their ancestors are listed without children
+            if isinstance(currentCrawler, DirectoryCrawler):
+                if currentCrawler.isLoop():
+                    continue
+
+                path = currentCrawler.pathHolder().path()
+                if not self.__addWatch(path):
+                    continue
+                self.__directoryCrawlers[path] = currentCrawler
+
+            try:
+                children = list(currentCrawler.children())
+            except OSError:
+                continue
+
+            # keeping the children sorted by name (same order used by the crawl)
+            self.__children[id(currentCrawler)] = children
+            for childCrawler in children:
+                if not childCrawler.isLeaf():
+                    stack.append(childCrawler)
+
+    def __addPath(self, parentPath, childPath, isDirectory):
+        """
+        Create the crawler for a path created under a watched directory.
+
+        When isDirectory is None the path is queried (following symlinks).
+        """
+        parentCrawler = self.__directoryCrawlers.get(parentPath)
+        if parentCrawler is None:
+            return
+
+        # replacing an existing entry (for instance, renaming over a file)
+        self.__removePath(parentPath, childPath)
+
+        childCrawler = Crawler.create(PathHolder(childPath, isDirectory), parentCrawler)
+        if isinstance(childCrawler, DirectoryCrawler) and parentCrawler.crawlIndex() is not None:
+            childCrawler.setCrawlIndex(parentCrawler.crawlIndex())
+
+        # passing the ancestors used to detect symlink loops
+        parentCrawler._assignAncestors([childCrawler])
+
+        children = self.__children.setdefault(id(parentCrawler), [])
+        names = [x.pathHolder().baseName() for x in children]
+        children.insert(
+            bisect_left(names, childCrawler.pathHolder().baseName()),
+            childCrawler
+        )
+
+        if not childCrawler.isLeaf():
+            self.__watchTree(childCrawler)
+
+    def __removePath(self, parentPath, childPath):
+        """
+        Remove the crawler (and its descendants) for a path removed from a watched directory.
+        """
+        parentCrawler = self.__directoryCrawlers.get(parentPath)
+        if parentCrawler is None:
+            return False
+
+        children = self.__children.get(id(parentCrawler), [])
+        for index, childCrawler in enumerate(children):
+            if childCrawler.pathHolder().path() == childPath:
+                del children[index]
+                self.__forget(childCrawler)
+                return True
+
+        return False
+
+    def __forget(self, crawler):
+        """
+        Remove the children and watches about the crawler recursively.
+        """
+        stack = [crawler]
+        while stack:
+            currentCrawler = stack.pop()
+            stack.extend(self.__children.pop(id(currentCrawler), []))
+
+            if not isinstance(currentCrawler, DirectoryCrawler):
+                continue
+
+            path = currentCrawler.pathHolder().path()
+            if self.__directoryCrawlers.get(path) is currentCrawler:
+                del self.__directoryCrawlers[path]
+
+                wd = self.__watchDescriptors.pop(path, None)
+                if wd is None:
+                    continue
+
+                # the watch is only removed when none of its paths is used
+                paths = self.__watchPaths[wd]
+                paths.remove(path)
+                if not paths:
+                    del self.__watchPaths[wd]
+                    self.__loadLibc().inotify_rm_watch(self.__fd, wd)
+
+    def __addWatch(self, path):
+        """
+        Add a watch for the directory, returns a boolean telling if it has been added.
+        """
+        wd = self.__loadLibc().inotify_add_watch(
+            self.__fd,
+            self.__encodePath(path),
+            self.__watchMask
+        )
+
+        # the directory may have been removed in the meantime
+        if wd < 0:
+            return False
+
+        paths = self.__watchPaths.setdefault(wd, [])
+        if path not in paths:
+            paths.append(path)
+        self.__watchDescriptors[path] = wd
+
+        return True
+
+    def __readEvents(self):
+        """
+        Return a list of tuples (wd, mask, name) for the pending events (non-blocking).
+        """
+        result = []
+        while True:
+            try:
+                data = os.read(self.__fd, self.__readSize)
+            except OSError as err:
+                if err.errno in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    break
+                raise
+
+            offset = 0
+            while offset < len(data):
+                wd, mask, cookie, size = self.__eventHeader.unpack_from(data, offset)
+                offset += self.__eventHeader.size
+                name = data[offset:offset + size].rstrip(b'\0')
+                offset += size
+                result.append((wd, mask, self.__decodePath(name)))
+
+        return result
+
+    @classmethod
+    def __loadLibc(cls):
+        """
+        Return the libc library providing inotify (None when not available).
+        """
+        if cls.__libc is None:
+            cls.__libc = False
+            if sys.platform.startswith('linux'):
+                try:
+                    libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+                    libc.inotify_init1.argtypes = [ctypes.c_int]
+                    libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+                    libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+                except (OSError, AttributeError):
+                    pass
+                else:
+                    cls.__libc = libc
+
+        return cls.__libc or None
+
+    @staticmethod
+    def __encodePath(path):
+        """
+        Return the path as bytes.
+        """
+        if isinstance(path, bytes):
+            return path
+
+        return path.encode(sys.getfilesystemencoding() or 'utf-8')
+
+    @staticmethod
+    def __decodePath(name):
+        """
+        Return the name in the same string type used by the paths.
+        """
+        if str is bytes:
+            return name
+
+        return name.decode(sys.getfilesystemencoding() or 'utf-8', 'surrogateescape')
@@ -1,11 +1,16 @@
 from .FsCrawler import FsCrawler
 from ..Crawler import Crawler
+from .MediaCache import MediaCache
 
 class FileCrawler(FsCrawler):
     """
     File crawler.
     """
 
+    __slots__ = ()
+
+    testIsDirectory = False
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
@@ -15,6 +20,36 @@ class FileCrawler(FsCrawler):
             return False
         return pathHolder.isFile()
 
+    def _loadMediaVars(self, varNames):
+        """
+        Set the vars found in the media cache, return a boolean telling if the file is cached.
+
+        The media cache is only used when $KOMBI_MEDIA_CACHE_DIR is defined.
+        """
+        mediaCache = MediaCache.default()
+        if mediaCache is None:
+            return False
+
+        cachedVars = mediaCache.vars(self.pathHolder())
+        for varName, varValue in cachedVars.items():
+            if varName in varNames and not self.hasVar(varName):
+                self.setVar(varName, varValue)
+
+        return bool(cachedVars)
+
+    def _storeMediaVars(self, varNames):
+        """
+        Store the vars computed by probing the file in the media cache.
+        """
+        mediaCache = MediaCache.default()
+        if mediaCache is None:
+            return
+
+        mediaCache.setVars(
+            self.pathHolder(),
+            dict((x, self.var(x)) for x in varNames if self.hasVar(x))
+        )
+
 
 Crawler.register(
     'file',
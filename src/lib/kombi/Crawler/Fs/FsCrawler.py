@@ -1,5 +1,5 @@
 import os
-from .. import Crawler, PathHolder
+from .. import Crawler, CrawlerInvalidVarError, PathHolder
 
 # compatibility with python 2/3
 try:
@@ -12,7 +12,16 @@ class FsCrawler(Crawler):
     Abstracted file system Path.
     """
 
-    def __init__(self, filePathOrPathHolder, parentCrawler=None):
+    __slots__ = ('__pathHolder',)
+
+    # vars provided by the stat information of the path holder (they are
+    # computed on demand and not assigned, so the children don't inherit them)
+    __statVarNames = frozenset([
+        'inode',
+        'device'
+    ])
+
+    def __init__(self, filePathOrPathHolder, parentCrawler=None, testResult=None):
         """
         Create a crawler (use the factory function Path.create instead).
         """
@@ -21,7 +30,7 @@ class FsCrawler(Crawler):
         else:
             pathHolder = filePathOrPathHolder
 
-        super(FsCrawler, self).__init__(pathHolder.baseName(), parentCrawler)
+        super(FsCrawler, self).__init__(pathHolder.baseName(), parentCrawler, testResult)
 
         self.__setPathHolder(pathHolder)
         self.setVar('filePath', pathHolder.path())
@@ -29,7 +38,7 @@ class FsCrawler(Crawler):
         self.setVar('ext', pathHolder.ext())
         self.setVar('baseName', pathHolder.baseName())
         self.setVar('name', os.path.splitext(pathHolder.baseName())[0])
-        if 'sourceDirectory' not in self.varNames():
+        if not self.hasVar('sourceDirectory'):
             path = pathHolder.path()
             if not pathHolder.isDirectory():
                 path = os.path.dirname(path)
@@ -41,14 +50,93 @@ class FsCrawler(Crawler):
         """
         return self.__pathHolder
 
-    def globFromParent(self, filterTypes=[], useCache=True):
+    def var(self, name):
+        """
+        Return the value for a variable.
+
+        The "inode" and "device" vars are read from the path holder, they can be
+        used to identify the paths pointing to the same data (hardlinks and symlinks).
+        They are not available when the path does not exist.
+        """
+        if name in self.__statVarNames and not super(FsCrawler, self).hasVar(name):
+            try:
+                return self.__pathHolder.device() if name == 'device' else self.__pathHolder.inode()
+            except OSError as err:
+                raise CrawlerInvalidVarError(
+                    'Variable not found "{0}": {1}'.format(name, err)
+                )
+
+        return super(FsCrawler, self).var(name)
+
+    def hasVar(self, name):
+        """
+        Return a boolean telling if the variable is assigned to the crawler.
+
+        The "inode" and "device" vars are reported when the path can be
+        queried (same as var), even though they are not assigned.
+        """
+        if name in self.__statVarNames and not super(FsCrawler, self).hasVar(name):
+            try:
+                self.var(name)
+            except CrawlerInvalidVarError:
+                return False
+            return True
+
+        return super(FsCrawler, self).hasVar(name)
+
+    @classmethod
+    def lazyVarNames(cls):
+        """
+        Return a frozenset containing the names of the vars computed on demand (by var).
+        """
+        return super(FsCrawler, cls).lazyVarNames() | cls.__statVarNames
+
+    def glob(self, filterTypes=[], useCache=True, workers=None, maxDepth=None, excludeDirs=[], descendFilter=None, processes=None, skipDuplicates=False, collapseSequences=False):
+        """
+        Return a list of all crawlers found recursively under this path.
+
+        The options are the same used by Crawler.glob (they come in the same
+        order), followed by collapseSequences: when enabled the frames of each
+        image sequence are replaced by a single sequence crawler
+        (SequenceCrawler), the filter is applied to the frames before
+        collapsing them.
+        """
+        result = super(FsCrawler, self).glob(
+            filterTypes,
+            useCache,
+            workers,
+            maxDepth,
+            excludeDirs,
+            descendFilter,
+            processes,
+            skipDuplicates
+        )
+        if collapseSequences:
+            from .Image import SequenceCrawler
+            result = SequenceCrawler.collapse(result)
+
+        return result
+
+    def globFromParent(self, filterTypes=[], useCache=True, workers=None, maxDepth=None, excludeDirs=[], descendFilter=None, processes=None, skipDuplicates=False, collapseSequences=False, crawlIndex=None):
         """
         Return a list of all crawlers found recursively under the parent directory of the given path.
 
         Filter result list by exact crawler type (str) or class type (includes derived classes).
+        The options are the same used by glob (they come in the same order),
+        the crawl index is assigned to the parent directory crawler.
         """
         parentPath = os.path.dirname(self.var("filePath"))
-        return FsCrawler.createFromPath(parentPath).glob(filterTypes, useCache)
+        return FsCrawler.createFromPath(parentPath, crawlIndex=crawlIndex).glob(
+            filterTypes,
+            useCache,
+            workers,
+            maxDepth,
+            excludeDirs,
+            descendFilter,
+            processes,
+            skipDuplicates,
+            collapseSequences
+        )
 
     @classmethod
     def test(cls, data=None, parentCrawler=None):
@@ -58,9 +146,12 @@ class FsCrawler(Crawler):
         return isinstance(data, PathHolder)
 
     @staticmethod
-    def createFromPath(fullPath, crawlerType=None, parentCrawler=None):
+    def createFromPath(fullPath, crawlerType=None, parentCrawler=None, crawlIndex=None):
         """
         Create a crawler directly from a path string.
+
+        The optional crawlIndex (CrawlIndex) is used by directory crawlers
+        to avoid re-crawling the directories that have not changed.
         """
         if crawlerType:
             crawlerClass = FsCrawler.registeredType(crawlerType)
@@ -68,10 +159,13 @@ class FsCrawler(Crawler):
 
             result = crawlerClass(PathHolder(fullPath), parentCrawler)
             result.setVar('type', crawlerType)
-
-            return result
         else:
-            return FsCrawler.create(PathHolder(fullPath), parentCrawler)
+            result = FsCrawler.create(PathHolder(fullPath), parentCrawler)
+
+        if crawlIndex is not None and not result.isLeaf():
+            result.setCrawlIndex(crawlIndex)
+
+        return result
 
     def __setPathHolder(self, pathHolder):
         """
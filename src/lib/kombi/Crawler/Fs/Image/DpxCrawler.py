@@ -5,6 +5,10 @@ class DpxCrawler(OiioCrawler):
     Dpx crawler.
     """
 
+    __slots__ = ()
+
+    testExtensions = ('dpx',)
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
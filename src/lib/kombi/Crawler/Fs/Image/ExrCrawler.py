@@ -5,6 +5,10 @@ class ExrCrawler(OiioCrawler):
     Exr crawler.
     """
 
+    __slots__ = ()
+
+    testExtensions = ('exr',)
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
@@ -1,19 +1,39 @@
 import os
 import json
 import subprocess
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
 from ..FileCrawler import FileCrawler
+from .ImageHeader import ImageHeader, ImageHeaderError
 
 class ImageCrawler(FileCrawler):
     """
     Abstracted image crawler.
     """
 
+    __slots__ = ('__mediaVarsComputed',)
+
     __ffprobeExecutable = os.environ.get('KOMBI_FFPROBE_EXECUTABLE', 'ffprobe')
+    __prefetchWorkers = int(os.environ.get('KOMBI_PREFETCH_WORKERS', 8))
+    __headerExts = frozenset(ImageHeader.supportedExts())
+    __headerVarNames = frozenset([
+        'width',
+        'height',
+        'channels',
+        'pixelType',
+        'compression',
+        'dataWindow',
+        'displayWindow'
+    ])
 
     def __init__(self, *args, **kwargs):
         """
         Create an image crawler.
         """
+        # the header vars are only computed once, the vars that are
+        # not supplied by the format are not assigned
+        self.__mediaVarsComputed = False
+
         super(ImageCrawler, self).__init__(*args, **kwargs)
 
         self.setVar('category', 'image')
@@ -38,13 +58,130 @@ class ImageCrawler(FileCrawler):
 
     def var(self, name):
         """
-        Return var value using lazy loading implementation for width and height.
+        Return var value using lazy loading implementation for the image header vars.
+
+        The vars are looked up in the media cache first. Otherwise, they are
+        read straight from the image header when the format is supported by
+        ImageHeader, falling back to _probeVars (ffprobe).
         """
-        if self.__ffprobeExecutable and name in ('width', 'height') and name not in self.varNames():
-            self.__computeWidthHeight()
+        if name in self.__headerVarNames and not self.__mediaVarsComputed and not self.hasVar(name):
+            self.__computeMediaVars()
 
         return super(ImageCrawler, self).var(name)
 
+    @classmethod
+    def lazyVarNames(cls):
+        """
+        Return a frozenset containing the names of the vars computed on demand (by var).
+        """
+        return super(ImageCrawler, cls).lazyVarNames() | cls.__headerVarNames
+
+    @classmethod
+    def prefetchVars(cls, crawlers, varNames=('width', 'height'), useGroupRepresentative=False, workers=None):
+        """
+        Compute the lazy vars for a list of crawlers ahead of time.
+
+        The lazy vars (for instance width and height) are computed concurrently
+        using a bounded thread pool (up to "workers" threads, by default
+        $KOMBI_PREFETCH_WORKERS), so probing a large list of images does not
+        happen one file at a time. When useGroupRepresentative is enabled only one
+        frame per "group" tag and directory is probed and the result is assigned
+        to all the crawlers of the same group (assuming all frames of a sequence
+        share the same values). Crawlers that are not image crawlers or that
+        already contain the vars are ignored.
+        """
+        if workers is None:
+            workers = cls.__prefetchWorkers
+
+        # collecting the crawlers that need to be probed
+        pending = OrderedDict()
+        for crawler in crawlers:
+            if not isinstance(crawler, ImageCrawler):
+                continue
+
+            missingVarNames = [x for x in varNames if not crawler.hasVar(x)]
+            if not missingVarNames:
+                continue
+
+            key = id(crawler)
+            # same-named sequences can be found in different directories
+            if useGroupRepresentative and 'group' in crawler.tagNames():
+                key = (
+                    os.path.dirname(crawler.var('filePath')),
+                    crawler.tag('group'),
+                    tuple(missingVarNames)
+                )
+
+            if key not in pending:
+                pending[key] = (missingVarNames, [])
+            pending[key][1].append(crawler)
+
+        if not pending:
+            return
+
+        def probe(item):
+            missingVarNames, groupCrawlers = item
+            for varName in missingVarNames:
+                groupCrawlers[0].var(varName)
+
+        items = list(pending.values())
+        if workers > 1 and len(items) > 1:
+            pool = ThreadPool(min(workers, len(items)))
+            try:
+                pool.map(probe, items)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            list(map(probe, items))
+
+        # assigning the values of the representative crawler to the
+        # rest of the group
+        for missingVarNames, groupCrawlers in items:
+            for varName in missingVarNames:
+                value = groupCrawlers[0].var(varName)
+                for crawler in groupCrawlers[1:]:
+                    crawler.setVar(varName, value)
+
+    def _probeVars(self):
+        """
+        Compute width and height when they cannot be read from the image header.
+        """
+        if self.__ffprobeExecutable:
+            self.__computeWidthHeight()
+
+    def _computeHeaderVars(self):
+        """
+        Set the vars read from the image header, return a boolean telling if it succeeded.
+        """
+        ext = self.pathHolder().ext()
+        if ext not in self.__headerExts:
+            return False
+
+        try:
+            headerInfo = ImageHeader.read(self.pathHolder().path(), ext)
+        except ImageHeaderError:
+            return False
+
+        for varName, varValue in headerInfo.items():
+            if not self.hasVar(varName):
+                self.setVar(varName, varValue)
+
+        return True
+
+    def __computeMediaVars(self):
+        """
+        Compute the image header vars (using the media cache when available).
+        """
+        self.__mediaVarsComputed = True
+        if self._loadMediaVars(self.__headerVarNames):
+            return
+
+        if not self._computeHeaderVars():
+            self._probeVars()
+
+        self._storeMediaVars(self.__headerVarNames)
+
     def __computeImageSequence(self):
         """
         Compute the image sequence tags and vars.
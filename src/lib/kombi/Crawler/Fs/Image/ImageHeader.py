@@ -0,0 +1,274 @@
+import struct
+from ...Crawler import CrawlerError
+
+class ImageHeaderError(CrawlerError):
+    """Image Header Error."""
+
+class ImageHeaderUnsupportedError(ImageHeaderError):
+    """Image Header Unsupported Error."""
+
+class ImageHeader(object):
+    """
+    Lightweight image header reader.
+
+    Reads the image information (resolution, number of channels and pixel type)
+    straight from the header of the file, without loading the image itself.
+    Only the first bytes of the file are read (for exr the attributes up to the
+    end of the header). The result is a dict containing:
+        - width, height: resolution of the image (display window for exr)
+        - channels: number of channels
+        - pixelType: uint8, uint10, uint12, uint16, uint32, half, float or double
+        - for exr only: dataWindow, displayWindow ([xMin, yMin, xMax, yMax])
+          and compression
+    """
+
+    __exrMagic = b'\x76\x2f\x31\x01'
+    __exrPixelTypes = {
+        0: 'uint32',
+        1: 'half',
+        2: 'float'
+    }
+    __exrCompressions = {
+        0: 'none',
+        1: 'rle',
+        2: 'zips',
+        3: 'zip',
+        4: 'piz',
+        5: 'pxr24',
+        6: 'b44',
+        7: 'b44a',
+        8: 'dwaa',
+        9: 'dwab'
+    }
+
+    __dpxImageInfoOffset = 768
+    __dpxDescriptorChannels = {
+        1: 1, 2: 1, 3: 1, 4: 1, 6: 1, 8: 1,
+        50: 3, 51: 4, 52: 4,
+        100: 2, 101: 3, 102: 3, 103: 4
+    }
+    __dpxPixelTypes = {
+        1: 'uint8',
+        8: 'uint8',
+        10: 'uint10',
+        12: 'uint12',
+        16: 'uint16',
+        32: 'float',
+        64: 'double'
+    }
+
+    __pngMagic = b'\x89PNG\r\n\x1a\n'
+    __pngColorTypeChannels = {
+        0: 1,
+        2: 3,
+        3: 3,
+        4: 2,
+        6: 4
+    }
+
+    # start of frame markers (the ones that don't describe a frame
+    # are excluded: DHT, JPG and DAC)
+    __jpgStartOfFrameMarkers = set(range(0xc0, 0xd0)) - set([0xc4, 0xc8, 0xcc])
+
+    @classmethod
+    def read(cls, filePath, ext):
+        """
+        Return a dict containing the information read from the image header.
+        """
+        reader = cls.__readers().get(ext)
+        if reader is None:
+            raise ImageHeaderUnsupportedError(
+                'Image header reader does not support the extension: "{}"'.format(ext)
+            )
+
+        try:
+            with open(filePath, 'rb') as imageFile:
+                return reader(imageFile)
+        except (IOError, OSError, struct.error, IndexError, KeyError, ValueError) as err:
+            raise ImageHeaderError(
+                'Cannot read the image header for "{}": {}'.format(
+                    filePath,
+                    str(err)
+                )
+            )
+
+    @classmethod
+    def supportedExts(cls):
+        """
+        Return a list of extensions supported by the header reader.
+        """
+        return list(cls.__readers().keys())
+
+    @classmethod
+    def __readers(cls):
+        """
+        Return a dict containing the reader for each extension.
+        """
+        return {
+            'exr': cls.__readExr,
+            'dpx': cls.__readDpx,
+            'png': cls.__readPng,
+            'jpg': cls.__readJpg,
+            'jpeg': cls.__readJpg
+        }
+
+    @classmethod
+    def __readExr(cls, imageFile):
+        """
+        Return the information from an exr header.
+        """
+        if imageFile.read(4) != cls.__exrMagic:
+            raise ImageHeaderError('Invalid exr file')
+
+        # skipping the version field
+        imageFile.read(4)
+
+        result = {}
+        while True:
+            name = cls.__readNullTerminated(imageFile)
+
+            # end of header
+            if not name:
+                break
+
+            attributeType = cls.__readNullTerminated(imageFile)
+            size = struct.unpack('<i', imageFile.read(4))[0]
+            value = imageFile.read(size)
+
+            if name == b'channels' and attributeType == b'chlist':
+                pixelTypes = cls.__parseExrChannels(value)
+                result['channels'] = len(pixelTypes)
+                if pixelTypes:
+                    result['pixelType'] = cls.__exrPixelTypes[max(pixelTypes)]
+
+            elif name == b'compression' and attributeType == b'compression':
+                result['compression'] = cls.__exrCompressions.get(
+                    bytearray(value)[0],
+                    'unknown'
+                )
+
+            elif name in (b'dataWindow', b'displayWindow') and attributeType == b'box2i':
+                result[name.decode('utf-8')] = list(struct.unpack('<4i', value))
+
+        if 'displayWindow' not in result:
+            raise ImageHeaderError('Exr header does not contain the displayWindow')
+
+        xMin, yMin, xMax, yMax = result['displayWindow']
+        result['width'] = xMax - xMin + 1
+        result['height'] = yMax - yMin + 1
+
+        return result
+
+    @classmethod
+    def __parseExrChannels(cls, value):
+        """
+        Return a list containing the pixel type for each channel of an exr chlist.
+        """
+        result = []
+        offset = 0
+        while offset < len(value) and value[offset:offset + 1] != b'\x00':
+            offset = value.index(b'\x00', offset) + 1
+            result.append(struct.unpack('<i', value[offset:offset + 4])[0])
+
+            # skipping pixel type, pLinear, reserved and sampling
+            offset += 16
+
+        return result
+
+    @classmethod
+    def __readDpx(cls, imageFile):
+        """
+        Return the information from a dpx header.
+        """
+        header = imageFile.read(cls.__dpxImageInfoOffset + 36)
+        magic = header[:4]
+        if magic == b'SDPX':
+            endian = '>'
+        elif magic == b'XPDS':
+            endian = '<'
+        else:
+            raise ImageHeaderError('Invalid dpx file')
+
+        offset = cls.__dpxImageInfoOffset
+        width, height = struct.unpack(endian + '2I', header[offset + 4:offset + 12])
+        descriptor, bitSize = struct.unpack('B2xB', header[offset + 32:offset + 36])
+
+        result = {
+            'width': width,
+            'height': height
+        }
+
+        if descriptor in cls.__dpxDescriptorChannels:
+            result['channels'] = cls.__dpxDescriptorChannels[descriptor]
+
+        if bitSize in cls.__dpxPixelTypes:
+            result['pixelType'] = cls.__dpxPixelTypes[bitSize]
+
+        return result
+
+    @classmethod
+    def __readPng(cls, imageFile):
+        """
+        Return the information from a png header.
+        """
+        header = imageFile.read(26)
+        if header[:8] != cls.__pngMagic or header[12:16] != b'IHDR':
+            raise ImageHeaderError('Invalid png file')
+
+        width, height, bitDepth, colorType = struct.unpack('>2I2B', header[16:26])
+
+        return {
+            'width': width,
+            'height': height,
+            'channels': cls.__pngColorTypeChannels[colorType],
+            'pixelType': 'uint16' if bitDepth == 16 else 'uint8'
+        }
+
+    @classmethod
+    def __readJpg(cls, imageFile):
+        """
+        Return the information from a jpg header.
+        """
+        if imageFile.read(2) != b'\xff\xd8':
+            raise ImageHeaderError('Invalid jpg file')
+
+        while True:
+            marker = bytearray(imageFile.read(2))
+            if len(marker) != 2 or marker[0] != 0xff:
+                raise ImageHeaderError('Cannot find the jpg start of frame')
+
+            # padding bytes
+            while marker[1] == 0xff:
+                marker[1] = bytearray(imageFile.read(1))[0]
+
+            # markers without payload
+            if marker[1] == 0x01 or 0xd0 <= marker[1] <= 0xd8:
+                continue
+
+            size = struct.unpack('>H', imageFile.read(2))[0]
+            if marker[1] in cls.__jpgStartOfFrameMarkers:
+                precision, height, width, channels = struct.unpack('>BHHB', imageFile.read(6))
+                return {
+                    'width': width,
+                    'height': height,
+                    'channels': channels,
+                    'pixelType': 'uint16' if precision > 8 else 'uint8'
+                }
+
+            imageFile.seek(size - 2, 1)
+
+    @staticmethod
+    def __readNullTerminated(imageFile, maxSize=256):
+        """
+        Return the bytes until the next null character.
+        """
+        result = b''
+        while len(result) <= maxSize:
+            char = imageFile.read(1)
+            if not char:
+                raise ImageHeaderError('Unexpected end of file')
+            if char == b'\x00':
+                return result
+            result += char
+
+        raise ImageHeaderError('Invalid header string')
@@ -5,6 +5,10 @@ class JpgCrawler(OiioCrawler):
     Jpg crawler.
     """
 
+    __slots__ = ()
+
+    testExtensions = ('jpg',)
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
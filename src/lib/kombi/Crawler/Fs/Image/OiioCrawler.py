@@ -24,32 +24,33 @@ class OiioCrawler(ImageCrawler):
     Open image io crawler.
     """
 
-    def var(self, name):
+    __slots__ = ()
+
+    def _probeVars(self):
         """
-        Return var value using lazy loading implementation for width and height.
+        Compute width and height through OIIO when they cannot be read from the image header.
         """
-        if name in ('width', 'height') and name not in self.varNames():
-            # alternatively width and height information could come from the
-            # parent directory crawler "1920x1080". For more details take a look
-            # at "Directory" crawler.
-            if hasOpenImageIO:
-                imageInput = OpenImageIO.ImageInput.open(self.supportedString(self.pathHolder().path()))
-
-                # making sure the image has been successfully loaded
-                if imageInput is None:
-                    raise OiioCrawlerReadFileError(
-                        "Can't read information from file:\n{}".format(
-                            self.pathHolder().path()
-                        )
-                    )
-
-                spec = imageInput.spec()
-                self.setVar('width', spec.full_width)
-                self.setVar('height', spec.full_height)
-
-                imageInput.close()
-
-        return super(OiioCrawler, self).var(name)
+        # alternatively width and height information could come from the
+        # parent directory crawler "1920x1080". For more details take a look
+        # at "Directory" crawler.
+        if not hasOpenImageIO:
+            return super(OiioCrawler, self)._probeVars()
+
+        imageInput = OpenImageIO.ImageInput.open(self.supportedString(self.pathHolder().path()))
+
+        # making sure the image has been successfully loaded
+        if imageInput is None:
+            raise OiioCrawlerReadFileError(
+                "Can't read information from file:\n{}".format(
+                    self.pathHolder().path()
+                )
+            )
+
+        spec = imageInput.spec()
+        self.setVar('width', spec.full_width)
+        self.setVar('height', spec.full_height)
+
+        imageInput.close()
 
     @classmethod
     def supportedString(cls, text):
@@ -5,6 +5,10 @@ class PngCrawler(OiioCrawler):
     Png crawler.
     """
 
+    __slots__ = ()
+
+    testExtensions = ('png',)
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
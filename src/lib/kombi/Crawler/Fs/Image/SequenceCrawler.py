@@ -0,0 +1,265 @@
+import os
+import re
+from collections import OrderedDict
+from ...Crawler import Crawler
+from ...PathHolder import PathHolder
+from ..FsCrawler import FsCrawler
+from .ImageCrawler import ImageCrawler
+
+class SequenceCrawler(FsCrawler):
+    """
+    Collapsed image sequence crawler.
+
+    Represents a whole image sequence as a single crawler. The path of the
+    crawler is the sequence pattern using the "#" notation for the frame
+    padding (the same value used by the "group" tag of the image crawlers),
+    for instance: /a/plate.####.exr. The frames are stored as a compact
+    list of ranges (var "frameRanges", for instance: "1001-1050,1052-1100"),
+    the per frame crawlers are only created on demand (frameCrawler,
+    frameCrawlers).
+
+    Sequence crawlers are never created by Crawler.create, use
+    SequenceCrawler.collapse (or glob with collapseSequences) instead.
+    """
+
+    __slots__ = ()
+
+    # never selected by Crawler.create
+    testExtensions = ()
+
+    __patternRegex = re.compile(r'^(?P<name>.*?)(?P<frameSep>[._])(?P<padding>#+)\.(?P<ext>[^.]+)$')
+
+    # vars that are specific to each frame (they are not passed from the
+    # frame crawlers to the sequence)
+    __frameVarNames = frozenset([
+        'type',
+        'frame',
+        'name',
+        'padding',
+        'imageType',
+        'filePath',
+        'fullPath',
+        'baseName'
+    ])
+
+    # vars that are specific to the sequence (they are not passed from
+    # the sequence to the frame crawlers)
+    __sequenceVarNames = frozenset([
+        'frameSep',
+        'frameType',
+        'frameRanges',
+        'firstFrame',
+        'lastFrame'
+    ])
+
+    def __init__(self, *args, **kwargs):
+        """
+        Create a sequence crawler.
+        """
+        super(SequenceCrawler, self).__init__(*args, **kwargs)
+
+        patternMatch = self.__patternRegex.match(self.pathHolder().baseName())
+        assert patternMatch, "Invalid sequence pattern: {}".format(self.pathHolder().baseName())
+
+        padding = len(patternMatch.group('padding'))
+        self.setVar('category', 'image')
+        self.setVar('imageType', 'sequence')
+        self.setVar('name', patternMatch.group('name'))
+        self.setVar('padding', padding)
+        self.setVar('frameSep', patternMatch.group('frameSep'))
+        self.setVar('frameType', 'image')
+        self.setVar('frameRanges', '')
+
+        self.setTag('group', self.pathHolder().baseName())
+        self.setTag(
+            'groupSprintf',
+            '{0}{1}{2}.{3}'.format(
+                patternMatch.group('name'),
+                patternMatch.group('frameSep'),
+                '%0{}d'.format(padding),
+                patternMatch.group('ext')
+            )
+        )
+
+    def isSequence(self):
+        """
+        Return a boolean telling if the crawler is an image sequence (always True).
+        """
+        return True
+
+    def frames(self):
+        """
+        Return a list containing all frames of the sequence.
+        """
+        result = []
+        for start, end in self.frameRanges():
+            result.extend(range(start, end + 1))
+
+        return result
+
+    def frameRanges(self):
+        """
+        Return a list of tuples (start, end) describing the frames of the sequence.
+        """
+        return self.decodeFrameRanges(self.var('frameRanges'))
+
+    def missingFrames(self):
+        """
+        Return a list of frames missing between the first and last frames of the sequence.
+        """
+        result = []
+        frameRanges = self.frameRanges()
+        for (start, end), (nextStart, nextEnd) in zip(frameRanges, frameRanges[1:]):
+            result.extend(range(end + 1, nextStart))
+
+        return result
+
+    def setFrames(self, frames):
+        """
+        Set the frames of the sequence.
+        """
+        frameRanges = self.encodeFrameRanges(frames)
+        self.setVar('frameRanges', frameRanges)
+
+        frameRanges = self.decodeFrameRanges(frameRanges)
+        if frameRanges:
+            self.setVar('firstFrame', frameRanges[0][0])
+            self.setVar('lastFrame', frameRanges[-1][1])
+
+    def framePath(self, frame):
+        """
+        Return the full path for a frame of the sequence.
+        """
+        return os.path.join(
+            os.path.dirname(self.var('fullPath')),
+            self.tag('groupSprintf') % frame
+        )
+
+    def frameCrawler(self, frame):
+        """
+        Return a crawler for a frame of the sequence.
+
+        The crawler is created using the type of the original frame crawlers
+        and it receives the vars shared by the frames (for instance
+        sourceDirectory), overriding the values assigned by its constructor.
+        """
+        frameType = self.var('frameType')
+        result = Crawler.registeredType(frameType)(
+            PathHolder(self.framePath(frame), False)
+        )
+        result.setVar('type', frameType)
+
+        contextVarNames = self.contextVarNames()
+        for varName in self.varNames():
+            if varName not in self.__frameVarNames and varName not in self.__sequenceVarNames:
+                result.setVar(varName, self.var(varName), varName in contextVarNames)
+
+        return result
+
+    def frameCrawlers(self):
+        """
+        Return a generator that yields a crawler for each frame of the sequence.
+        """
+        for frame in self.frames():
+            yield self.frameCrawler(frame)
+
+    @classmethod
+    def createFromCrawlers(cls, crawlers):
+        """
+        Return a sequence crawler based on the image crawlers of the same sequence.
+        """
+        firstCrawler = crawlers[0]
+        result = cls(
+            PathHolder(
+                os.path.join(
+                    os.path.dirname(firstCrawler.var('fullPath')),
+                    firstCrawler.tag('group')
+                ),
+                False
+            )
+        )
+        result.setVar('type', 'sequence')
+
+        # passing the vars that are shared by all frames, they override the
+        # values assigned by the constructor (for instance the sourceDirectory
+        # of the frames is the directory where the crawl started). The vars
+        # computed on demand by the first frame (lazyVarNames) are not passed
+        contextVarNames = firstCrawler.contextVarNames()
+        lazyVarNames = firstCrawler.lazyVarNames()
+        for varName in firstCrawler.varNames():
+            if varName not in cls.__frameVarNames and varName not in cls.__sequenceVarNames and varName not in lazyVarNames:
+                result.setVar(varName, firstCrawler.var(varName), varName in contextVarNames)
+        result.setVar('frameType', firstCrawler.var('type'))
+        result.setFrames(map(lambda x: x.var('frame'), crawlers))
+
+        return result
+
+    @classmethod
+    def collapse(cls, crawlers):
+        """
+        Return a list where the image sequence crawlers are replaced by sequence crawlers.
+
+        The sequence crawler takes the position of the first frame found for
+        the sequence, all the other crawlers are kept as they are.
+        """
+        result = []
+        sequences = OrderedDict()
+        for crawler in crawlers:
+            if isinstance(crawler, ImageCrawler) and crawler.var('imageType') == 'sequence':
+                key = (os.path.dirname(crawler.var('fullPath')), crawler.tag('group'))
+                if key not in sequences:
+                    sequences[key] = []
+                    result.append(key)
+                sequences[key].append(crawler)
+            else:
+                result.append(crawler)
+
+        if not sequences:
+            return result
+
+        return list(map(
+            lambda x: cls.createFromCrawlers(sequences[x]) if isinstance(x, tuple) else x,
+            result
+        ))
+
+    @staticmethod
+    def encodeFrameRanges(frames):
+        """
+        Return a string describing the frames as ranges (for instance: "1-10,12,14-20").
+        """
+        ranges = []
+        for frame in sorted(set(frames)):
+            if ranges and ranges[-1][1] == frame - 1:
+                ranges[-1][1] = frame
+            else:
+                ranges.append([frame, frame])
+
+        return ','.join(map(
+            lambda x: str(x[0]) if x[0] == x[1] else '{}-{}'.format(*x),
+            ranges
+        ))
+
+    @staticmethod
+    def decodeFrameRanges(frameRanges):
+        """
+        Return a list of tuples (start, end) from a string created by encodeFrameRanges.
+        """
+        result = []
+        for frameRange in filter(None, frameRanges.split(',')):
+            # negative frames are supported (for instance: -10--5)
+            parts = re.match(r'^(-?\d+)(?:-(-?\d+))?$', frameRange.strip())
+            if not parts:
+                raise ValueError('Invalid frame range: {}'.format(frameRange))
+
+            start = int(parts.group(1))
+            end = int(parts.group(2)) if parts.group(2) is not None else start
+            result.append((start, end))
+
+        return result
+
+
+# registration
+SequenceCrawler.register(
+    'sequence',
+    SequenceCrawler
+)
@@ -1,6 +1,8 @@
+from .ImageHeader import ImageHeader, ImageHeaderError, ImageHeaderUnsupportedError
 from .ImageCrawler import ImageCrawler
 from .OiioCrawler import OiioCrawler, OiioCrawlerReadFileError
 from .ExrCrawler import ExrCrawler
 from .DpxCrawler import DpxCrawler
 from .JpgCrawler import JpgCrawler
 from .PngCrawler import PngCrawler
+from .SequenceCrawler import SequenceCrawler
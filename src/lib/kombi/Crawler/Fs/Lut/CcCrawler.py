@@ -5,6 +5,10 @@ class CcCrawler(LutCrawler):
     Parses a Cc file.
     """
 
+    __slots__ = ()
+
+    testExtensions = ('cc',)
+
     def __init__(self, *args, **kwargs):
         """
         Create a Cc object.
@@ -30,13 +34,12 @@ class CcCrawler(LutCrawler):
         tags = ['Slope', 'Offset', 'Power', 'Saturation']
         requireTags = ['ColorCorrection']
 
-        # Check if the cdl have the required tags
-        for tag in requireTags:
-            self.queryTag(tag)
+        # Query all tags in a single pass (it fails when a required tag is missing)
+        tagValues = self.queryTags(requireTags + tags)
 
         # Get the values from the cdl file
         for tag in tags:
-            tagValue = self.queryTag(tag)
+            tagValue = tagValues[tag]
             if tag == 'Saturation':
                 self.setVar(tag.lower(), float(tagValue[0]))
                 continue
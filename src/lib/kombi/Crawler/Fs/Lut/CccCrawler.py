@@ -5,6 +5,10 @@ class CccCrawler(LutCrawler):
     Parses a Ccc file.
     """
 
+    __slots__ = ()
+
+    testExtensions = ('ccc',)
+
     def __init__(self, *args, **kwargs):
         """
         Create a Ccc object.
@@ -30,13 +34,12 @@ class CccCrawler(LutCrawler):
         tags = ['Slope', 'Offset', 'Power', 'Saturation']
         requireTags = ['ColorCorrection', 'ColorCorrectionCollection']
 
-        # Check if the cdl have the required tags
-        for tag in requireTags:
-            self.queryTag(tag)
+        # Query all tags in a single pass (it fails when a required tag is missing)
+        tagValues = self.queryTags(requireTags + tags)
 
         # Get the values from the cdl file
         for tag in tags:
-            tagValue = self.queryTag(tag)
+            tagValue = tagValues[tag]
             if tag == 'Saturation':
                 self.setVar(tag.lower(), float(tagValue[0]))
                 continue
@@ -5,6 +5,10 @@ class CdlCrawler(LutCrawler):
     Parses a cdl file.
     """
 
+    __slots__ = ()
+
+    testExtensions = ('cdl',)
+
     def __init__(self, *args, **kwargs):
         """
         Create a cdl object.
@@ -30,13 +34,12 @@ class CdlCrawler(LutCrawler):
         cdlTags = ['Slope', 'Offset', 'Power', 'Saturation']
         cdlRequireTags = ['ColorCorrection', 'ColorDecision', 'ColorDecisionList']
 
-        # Check if the cdl have the required tags
-        for tag in cdlRequireTags:
-            self.queryTag(tag)
+        # Query all tags in a single pass (it fails when a required tag is missing)
+        tagValues = self.queryTags(cdlRequireTags + cdlTags)
 
         # Get the values from the cdl file
         for tag in cdlTags:
-            tagValue = self.queryTag(tag)
+            tagValue = tagValues[tag]
             if tag == 'Saturation':
                 self.setVar(tag.lower(), float(tagValue[0]))
                 continue
@@ -0,0 +1,215 @@
+import os
+import json
+import time
+import threading
+from ..Crawler import CrawlerError
+from ..PathHolder import PathHolder
+from .CacheDatabase import CacheDatabase
+
+class MediaCacheError(CrawlerError):
+    """Media Cache Error."""
+
+class MediaCache(object):
+    """
+    Persistent cache for the vars computed by probing media files.
+
+    The vars computed by the lazy var providers (for instance width and height
+    read from an image header, OIIO or ffprobe) are stored in a SQLite database
+    under the cache directory, so they can be shared across processes (local
+    dispatcher subprocesses, task wrappers and farm nodes when the cache
+    directory lives on a shared storage).
+
+    The entries are keyed by the file path and invalidated by the file stat
+    information (size, mtime and inode). The database runs in WAL mode, so
+    readers are not blocked by writers, and concurrent writers wait for
+    each other (busy timeout). The least recently used entries are evicted when
+    the number of entries goes above the maximum number of entries.
+    """
+
+    __cacheDirectoryEnvName = 'KOMBI_MEDIA_CACHE_DIR'
+    __maxEntriesEnvName = 'KOMBI_MEDIA_CACHE_MAX_ENTRIES'
+    __databaseName = 'mediaCache.sqlite3'
+    __defaultMaxEntries = 100000
+    __busyTimeout = 30.0
+
+    # the access time is only updated when it is older than this
+    # interval (in seconds), avoiding a write for every read
+    __accessResolution = 3600.0
+
+    # the eviction is checked after this number of writes
+    __evictionInterval = 1000
+
+    __defaultInstance = None
+    __defaultInstanceLock = threading.Lock()
+
+    def __init__(self, cacheDirectory=None, maxEntries=None):
+        """
+        Create a media cache (by default under $KOMBI_MEDIA_CACHE_DIR).
+        """
+        if cacheDirectory is None:
+            cacheDirectory = self.defaultCacheDirectory()
+
+        if not cacheDirectory:
+            raise MediaCacheError(
+                'Cache directory is not defined (${})!'.format(
+                    self.__cacheDirectoryEnvName
+                )
+            )
+
+        if maxEntries is None:
+            maxEntries = int(os.environ.get(self.__maxEntriesEnvName, self.__defaultMaxEntries))
+
+        self.__cacheDirectory = cacheDirectory
+        self.__maxEntries = maxEntries
+        self.__lock = threading.Lock()
+        self.__writes = 0
+        self.__database = CacheDatabase(
+            os.path.join(cacheDirectory, self.__databaseName),
+            (
+                'CREATE TABLE IF NOT EXISTS media ('
+                'path TEXT PRIMARY KEY, signature TEXT, vars TEXT, accessed REAL)',
+                'CREATE INDEX IF NOT EXISTS mediaAccessed ON media (accessed)'
+            ),
+            timeout=self.__busyTimeout
+        )
+
+    def cacheDirectory(self):
+        """
+        Return the directory where the cache database is stored.
+        """
+        return self.__cacheDirectory
+
+    def maxEntries(self):
+        """
+        Return the maximum number of entries kept by the cache.
+        """
+        return self.__maxEntries
+
+    def vars(self, filePath):
+        """
+        Return a dict containing the cached vars for the file (empty when not cached).
+
+        The file can be passed as a path holder, reusing the stat information
+        already queried by it.
+        """
+        filePath, signature = self.__statSignature(filePath)
+        if signature is None:
+            return {}
+
+        with self.__lock:
+            database = self.__database.connection()
+            row = database.execute(
+                'SELECT signature, vars, accessed FROM media WHERE path = ?',
+                (filePath,)
+            ).fetchone()
+
+            if row is None or row[0] != signature:
+                return {}
+
+            # keeping track of the last access used by the eviction
+            now = time.time()
+            if now - row[2] > self.__accessResolution:
+                database.execute(
+                    'UPDATE media SET accessed = ? WHERE path = ?',
+                    (now, filePath)
+                )
+                database.commit()
+
+        return json.loads(row[1])
+
+    def setVars(self, filePath, varValues):
+        """
+        Store the vars for the file (merged with the vars already cached for it).
+        """
+        filePath, signature = self.__statSignature(filePath)
+        if signature is None or not varValues:
+            return
+
+        with self.__lock:
+            database = self.__database.connection()
+            row = database.execute(
+                'SELECT signature, vars FROM media WHERE path = ?',
+                (filePath,)
+            ).fetchone()
+
+            values = {}
+            if row is not None and row[0] == signature:
+                values = json.loads(row[1])
+            values.update(varValues)
+
+            database.execute(
+                'INSERT OR REPLACE INTO media (path, signature, vars, accessed) VALUES (?, ?, ?, ?)',
+                (filePath, signature, json.dumps(values), time.time())
+            )
+            database.commit()
+
+            self.__writes += 1
+            if self.__writes % self.__evictionInterval == 0:
+                self.__evict(database)
+
+    def evict(self):
+        """
+        Remove the least recently used entries above the maximum number of entries.
+        """
+        with self.__lock:
+            self.__evict(self.__database.connection())
+
+    def close(self):
+        """
+        Close the connection with the cache database.
+        """
+        with self.__lock:
+            self.__database.close()
+
+    @classmethod
+    def default(cls):
+        """
+        Return the process wide media cache, or None when $KOMBI_MEDIA_CACHE_DIR is not defined.
+        """
+        cacheDirectory = cls.defaultCacheDirectory()
+        if not cacheDirectory:
+            return None
+
+        with cls.__defaultInstanceLock:
+            if cls.__defaultInstance is None or cls.__defaultInstance.cacheDirectory() != cacheDirectory:
+                cls.__defaultInstance = cls(cacheDirectory)
+
+        return cls.__defaultInstance
+
+    @classmethod
+    def defaultCacheDirectory(cls):
+        """
+        Return the default cache directory (KOMBI_MEDIA_CACHE_DIR) or an empty string.
+        """
+        return os.environ.get(cls.__cacheDirectoryEnvName, '')
+
+    def __evict(self, database):
+        """
+        Remove the least recently used entries (expects the lock to be acquired).
+        """
+        total = database.execute('SELECT COUNT(*) FROM media').fetchone()[0]
+        if total <= self.__maxEntries:
+            return
+
+        database.execute(
+            'DELETE FROM media WHERE path IN (SELECT path FROM media ORDER BY accessed LIMIT ?)',
+            (total - self.__maxEntries,)
+        )
+        database.commit()
+
+    @staticmethod
+    def __statSignature(filePath):
+        """
+        Return a tuple (path, signature) for the stat information of the file (signature is None when it does not exist).
+        """
+        pathHolder = filePath if isinstance(filePath, PathHolder) else PathHolder(filePath)
+        try:
+            signature = '{}:{}:{}'.format(
+                pathHolder.size(),
+                pathHolder.mtimeNs(),
+                pathHolder.inode()
+            )
+        except OSError:
+            signature = None
+
+        return (pathHolder.path(), signature)
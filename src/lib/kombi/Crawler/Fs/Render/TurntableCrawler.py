@@ -5,6 +5,8 @@ class TurntableCrawler(ExrRenderCrawler):
     Custom crawler used to detect turntable renders.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         """
         Create a TurntableCrawler object.
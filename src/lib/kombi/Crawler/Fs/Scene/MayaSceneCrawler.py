@@ -5,12 +5,16 @@ class MayaSceneCrawler(SceneCrawler):
     Crawler used to detect maya scenes.
     """
 
+    __slots__ = ()
+
+    testExtensions = ('ma', 'mb')
+
     @classmethod
     def extensions(cls):
         """
         Return the list of available extensions for the maya scene.
         """
-        return ['ma', 'mb']
+        return list(cls.testExtensions)
 
     @classmethod
     def test(cls, pathHolder, parentCrawler):
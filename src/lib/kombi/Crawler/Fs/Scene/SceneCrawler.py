@@ -5,6 +5,8 @@ class SceneCrawler(FileCrawler):
     Abstracted scene crawler.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         """
         Create a Scene object.
@@ -5,6 +5,10 @@ class TextureCrawler(OiioCrawler):
     Custom crawler used to detect textures.
     """
 
+    __slots__ = ()
+
+    testExtensions = ('exr', 'tif')
+
     __groupTextures = True
 
     def __init__(self, *args, **kwargs):
@@ -19,7 +23,13 @@ class TextureCrawler(OiioCrawler):
 
         self.setVar("assetName", parts[0])
         self.setVar("mapType", parts[1])
-        self.setVar("udim", self.__parseUDIM(self.pathHolder()))
+
+        # reusing the udim parsed by the test
+        testResult = self.testResult()
+        if isinstance(testResult, dict) and 'udim' in testResult:
+            self.setVar("udim", testResult['udim'])
+        else:
+            self.setVar("udim", self.__parseUDIM(self.pathHolder()))
         self.setVar("variant", "default")
 
     def setVar(self, name, value, *args, **kwargs):
@@ -47,7 +57,12 @@ class TextureCrawler(OiioCrawler):
         if pathHolder.ext() not in ['exr', 'tif']:
             return False
 
-        return (cls.__parseUDIM(pathHolder) is not None)
+        udim = cls.__parseUDIM(pathHolder)
+        if udim is None:
+            return False
+
+        # handing off the udim to the constructor
+        return {'udim': udim}
 
     @classmethod
     def __parseUDIM(cls, pathHolder):
@@ -77,7 +92,7 @@ class TextureCrawler(OiioCrawler):
         """
         Update the group tag.
         """
-        if 'assetName' not in self.varNames() or 'variant' not in self.varNames():
+        if not self.hasVar('assetName') or not self.hasVar('variant'):
             return
 
         self.setTag(
@@ -2,23 +2,70 @@ import os
 import json
 import subprocess
 from .VideoCrawler import VideoCrawler
+from .QuickTimeHeader import QuickTimeHeader, QuickTimeHeaderError
 
 class MovCrawler(VideoCrawler):
     """
     Mov crawler.
     """
 
+    __slots__ = ('__mediaVarsComputed',)
+
+    testExtensions = ('mov',)
+
     __ffprobeExecutable = os.environ.get('KOMBI_FFPROBE_EXECUTABLE', 'ffprobe')
+    __headerVarNames = frozenset([
+        'width',
+        'height',
+        'codec',
+        'frameRate',
+        'firstFrame',
+        'lastFrame'
+    ])
+
+    # vars computed by ffprobe when they are not found in the header
+    __probeVarNames = (
+        'width',
+        'height',
+        'firstFrame',
+        'lastFrame'
+    )
+
+    def __init__(self, *args, **kwargs):
+        """
+        Create a mov crawler.
+        """
+        # the header vars are only computed once, the vars that are
+        # not supplied by the file are not assigned
+        self.__mediaVarsComputed = False
+
+        super(MovCrawler, self).__init__(*args, **kwargs)
 
     def var(self, name):
         """
-        Return var value using lazy loading implementation for firstFrame and lastFrame.
+        Return var value using lazy loading implementation for the QuickTime header vars.
+
+        The vars are looked up in the media cache first. Otherwise, they are
+        read straight from the QuickTime atoms, ffprobe is used as fallback
+        for the vars that cannot be parsed.
         """
-        if self.__ffprobeExecutable and name in ('firstFrame', 'lastFrame') and name not in self.varNames():
-            self.__getFirstLastFrames()
+        if name in self.__headerVarNames and not self.hasVar(name):
+            if not self.__mediaVarsComputed:
+                self.__computeMediaVars()
+
+            # the header vars are computed by the mov crawler itself,
+            # skipping the width and height probed by the video crawler
+            return super(VideoCrawler, self).var(name)
 
         return super(MovCrawler, self).var(name)
 
+    @classmethod
+    def lazyVarNames(cls):
+        """
+        Return a frozenset containing the names of the vars computed on demand (by var).
+        """
+        return super(MovCrawler, cls).lazyVarNames() | cls.__headerVarNames
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
@@ -29,12 +76,44 @@ class MovCrawler(VideoCrawler):
 
         return pathHolder.ext() == 'mov'
 
-    def __getFirstLastFrames(self):
+    def _probeVars(self):
         """
-        Query first frame and last frame using ffprobe and set them as crawler variables if available.
+        Compute the vars that cannot be read from the QuickTime header.
         """
-        assert(self.__ffprobeExecutable)
+        if self.__ffprobeExecutable:
+            self.__computeFfprobeVars()
 
+    def _computeHeaderVars(self):
+        """
+        Set the vars read from the QuickTime header (when it can be parsed).
+        """
+        try:
+            headerInfo = QuickTimeHeader.read(self.pathHolder().path())
+        except QuickTimeHeaderError:
+            return
+
+        for varName, varValue in headerInfo.items():
+            if not self.hasVar(varName):
+                self.setVar(varName, varValue)
+
+    def __computeMediaVars(self):
+        """
+        Compute the QuickTime header vars (using the media cache when available).
+        """
+        self.__mediaVarsComputed = True
+        if self._loadMediaVars(self.__headerVarNames):
+            return
+
+        self._computeHeaderVars()
+        if not all(map(self.hasVar, self.__probeVarNames)):
+            self._probeVars()
+
+        self._storeMediaVars(self.__headerVarNames)
+
+    def __computeFfprobeVars(self):
+        """
+        Query the width, height, first frame and last frame using ffprobe and set the missing ones as crawler variables.
+        """
         cmd = '{} -v quiet -show_streams -print_format json "{}"'.format(
             self.__ffprobeExecutable,
             self.var('filePath')
@@ -55,6 +134,13 @@ class MovCrawler(VideoCrawler):
         if "streams" not in result:
             return
 
+        for varName in ('width', 'height'):
+            if not self.hasVar(varName) and varName in result['streams'][0]:
+                self.setVar(varName, result['streams'][0][varName])
+
+        if self.hasVar('firstFrame') and self.hasVar('lastFrame'):
+            return
+
         tags = result['streams'][0].get("tags")
         if not tags:
             return
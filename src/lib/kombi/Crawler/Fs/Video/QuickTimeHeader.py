@@ -0,0 +1,235 @@
+import os
+import struct
+from ...Crawler import CrawlerError
+
+class QuickTimeHeaderError(CrawlerError):
+    """QuickTime Header Error."""
+
+class QuickTimeHeader(object):
+    """
+    Lightweight QuickTime/MP4 header reader.
+
+    Reads the video information straight from the "moov" atom, without
+    decoding the media (the "mdat" atom is skipped). The result is a dict
+    containing:
+        - width, height: coded resolution of the first video track
+        - codec: four character code of the video track (for instance: apcn, avc1)
+        - frameRate: average frame rate of the video track
+        - firstFrame, lastFrame: frame range based on the start timecode (tmcd
+          track, when available) and the number of video samples
+    """
+
+    # containers are the atoms that hold other atoms (the ones we need to visit)
+    __containerAtoms = set([b'moov', b'trak', b'mdia', b'minf', b'stbl'])
+
+    # maximum size for the moov atom loaded in memory
+    __maxMoovSize = 64 * 1024 * 1024
+
+    @classmethod
+    def read(cls, filePath):
+        """
+        Return a dict containing the information read from the QuickTime header.
+        """
+        try:
+            with open(filePath, 'rb') as movFile:
+                moov = cls.__loadMoov(movFile)
+                tracks = cls.__parseTracks(moov)
+
+                videoTracks = [x for x in tracks if x['handler'] == b'vide']
+                if not videoTracks:
+                    raise QuickTimeHeaderError('Cannot find a video track')
+                videoTrack = videoTracks[0]
+
+                timecodeTracks = [x for x in tracks if x['handler'] == b'tmcd']
+                startFrame = 0
+                timecodeFrameRate = None
+                if timecodeTracks:
+                    startFrame, timecodeFrameRate = cls.__readStartTimecode(movFile, timecodeTracks[0])
+        except (IOError, OSError, struct.error, IndexError, KeyError, ValueError) as err:
+            raise QuickTimeHeaderError(
+                'Cannot read the QuickTime header for "{}": {}'.format(
+                    filePath,
+                    str(err)
+                )
+            )
+
+        sampleCount = sum(x[0] for x in videoTrack['stts'])
+        duration = sum(x[0] * x[1] for x in videoTrack['stts']) or videoTrack['duration']
+        if not sampleCount or not duration or not videoTrack['timeScale']:
+            raise QuickTimeHeaderError(
+                'Cannot compute the frame rate for "{}"'.format(filePath)
+            )
+
+        frameRate = sampleCount * videoTrack['timeScale'] / float(duration)
+
+        # the start timecode is described using the frame rate of the timecode
+        # track, converting it to frames using the frame rate of the video
+        firstFrame = startFrame
+        if timecodeFrameRate and timecodeFrameRate != int(frameRate):
+            hours, remainder = divmod(startFrame, 3600 * timecodeFrameRate)
+            minutes, remainder = divmod(remainder, 60 * timecodeFrameRate)
+            seconds, frames = divmod(remainder, timecodeFrameRate)
+            rate = int(frameRate)
+            firstFrame = hours * 3600 * rate + minutes * 60 * rate + seconds * rate + frames
+
+        return {
+            'width': videoTrack['width'],
+            'height': videoTrack['height'],
+            'codec': videoTrack['codec'].decode('latin-1').strip(),
+            'frameRate': frameRate,
+            'firstFrame': firstFrame,
+            'lastFrame': firstFrame + sampleCount - 1
+        }
+
+    @classmethod
+    def __loadMoov(cls, movFile):
+        """
+        Return the contents of the moov atom.
+        """
+        movFile.seek(0, os.SEEK_END)
+        fileSize = movFile.tell()
+        offset = 0
+        while offset < fileSize:
+            movFile.seek(offset)
+            size, atomType, headerSize = cls.__readAtomHeader(movFile.read(16), 0, fileSize - offset)
+            if size < headerSize:
+                raise QuickTimeHeaderError('Invalid atom size')
+
+            if atomType == b'moov':
+                if size > cls.__maxMoovSize:
+                    raise QuickTimeHeaderError('The moov atom is too large')
+
+                movFile.seek(offset + headerSize)
+                return movFile.read(size - headerSize)
+
+            offset += size
+
+        raise QuickTimeHeaderError('Cannot find the moov atom')
+
+    @classmethod
+    def __parseTracks(cls, moov):
+        """
+        Return a list of dicts containing the information about each track.
+        """
+        tracks = []
+        for atomType, start, end in cls.__iterAtoms(moov, 0, len(moov)):
+            if atomType == b'trak':
+                track = {
+                    'handler': None,
+                    'timeScale': 0,
+                    'duration': 0,
+                    'codec': b'',
+                    'width': None,
+                    'height': None,
+                    'stts': [],
+                    'chunkOffsets': [],
+                    'timecodeFrameRate': None
+                }
+                cls.__parseTrackAtoms(moov, start, end, track)
+                tracks.append(track)
+
+        return tracks
+
+    @classmethod
+    def __parseTrackAtoms(cls, data, start, end, track):
+        """
+        Collect the information of the track atoms (recursively) into the track dict.
+        """
+        for atomType, atomStart, atomEnd in cls.__iterAtoms(data, start, end):
+            if atomType in cls.__containerAtoms:
+                cls.__parseTrackAtoms(data, atomStart, atomEnd, track)
+
+            # the media handler comes first (minf may contain a data handler)
+            elif atomType == b'hdlr' and track['handler'] is None:
+                track['handler'] = data[atomStart + 8:atomStart + 12]
+
+            elif atomType == b'mdhd':
+                version = bytearray(data[atomStart:atomStart + 1])[0]
+                if version == 1:
+                    track['timeScale'], track['duration'] = struct.unpack('>IQ', data[atomStart + 20:atomStart + 32])
+                else:
+                    track['timeScale'], track['duration'] = struct.unpack('>II', data[atomStart + 12:atomStart + 20])
+
+            elif atomType == b'stts':
+                count = struct.unpack('>I', data[atomStart + 4:atomStart + 8])[0]
+                values = struct.unpack('>{}I'.format(count * 2), data[atomStart + 8:atomStart + 8 + count * 8])
+                track['stts'] = list(zip(values[0::2], values[1::2]))
+
+            elif atomType in (b'stco', b'co64'):
+                count = struct.unpack('>I', data[atomStart + 4:atomStart + 8])[0]
+                if count:
+                    if atomType == b'stco':
+                        track['chunkOffsets'] = [struct.unpack('>I', data[atomStart + 8:atomStart + 12])[0]]
+                    else:
+                        track['chunkOffsets'] = [struct.unpack('>Q', data[atomStart + 8:atomStart + 16])[0]]
+
+            elif atomType == b'stsd':
+                cls.__parseSampleDescription(data, atomStart, track)
+
+    @classmethod
+    def __parseSampleDescription(cls, data, start, track):
+        """
+        Collect the information of the first sample description entry.
+        """
+        count = struct.unpack('>I', data[start + 4:start + 8])[0]
+        if not count:
+            return
+
+        entry = start + 8
+        track['codec'] = data[entry + 4:entry + 8]
+
+        # visual sample entry
+        if track['handler'] == b'vide':
+            track['width'], track['height'] = struct.unpack('>HH', data[entry + 32:entry + 36])
+
+        # timecode sample entry
+        elif track['handler'] == b'tmcd':
+            track['timecodeFrameRate'] = bytearray(data[entry + 32:entry + 33])[0]
+
+    @classmethod
+    def __readStartTimecode(cls, movFile, track):
+        """
+        Return a tuple containing the start frame and the frame rate of a timecode track.
+        """
+        if not track['chunkOffsets'] or not track['timecodeFrameRate']:
+            return 0, None
+
+        movFile.seek(track['chunkOffsets'][0])
+        startFrame = struct.unpack('>I', movFile.read(4))[0]
+
+        return startFrame, track['timecodeFrameRate']
+
+    @classmethod
+    def __iterAtoms(cls, data, start, end):
+        """
+        Yield a tuple (type, start, end) for each atom found in the data range.
+        """
+        offset = start
+        while offset + 8 <= end:
+            size, atomType, headerSize = cls.__readAtomHeader(data, offset, end - offset)
+            if size < headerSize or offset + size > end:
+                raise QuickTimeHeaderError(
+                    'Invalid atom size for "{}"'.format(atomType.decode('latin-1'))
+                )
+
+            yield atomType, offset + headerSize, offset + size
+            offset += size
+
+    @staticmethod
+    def __readAtomHeader(data, offset, available):
+        """
+        Return a tuple containing the size, type and header size of an atom.
+        """
+        size, atomType = struct.unpack('>I4s', data[offset:offset + 8])
+        headerSize = 8
+
+        # 64 bits size
+        if size == 1:
+            size = struct.unpack('>Q', data[offset + 8:offset + 16])[0]
+            headerSize = 16
+
+        # atom extends to the end
+        elif size == 0:
+            size = available
+
+        return size, atomType, headerSize
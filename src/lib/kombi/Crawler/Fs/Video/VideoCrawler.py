@@ -8,6 +8,8 @@ class VideoCrawler(FileCrawler):
     Abstracted video crawler.
     """
 
+    __slots__ = ()
+
     __ffprobeExecutable = os.environ.get('KOMBI_FFPROBE_EXECUTABLE', 'ffprobe')
 
     def __init__(self, *args, **kwargs):
@@ -28,11 +30,18 @@ class VideoCrawler(FileCrawler):
         """
         Return var value using lazy loading implementation for width and height.
         """
-        if self.__ffprobeExecutable and name in ('width', 'height') and name not in self.varNames():
+        if self.__ffprobeExecutable and name in ('width', 'height') and not self.hasVar(name):
             self.__computeWidthHeight()
 
         return super(VideoCrawler, self).var(name)
 
+    @classmethod
+    def lazyVarNames(cls):
+        """
+        Return a frozenset containing the names of the vars computed on demand (by var).
+        """
+        return super(VideoCrawler, cls).lazyVarNames() | frozenset(['width', 'height'])
+
     def __computeWidthHeight(self):
         """
         Query width and height using ffprobe and set them as crawler variables.
@@ -1,2 +1,3 @@
+from .QuickTimeHeader import QuickTimeHeader, QuickTimeHeaderError
 from .VideoCrawler import VideoCrawler
 from .MovCrawler import MovCrawler
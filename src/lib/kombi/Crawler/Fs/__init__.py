@@ -1,6 +1,10 @@
 from .FsCrawler import FsCrawler
 from .FileCrawler import FileCrawler
 from .DirectoryCrawler import DirectoryCrawler
+from .CrawlIndex import CrawlIndex, CrawlIndexError
+from .CrawlSnapshot import CrawlSnapshot, CrawlSnapshotError, CrawlSnapshotFormatError
+from .MediaCache import MediaCache, MediaCacheError
+from .DirectoryWatcher import DirectoryWatcher, DirectoryWatcherError, DirectoryWatcherUnsupportedError
 
 from . import Image
 from . import Lut
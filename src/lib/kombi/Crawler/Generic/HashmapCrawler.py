@@ -5,13 +5,15 @@ class HashmapCrawler(Crawler):
     Hashmap crawler to store key/value data.
     """
 
-    def __init__(self, data, parentCrawler=None):
+    __slots__ = ()
+
+    def __init__(self, data, parentCrawler=None, testResult=None):
         """
         Create a hashmap crawler.
         """
         assert isinstance(data, dict), "Invalid dict!"
 
-        super(HashmapCrawler, self).__init__("hashmap", parentCrawler)
+        super(HashmapCrawler, self).__init__("hashmap", parentCrawler, testResult)
         self.setVar('data', data.copy())
 
     def __getitem__(self, key):
@@ -56,6 +58,15 @@ class HashmapCrawler(Crawler):
         """
         return 'Hashmap{}'.format(repr(self.var('data')))
 
+    def clone(self):
+        """
+        Return a cloned instance of the crawler (the data is copied).
+        """
+        result = super(HashmapCrawler, self).clone()
+        result.setVar('data', self.var('data').copy())
+
+        return result
+
     def clear(self):
         """
         Clear the data.
@@ -1,4 +1,6 @@
-from fnmatch import fnmatch
+import os
+import re
+import fnmatch
 from .Crawler import Crawler
 
 class Matcher(object):
@@ -10,6 +12,7 @@ class Matcher(object):
         """
         Create a crawler matcher object.
         """
+        self.__compiled = None
         self.__setMatchTypes(matchTypes)
         self.__setMatchVars(matchVars)
 
@@ -35,6 +38,8 @@ class Matcher(object):
         """
         Return a boolean telling if the crawler matches.
 
+        The matcher is compiled on demand (see Matcher.compile).
+
         TODO: ideally it should be breakdown in two methods, so one that
         test and another one that actually throws an exception telling
         why it does not match.
@@ -42,50 +47,77 @@ class Matcher(object):
         assert isinstance(crawler, Crawler), \
             "Invalid crawler type!"
 
-        if not self.__matchType(crawler.var('type'), crawler):
+        compiled = self.__compiled
+        if compiled is None or compiled[0] != Crawler.registryVersion():
+            compiled = self.compile()
+
+        registryVersion, allowedTypes, varChecks = compiled
+        crawlerType = crawler.var('type')
+
+        if allowedTypes is not None and crawlerType not in allowedTypes:
             return False
 
-        for varName in self.matchVarNames():
+        for restrictedTypes, varName, patterns in varChecks:
 
             # when variable is belongs to exclusively to
             # a specific type
-            varNameParts = varName.split('=')
-            if len(varNameParts) > 1 and crawler.var('type') not in Crawler.registeredSubTypes(varNameParts[0]):
+            if restrictedTypes is not None and crawlerType not in restrictedTypes:
                 continue
 
             # checking if variable is part of the crawler
-            if varNameParts[-1] not in crawler.varNames():
+            if not crawler.hasVar(varName):
+                return False
+
+            value = os.path.normcase(str(crawler.var(varName)))
+            for pattern in patterns:
+                if pattern.match(value):
+                    break
+            else:
                 return False
 
+        return True
+
+    def compile(self):
+        """
+        Compile the matcher, returning the compiled data used by match.
+
+        The match types are resolved to a frozenset of registered type names and
+        the var values (glob syntax) to regular expressions. The compiled data is
+        recomputed automatically when the registered crawler types change.
+        """
+        registryVersion = Crawler.registryVersion()
+
+        allowedTypes = None
+        if self.matchTypes():
+            allowedTypes = set()
+            for matchType in self.matchTypes():
+                allowedTypes.update(Crawler.registeredSubTypes(matchType))
+            allowedTypes = frozenset(allowedTypes)
+
+        varChecks = []
+        for varName in self.matchVarNames():
+            restrictedTypes = None
+            varNameParts = varName.split('=')
+            if len(varNameParts) > 1:
+                restrictedTypes = frozenset(Crawler.registeredSubTypes(varNameParts[0]))
+
             matchVarValue = self.matchVar(varName)
 
             # the value can be a list of possibilities
             if not isinstance(matchVarValue, (list, tuple)):
                 matchVarValue = [matchVarValue]
 
-            foundValue = False
-            for value in matchVarValue:
-                if fnmatch(str(crawler.var(varNameParts[-1])), str(value)):
-                    foundValue = True
-                    break
-
-            if not foundValue:
-                return False
+            # same rules used by fnmatch
+            patterns = tuple(map(
+                lambda x: re.compile(fnmatch.translate(os.path.normcase(str(x)))),
+                matchVarValue
+            ))
 
-        return True
+            varChecks.append((restrictedTypes, varNameParts[-1], patterns))
 
-    def __matchType(self, crawlerType, crawler):
-        """
-        Return a boolean telling if the crawler match the type.
-        """
-        foundType = not self.matchTypes()
-        for matchType in self.matchTypes():
-            registeredTypes = Crawler.registeredSubTypes(matchType)
-            if crawlerType in registeredTypes:
-                foundType = True
-                break
+        self.__compiled = (registryVersion, allowedTypes, tuple(varChecks))
 
-        return foundType
+        return self.__compiled
 
     def __setMatchTypes(self, matchTypes):
         """
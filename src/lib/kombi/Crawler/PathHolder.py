@@ -1,20 +1,48 @@
 import os
 
+# compatibility with python 2/3
+try:
+    from sys import intern
+except ImportError:
+    pass
+
 class PathHolder(object):
     """
     Provides quick access to query information about the path.
     """
 
-    def __init__(self, path):
+    __slots__ = (
+        '__path',
+        '__basename',
+        '__name',
+        '__pathExists',
+        '__isDirectory',
+        '__size',
+        '__mtime',
+        '__inode',
+        '__device',
+        '__ext'
+    )
+
+    # on windows the stat information is part of the directory listing
+    __dirEntryStat = os.name == 'nt'
+
+    def __init__(self, path, isDirectory=None):
         """
         Create a path holder object.
+
+        The optional isDirectory can be used when that information is already
+        known, avoiding the stat call when querying it.
         """
         # lazy data
         self.__basename = None
         self.__name = None
         self.__pathExists = None
-        self.__isDirectory = None
+        self.__isDirectory = isDirectory
         self.__size = None
+        self.__mtime = None
+        self.__inode = None
+        self.__device = None
         self.__ext = None
 
         # setting path
@@ -40,7 +68,12 @@ class PathHolder(object):
         Return the file extension for the path (converts automatically to lowercase).
         """
         if self.__ext is None:
-            self.__ext = os.path.splitext(self.path())[-1][1:].lower()
+            ext = os.path.splitext(self.path())[-1][1:].lower()
+
+            # extensions are repeated across most of the paths
+            if isinstance(ext, str):
+                ext = intern(ext)
+            self.__ext = ext
 
         return self.__ext
 
@@ -49,10 +82,53 @@ class PathHolder(object):
         Return the size of the file.
         """
         if self.__size is None:
-            self.__size = os.stat(self.path()).st_size
+            self.__stat()
 
         return self.__size
 
+    def mtime(self):
+        """
+        Return the modification time of the path (seconds since the epoch).
+        """
+        seconds, nanoseconds = divmod(self.mtimeNs(), 1000000000)
+
+        # same conversion used by os.stat (st_mtime)
+        return seconds + nanoseconds * 1e-9
+
+    def mtimeNs(self):
+        """
+        Return the modification time of the path (nanoseconds since the epoch).
+
+        Prefer it over mtime when comparing modification times, since the
+        float returned by mtime cannot represent all the nanoseconds.
+        """
+        if self.__mtime is None:
+            self.__stat()
+
+        return self.__mtime
+
+    def inode(self):
+        """
+        Return the inode number of the path.
+        """
+        if self.__inode is None:
+            self.__stat()
+
+        return self.__inode
+
+    def device(self):
+        """
+        Return the id of the device containing the path.
+
+        The inode is refreshed by the same stat call, therefore querying the
+        device before the inode returns a consistent pair (the inode listed
+        for a mount point differs from the inode of the mounted directory).
+        """
+        if self.__device is None:
+            self.__stat()
+
+        return self.__device
+
     def baseName(self):
         """
         Return the base name about the path.
@@ -90,12 +166,61 @@ class PathHolder(object):
         """
         return self.__path
 
+    @classmethod
+    def fromDirEntry(cls, dirEntry):
+        """
+        Create a path holder from an os.DirEntry (returned by os.scandir).
+
+        The information cached by the entry (file type, inode and on windows
+        the whole stat) is used to avoid the stat calls when querying it.
+        Symlinks are resolved by a stat call, same as for regular path holders.
+        """
+        result = cls(dirEntry.path, dirEntry.is_dir())
+
+        # a listed entry exists unless it is a broken symlink
+        if dirEntry.is_symlink():
+            return result
+        result.__pathExists = True
+
+        if cls.__dirEntryStat:
+            stat = dirEntry.stat()
+            result.__size = stat.st_size
+            result.__mtime = cls.__statMtimeNs(stat)
+        else:
+            result.__inode = dirEntry.inode()
+
+        return result
+
     def __repr__(self):
         """
         Return a string representation for the path holder.
         """
         return "PathHolder({})".format(self.path())
 
+    def __stat(self):
+        """
+        Query the size, modification time, inode and device with a single stat call.
+
+        @private
+        """
+        stat = os.stat(self.path())
+        self.__size = stat.st_size
+        self.__mtime = self.__statMtimeNs(stat)
+        self.__pathExists = True
+
+        self.__inode = stat.st_ino
+        self.__device = stat.st_dev
+
+    @staticmethod
+    def __statMtimeNs(stat):
+        """
+        Return the modification time in nanoseconds from the stat result.
+
+        @private
+        """
+        # python 2 does not provide st_mtime_ns
+        return getattr(stat, 'st_mtime_ns', int(stat.st_mtime * 1e9))
+
     def __setPath(self, path):
         """
         Set a path to the path holder.
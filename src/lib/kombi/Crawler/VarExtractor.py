@@ -1,3 +1,4 @@
+import re
 from collections import OrderedDict
 
 class VarExtractorError(Exception):
@@ -142,8 +143,17 @@ class VarExtractor(object):
     failure you can query the method "VarExtractor.error()" to retrieve the
     exception. Also, you can print(varExtractor) instance for debugging purposes.
     The printed version includes debugging information.
+
+    The value patterns are compiled to an equivalent regex (cached per value
+    pattern), the char by char extraction is only used when the regex does
+    not match (to report the exact error) or for value patterns that cannot
+    be represented as a regex.
     """
 
+    # compiled value patterns: {valuePattern: (regex, varSpecs) or None}
+    __compiledPatterns = {}
+    __maxCompiledPatterns = 1024
+
     def __init__(self, value, valuePattern, raiseOnFail=False):
         """
         Create a var extractor object.
@@ -203,6 +213,21 @@ class VarExtractor(object):
         """
         return self.__valuePattern
 
+    @classmethod
+    def matchMany(cls, values, valuePattern):
+        """
+        Return a list of booleans telling if each value matches the value pattern.
+        """
+        compiled = cls.__compiledPattern(valuePattern)
+        result = []
+        for value in values:
+            if compiled is not None and cls.__regexVars(compiled, value) is not None:
+                result.append(True)
+            else:
+                result.append(cls(value, valuePattern).match())
+
+        return result
+
     def __repr__(self):
         """
         Return a string representation for the var extractor.
@@ -224,6 +249,22 @@ class VarExtractor(object):
         """
         Perform the extraction of the variables.
         """
+        compiled = self.__compiledPattern(self.__valuePattern)
+        if compiled is not None:
+            regexVars = self.__regexVars(compiled, self.__value)
+            if regexVars is not None:
+                for varName, isContextVar, varValue in regexVars:
+                    if isContextVar:
+                        self.__contextVarNames.append(varName)
+                    self.__vars[varName] = varValue
+                return
+
+        self.__extractByChar()
+
+    def __extractByChar(self):
+        """
+        Perform the extraction of the variables by walking through the value pattern.
+        """
         currentVar = ''
         insideVar = False
         valueCurrentIndex = 0
@@ -291,24 +332,10 @@ class VarExtractor(object):
         """
         Assign the variable value and return a new index for the current value.
         """
-        currentVar = currentVar.split(':')
-        varValueSize = 0
-        valueType = ''
-
-        # extracting the optional value type. This is defined after the optional
-        # variable size, for instance {name:2f}
-        if len(currentVar) > 1 and not currentVar[1].isdigit():
-            valueType = currentVar[1][-1]
-            # now we have extracted the type we remove it from
-            # the current var for further processing.
-            currentVar[1] = currentVar[1][:-1]
-
-        # checking if the optional value size is defined
-        if len(currentVar) > 1 and currentVar[1].isdigit():
-            varValueSize = int(currentVar[1])
+        varName, isContextVar, varValueSize, valueType = self.__parseVar(currentVar)
 
         # when value size is not defined, computing it
-        else:
+        if varValueSize is None:
             partialValue = self.__value[valueCurrentIndex:]
 
             if index + 1 < len(self.__valuePattern):
@@ -317,7 +344,7 @@ class VarExtractor(object):
 
                 if not nextValueIndex:
                     raise VarExtractorCannotFindExpectedCharError(
-                        'Cannot find char after var name {}'.format(currentVar[0]),
+                        'Cannot find char after var name {}'.format(currentVar.split(':')[0]),
                         self.__value,
                         self.__valuePattern,
                         nextChar,
@@ -337,12 +364,11 @@ class VarExtractor(object):
         )
 
         # handling context variable
-        if currentVar[0].startswith('@'):
-            currentVar[0] = currentVar[0][1:]
-            self.__contextVarNames.append(currentVar[0])
+        if isContextVar:
+            self.__contextVarNames.append(varName)
 
         # assigning variable
-        self.__vars[currentVar[0]] = finalValue
+        self.__vars[varName] = finalValue
         valueCurrentIndex += varValueSize
 
         return valueCurrentIndex
@@ -351,24 +377,170 @@ class VarExtractor(object):
         """
         Return the value for the variable.
         """
-        if valueType.lower() in ('i', 'f'):
-            result = None
-            try:
-                if valueType.lower() == 'i':
-                    result = int(value)
-                else:
-                    result = float(value)
-            except ValueError:
-                raise VarExtractorNotMatchingCharError(
-                    "Cannot cast value '{}' to numeric value".format(value),
-                    self.__value,
-                    self.__valuePattern,
-                    valueIndex,
-                    index
-                )
-            return result
+        try:
+            return self.__convertValue(valueType, value)
+        except ValueError:
+            raise VarExtractorNotMatchingCharError(
+                "Cannot cast value '{}' to numeric value".format(value),
+                self.__value,
+                self.__valuePattern,
+                valueIndex,
+                index
+            )
+
+    @staticmethod
+    def __convertValue(valueType, value):
+        """
+        Return the value converted to the value type (raises ValueError when it cannot be cast).
+        """
+        if valueType.lower() == 'i':
+            return int(value)
+        elif valueType.lower() == 'f':
+            return float(value)
         elif valueType == 'S':
             return value.upper()
         elif valueType == 's':
             return value.lower()
         return value
+
+    @staticmethod
+    def __parseVar(currentVar):
+        """
+        Return a tuple (name, isContextVar, size, type) about the var definition.
+
+        The size is None when the var does not have a fixed size.
+        """
+        currentVar = currentVar.split(':')
+        varValueSize = None
+        valueType = ''
+
+        # extracting the optional value type. This is defined after the optional
+        # variable size, for instance {name:2f}
+        if len(currentVar) > 1 and not currentVar[1].isdigit():
+            valueType = currentVar[1][-1]
+            # now we have extracted the type we remove it from
+            # the current var for further processing.
+            currentVar[1] = currentVar[1][:-1]
+
+        # checking if the optional value size is defined
+        if len(currentVar) > 1 and currentVar[1].isdigit():
+            varValueSize = int(currentVar[1])
+
+        varName = currentVar[0]
+        isContextVar = varName.startswith('@')
+        if isContextVar:
+            varName = varName[1:]
+
+        return varName, isContextVar, varValueSize, valueType
+
+    @classmethod
+    def __regexVars(cls, compiled, value):
+        """
+        Return a list of tuples (name, isContextVar, value) or None when the regex does not match.
+        """
+        regex, varSpecs = compiled
+        regexMatch = regex.match(value)
+        if regexMatch is None:
+            return None
+
+        result = []
+        for (varName, isContextVar, valueType), varValue in zip(varSpecs, regexMatch.groups()):
+            try:
+                result.append((varName, isContextVar, cls.__convertValue(valueType, varValue)))
+            except ValueError:
+                return None
+
+        return result
+
+    @classmethod
+    def __compiledPattern(cls, valuePattern):
+        """
+        Return a tuple (regex, varSpecs) for the value pattern (None when it cannot be compiled).
+        """
+        if valuePattern in cls.__compiledPatterns:
+            return cls.__compiledPatterns[valuePattern]
+
+        result = cls.__compilePattern(valuePattern)
+        if len(cls.__compiledPatterns) >= cls.__maxCompiledPatterns:
+            cls.__compiledPatterns.clear()
+        cls.__compiledPatterns[valuePattern] = result
+
+        return result
+
+    @classmethod
+    def __compilePattern(cls, valuePattern):
+        """
+        Compile the value pattern to a regex reproducing the char by char extraction.
+
+        The regex is anchored only at the start (trailing chars in the value are
+        ignored by the extraction). A char searched after a var or glob is
+        always the first occurrence of it ([^c]*(?=c)), therefore the regex
+        never backtracks to a later occurrence. Value patterns relying on
+        edge cases of the extraction (adjacent vars, unbalanced braces,
+        glob followed by a var) are not compiled.
+        """
+        regex = []
+        varSpecs = []
+        patternSize = len(valuePattern)
+        index = 0
+        while index < patternSize:
+            char = valuePattern[index]
+
+            if char == '{':
+                endIndex = valuePattern.find('}', index + 1)
+                if endIndex == -1 or '{' in valuePattern[index + 1:endIndex]:
+                    return None
+
+                try:
+                    varName, isContextVar, varValueSize, valueType = cls.__parseVar(
+                        valuePattern[index + 1:endIndex]
+                    )
+                except IndexError:
+                    return None
+
+                nextChar = valuePattern[endIndex + 1] if endIndex + 1 < patternSize else None
+
+                # fixed size (the value gets truncated at the end of the string)
+                if varValueSize is not None:
+                    if varValueSize:
+                        regex.append('(.{{{0}}}|.{{0,{1}}}\\Z)'.format(varValueSize, varValueSize - 1))
+                    else:
+                        regex.append('()')
+
+                # var at the end of the pattern
+                elif nextChar is None:
+                    regex.append('(.*)')
+
+                elif nextChar in '{}':
+                    return None
+
+                # until the first occurrence of the next char (which cannot be the first one)
+                else:
+                    escapedChar = re.escape(nextChar)
+                    regex.append('([^{0}]+)(?={0})'.format(escapedChar))
+
+                varSpecs.append((varName, isContextVar, valueType))
+                index = endIndex + 1
+                continue
+
+            elif char == '}':
+                return None
+
+            elif char == '*':
+                if index + 1 == patternSize:
+                    regex.append('.*')
+                elif valuePattern[index + 1] == '{':
+                    return None
+                else:
+                    escapedChar = re.escape(valuePattern[index + 1])
+                    regex.append('[^{0}]*(?={0})'.format(escapedChar))
+
+            elif char == '#':
+                regex.append('.')
+
+            else:
+                regex.append(re.escape(char))
+
+            index += 1
+
+        return re.compile(''.join(regex), re.DOTALL), tuple(varSpecs)
@@ -0,0 +1,393 @@
+import os
+import io
+import sys
+import pickle
+import threading
+import multiprocessing
+from collections import deque
+from multiprocessing.pool import ThreadPool
+
+class WalkerError(Exception):
+    """Walker Error."""
+
+class Walker(object):
+    """
+    Walks a crawler tree computing the children of the crawlers concurrently.
+
+    The tree is visited level by level, where the children of all non-leaf crawlers
+    found in the same level are computed in parallel using a bounded thread
+    pool. This keeps multiple filesystem requests in flight, which is specially
+    important for network file systems. The result is returned in depth-first
+    order (the same order used by a recursive walk), so it is deterministic as long
+    as the children of the crawlers are computed in a deterministic order.
+
+    Creating the crawlers is CPU bound (limited by the GIL), therefore the walk
+    can also be sharded across a pool of processes. The first levels of
+    the tree are visited by the current process until there are enough
+    non-leaf crawlers (shards), then each shard is walked by a forked
+    process (which inherits the registered crawlers and loaded resources,
+    including inline crawlers) and the crawlers found are sent back
+    pickled. The result is merged in the same depth-first order. Processes
+    are only used on python 3 when the platform supports fork.
+
+    The crawlers pointing to the same data (hardlinks and symlinks) can be
+    skipped by the walk (skipDuplicates), in that case only the first
+    crawler found for each "device" and "inode" (vars) is kept and the
+    duplicated non-leaf crawlers are not visited.
+    """
+
+    __defaultWorkers = int(os.environ.get('KOMBI_WALKER_WORKERS', 8))
+    __defaultProcesses = int(os.environ.get('KOMBI_WALKER_PROCESSES', 1))
+
+    # number of shards created per process (balancing the work
+    # across processes when the shards have different sizes)
+    __shardsPerProcess = 4
+
+    # the shards are passed to the forked processes through a
+    # global, only one sharded walk runs at the time
+    __shardLock = threading.Lock()
+
+    def __init__(self, workers=None, processes=None):
+        """
+        Create a walker object.
+        """
+        if workers is None:
+            workers = self.defaultWorkers()
+
+        if processes is None:
+            processes = self.defaultProcesses()
+
+        self.__setWorkers(workers)
+        self.__setProcesses(processes)
+
+    def workers(self):
+        """
+        Return the maximum number of threads used to compute the children.
+        """
+        return self.__workers
+
+    def processes(self):
+        """
+        Return the maximum number of processes used to walk the tree.
+        """
+        return self.__processes
+
+    def walk(self, crawler, maxDepth=None, descendFilter=None, dataFilter=None, skipDuplicates=False):
+        """
+        Return a list of all crawlers found recursively under the input crawler.
+
+        The walk can be pruned by a maximum depth (1 means only the children
+        of the input crawler), a descendFilter callable telling if the
+        children of a non-leaf crawler should be visited and a dataFilter
+        passed to Crawler.children (used to avoid creating crawlers).
+
+        When skipDuplicates is enabled the tree is visited level by level, so
+        the shallowest crawler is kept for the duplicated data (the walk is
+        not sharded across processes, since the shards cannot tell what has
+        been visited by the other ones).
+        """
+        if crawler.isLeaf() or maxDepth is not None and maxDepth < 1:
+            return []
+
+        shardedResult = {}
+        if self.processes() > 1 and self.supportsProcesses() and not skipDuplicates:
+            # visiting the first levels until there are enough shards
+            children, shards, depth = self.__computeTree(
+                crawler,
+                maxDepth,
+                descendFilter,
+                dataFilter,
+                self.processes() * self.__shardsPerProcess
+            )
+
+            if shards:
+                shardedResult = self.__walkShards(
+                    shards,
+                    None if maxDepth is None else maxDepth - depth,
+                    descendFilter,
+                    dataFilter
+                )
+        else:
+            children = self.__computeTree(
+                crawler,
+                maxDepth,
+                descendFilter,
+                dataFilter,
+                visitedIds=set() if skipDuplicates else None
+            )[0]
+
+        # flattening the tree in depth-first order
+        result = []
+        stack = [iter(children[id(crawler)])]
+        while stack:
+            for childCrawler in stack[-1]:
+                result.append(childCrawler)
+                if id(childCrawler) in children:
+                    stack.append(iter(children[id(childCrawler)]))
+                    break
+                elif id(childCrawler) in shardedResult:
+                    result.extend(shardedResult[id(childCrawler)])
+            else:
+                stack.pop()
+
+        return result
+
+    @staticmethod
+    def iterWalk(crawler, depthFirst=True, maxDepth=None, descendFilter=None, dataFilter=None, skipDuplicates=False):
+        """
+        Return a generator that yields the crawlers found recursively under the input crawler.
+
+        The crawlers are yielded as soon as they are discovered (without using
+        the thread pool). When depthFirst is enabled only the children of the
+        crawlers in the current branch are kept alive by the walk (memory
+        proportional to the depth of the tree), otherwise the tree is visited
+        in breadth-first order (memory proportional to the width of the tree).
+        The walk can be pruned the same way as walk. When skipDuplicates is
+        enabled the first crawler found (in the visiting order) is kept for
+        the duplicated data.
+        """
+        if crawler.isLeaf() or maxDepth is not None and maxDepth < 1:
+            return
+
+        visitedIds = None
+        if skipDuplicates:
+            visitedIds = set()
+            Walker.__skipDuplicates([crawler], visitedIds)
+
+        def crawlerChildren(parentCrawler):
+            childCrawlers = parentCrawler.children(dataFilter)
+            if visitedIds is not None:
+                childCrawlers = Walker.__skipDuplicates(childCrawlers, visitedIds)
+            return childCrawlers
+
+        def descend(childCrawler, depth):
+            return not childCrawler.isLeaf() and \
+                (maxDepth is None or depth < maxDepth) and \
+                (descendFilter is None or descendFilter(childCrawler))
+
+        if depthFirst:
+            stack = [iter(crawlerChildren(crawler))]
+            while stack:
+                for childCrawler in stack[-1]:
+                    yield childCrawler
+                    if descend(childCrawler, len(stack)):
+                        stack.append(iter(crawlerChildren(childCrawler)))
+                        break
+                else:
+                    stack.pop()
+        else:
+            queue = deque([(crawler, 0)])
+            while queue:
+                parentCrawler, depth = queue.popleft()
+                for childCrawler in crawlerChildren(parentCrawler):
+                    yield childCrawler
+                    if descend(childCrawler, depth + 1):
+                        queue.append((childCrawler, depth + 1))
+
+    @classmethod
+    def defaultWorkers(cls):
+        """
+        Return the default number of workers (KOMBI_WALKER_WORKERS).
+        """
+        return cls.__defaultWorkers
+
+    @classmethod
+    def defaultProcesses(cls):
+        """
+        Return the default number of processes (KOMBI_WALKER_PROCESSES).
+        """
+        return cls.__defaultProcesses
+
+    @staticmethod
+    def supportsProcesses():
+        """
+        Return a boolean telling if the walk can be sharded across processes.
+        """
+        return sys.version_info[0] >= 3 and 'fork' in multiprocessing.get_all_start_methods()
+
+    def __computeTree(self, crawler, maxDepth=None, descendFilter=None, dataFilter=None, maxLevelSize=None, visitedIds=None):
+        """
+        Return a tuple (children, level, depth) about the crawlers visited under the tree.
+
+        Children is a dict containing the children for each visited non-leaf
+        crawler (the crawler object id is used as key of the dict). When
+        maxLevelSize is supplied the walk stops once a level reaches that
+        size, returning the crawlers of the level that have not been visited
+        (level) and their depth. When visitedIds (set) is supplied the
+        duplicated crawlers are skipped.
+        """
+        if visitedIds is not None:
+            self.__skipDuplicates([crawler], visitedIds)
+
+        children = {}
+        pool = None
+        if self.workers() > 1:
+            pool = ThreadPool(self.workers())
+
+        def crawlerChildren(parentCrawler):
+            childCrawlers = parentCrawler.children(dataFilter)
+
+            # querying the identity of the children by the workers (the
+            # stat information is cached by the path holders)
+            if visitedIds is not None:
+                for childCrawler in childCrawlers:
+                    self.__dataId(childCrawler)
+
+            return childCrawlers
+
+        try:
+            level = [crawler]
+            depth = 1
+            while level:
+                if maxLevelSize is not None and len(level) >= maxLevelSize and depth > 1:
+                    break
+
+                if pool is not None and len(level) > 1:
+                    levelChildren = pool.map(crawlerChildren, level)
+                else:
+                    levelChildren = list(map(crawlerChildren, level))
+
+                nextLevel = []
+                for parentCrawler, childCrawlers in zip(level, levelChildren):
+                    # the duplicates are skipped in order (deterministic
+                    # regardless of the number of workers)
+                    if visitedIds is not None:
+                        childCrawlers = self.__skipDuplicates(childCrawlers, visitedIds)
+                    children[id(parentCrawler)] = childCrawlers
+
+                    # the children of the crawlers at the maximum depth are not visited
+                    if maxDepth is not None and depth >= maxDepth:
+                        continue
+
+                    for childCrawler in childCrawlers:
+                        if not childCrawler.isLeaf() and (descendFilter is None or descendFilter(childCrawler)):
+                            nextLevel.append(childCrawler)
+                level = nextLevel
+                depth += 1
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+        return (children, level, depth - 1)
+
+    @staticmethod
+    def __skipDuplicates(crawlers, visitedIds):
+        """
+        Return the crawlers whose data has not been visited yet (visitedIds is updated in place).
+
+        Crawlers that don't provide the "device" and "inode" vars are never skipped.
+        """
+        result = []
+        for crawler in crawlers:
+            dataId = Walker.__dataId(crawler)
+            if dataId is None:
+                result.append(crawler)
+            elif dataId not in visitedIds:
+                visitedIds.add(dataId)
+                result.append(crawler)
+
+        return result
+
+    @staticmethod
+    def __dataId(crawler):
+        """
+        Return a tuple (device, inode) identifying the data of the crawler (None when not available).
+        """
+        from .Crawler import CrawlerInvalidVarError
+
+        try:
+            return (crawler.var('device'), crawler.var('inode'))
+        except CrawlerInvalidVarError:
+            return None
+
+    def __walkShards(self, shards, maxDepth, descendFilter, dataFilter):
+        """
+        Return a dict containing the crawlers found under each shard (walked by a pool of processes).
+
+        The shard crawler object id is used as key of the dict.
+        """
+        global _shardWalk
+
+        result = {}
+        with self.__shardLock:
+            _shardWalk = (shards, self.workers(), maxDepth, descendFilter, dataFilter)
+            pool = multiprocessing.get_context('fork').Pool(min(self.processes(), len(shards)))
+            try:
+                # loading the result of each shard as soon as it is available
+                shardsData = pool.imap(_walkShard, range(len(shards)), 1)
+                for shard, shardData in zip(shards, shardsData):
+                    result[id(shard)] = pickle.loads(shardData)
+            finally:
+                _shardWalk = None
+                pool.terminate()
+                pool.join()
+
+        return result
+
+    def __setWorkers(self, workers):
+        """
+        Set the maximum number of threads used to compute the children.
+        """
+        if workers < 1:
+            raise WalkerError(
+                'Invalid number of workers: {}'.format(workers)
+            )
+
+        self.__workers = workers
+
+    def __setProcesses(self, processes):
+        """
+        Set the maximum number of processes used to walk the tree.
+        """
+        if processes < 1:
+            raise WalkerError(
+                'Invalid number of processes: {}'.format(processes)
+            )
+
+        self.__processes = processes
+
+
+# shards about the sharded walk running in the current
+# process (inherited by the forked processes)
+_shardWalk = None
+
+def _walkShard(index):
+    """
+    Return the pickled list of crawlers found under a shard (runs in the forked processes).
+    """
+    from .Crawler import Crawler
+
+    shards, workers, maxDepth, descendFilter, dataFilter = _shardWalk
+    crawlers = Walker(workers, 1).walk(shards[index], maxDepth, descendFilter, dataFilter)
+
+    # the crawler classes are pickled through their registered type names,
+    # since custom crawler classes (inline crawlers) cannot be pickled by name
+    dispatchTable = {}
+    for typeName in Crawler.registeredNames():
+        dispatchTable[Crawler.registeredType(typeName)] = _crawlerReducer(typeName)
+
+    output = io.BytesIO()
+    pickler = pickle.Pickler(output, pickle.HIGHEST_PROTOCOL)
+    pickler.dispatch_table = dispatchTable
+    pickler.dump(crawlers)
+
+    return output.getvalue()
+
+def _crawlerReducer(typeName):
+    """
+    Return a function used to pickle the crawlers of the registered type.
+    """
+    def reduceCrawler(crawler):
+        return (_createCrawler, (typeName,), crawler.__reduce_ex__(2)[2])
+
+    return reduceCrawler
+
+def _createCrawler(typeName):
+    """
+    Return an empty crawler of the registered type (the state is restored by pickle).
+    """
+    from .Crawler import Crawler
+
+    crawlerClass = Crawler.registeredType(typeName)
+    return crawlerClass.__new__(crawlerClass)
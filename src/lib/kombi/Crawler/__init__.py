@@ -3,4 +3,7 @@ from .Crawler import Crawler, CrawlerError, CrawlerInvalidVarError, CrawlerInval
 from . import Fs
 from . import Generic
 from .Matcher import Matcher
+from .CrawlerGroup import CrawlerGroup
+from .Walker import Walker, WalkerError
+from .BatchSerializer import BatchSerializer, BatchSerializerError, BatchSerializerFormatError
 from .VarExtractor import VarExtractor, VarExtractorError, VarExtractorNotMatchingCharError, VarExtractorMissingSeparatorError, VarExtractorCannotFindExpectedCharError
@@ -52,7 +52,9 @@ class SubmissionSheetTask(Task):
         """
         Get the delivery data stored in a json file in the parent folder of the client delivery folder.
         """
-        self.__deliveryData = jsonCrawler.contents()
+        # the whole document is used, the contents cached by the crawler
+        # are copied since the mattes are removed from the delivery data
+        self.__deliveryData = dict(jsonCrawler.contents())
 
     def __findMattes(self):
         """
@@ -68,7 +70,11 @@ class SubmissionSheetTask(Task):
             toDelete.append(name)
         for name in self.__deliveryData:
             internalVersion = self.__deliveryData[name].get('internalVersion')
-            self.__deliveryData[name]['matteName'] = mattes.get(internalVersion, '')
+            # the entries may be shared with the contents cached by the crawler
+            self.__deliveryData[name] = dict(
+                self.__deliveryData[name],
+                matteName=mattes.get(internalVersion, '')
+            )
         # Remove mattes from dictionary so they don't get added on their own line in the spreadsheet
         for name in toDelete:
             del self.__deliveryData[name]
@@ -124,7 +130,7 @@ class SubmissionSheetTask(Task):
         elif fieldName in self.optionNames():
             return self.templateOption(fieldName, crawler=crawler)
         # Finally, the value would be in the crawler
-        elif fieldName in crawler.varNames():
+        elif crawler.hasVar(fieldName):
             return crawler.var(fieldName)
 
     def __writeSpreadsheet(self):
@@ -1,5 +1,8 @@
+import os
 import sys
+import fnmatch
 from ..Task import Task
+from ...Crawler import Crawler, PathHolder
 from ...Crawler.Fs.FsCrawler import FsCrawler
 
 # python 2 does not support recursion in the glob syntax
@@ -19,6 +22,16 @@ class GlobTask(Task):
         "/a/b/c/file1.exr"
         "/a/b/c/file2.exr"
         ...
+
+    Options:
+        - skipDuplicated: skip the files found by more than one target (default: True)
+        - filterTypes: list of crawler types, files that cannot produce any
+          of them are not turned into crawlers (default: [], all types)
+        - excludeDirs: glob patterns for directories that are not visited by
+          "**", patterns containing "/" are matched against the full path,
+          otherwise against the name (default: [])
+        - maxDepth: maximum depth visited by "**" below the directory that
+          comes before it, 1 means only its contents (default: None, unlimited)
     """
 
     def __init__(self, *args, **kwargs):
@@ -34,27 +47,134 @@ class GlobTask(Task):
             True
         )
 
+        # options used to prune the files and directories that
+        # are visited by the glob
+        self.setOption('filterTypes', [])
+        self.setOption('excludeDirs', [])
+        self.setOption('maxDepth', None)
+
     def _perform(self):
         """
         Perform the task.
         """
+        filterTypes = self.option('filterTypes')
+        createFilter = None
+        filterClasses = None
+        if filterTypes:
+            createFilter = Crawler.createFilter(filterTypes)
+            filterClasses = tuple(
+                set(sum(map(Crawler.registeredSubclasses, filterTypes), []))
+            )
+
         result = []
         alreadyAdded = set()
         for crawler in self.crawlers():
             filePath = self.target(crawler)
 
-            for resolvedFilePath in glob(filePath, recursive=True):
+            for resolvedFilePath in self.__resolve(filePath):
                 # skipping duplicated results
                 if self.option('skipDuplicated') and resolvedFilePath in alreadyAdded:
                     continue
                 alreadyAdded.add(resolvedFilePath)
 
-                result.append(
-                    FsCrawler.createFromPath(resolvedFilePath)
+                # skipping the files that cannot produce the filter
+                # types without creating a crawler for them
+                pathHolder = PathHolder(resolvedFilePath)
+                if createFilter is not None and not createFilter(pathHolder):
+                    continue
+
+                resolvedCrawler = FsCrawler.create(pathHolder)
+                if filterClasses is not None and not isinstance(resolvedCrawler, filterClasses):
+                    continue
+
+                result.append(resolvedCrawler)
+
+        return result
+
+    def __resolve(self, filePath):
+        """
+        Return a list of paths resolved from the glob pattern.
+
+        The pruning options (excludeDirs, maxDepth) only apply to a single
+        "**" component, other patterns are resolved by glob directly. The
+        directories before "**" are resolved by glob and the paths under
+        them are collected by the crawler walk (iterGlob).
+        """
+        excludeDirs = self.option('excludeDirs')
+        maxDepth = self.option('maxDepth')
+        parts = filePath.split(os.sep)
+        if (not excludeDirs and maxDepth is None) or parts.count('**') != 1:
+            return glob(filePath, recursive=True)
+
+        index = parts.index('**')
+        patternParts = parts[index + 1:]
+
+        # relative patterns starting with "**" are resolved from the current
+        # directory (the results are kept relative, same as glob)
+        if index == 0:
+            return self.__globDirectory(os.curdir, patternParts, excludeDirs, maxDepth, relative=True)
+
+        basePattern = os.sep.join(parts[:index]) or os.sep
+        result = []
+        for baseDirectory in sorted(glob(basePattern)):
+            if os.path.isdir(baseDirectory):
+                result.extend(
+                    self.__globDirectory(baseDirectory, patternParts, excludeDirs, maxDepth)
                 )
 
         return result
 
+    @classmethod
+    def __globDirectory(cls, baseDirectory, patternParts, excludeDirs, maxDepth, relative=False):
+        """
+        Return the paths under the base directory matching the pattern parts that come after "**".
+
+        When relative is enabled the paths are returned relative to the base directory.
+        """
+        result = []
+        if maxDepth is not None and maxDepth < 1:
+            return result
+
+        # "**" at the end also matches the base directory
+        if not patternParts and not relative:
+            result.append(os.path.join(baseDirectory, ''))
+
+        # hidden directories are not visited by "**" (same as glob)
+        crawlers = FsCrawler.createFromPath(baseDirectory).iterGlob(
+            maxDepth=maxDepth,
+            excludeDirs=list(excludeDirs) + ['.*']
+        )
+
+        for crawler in crawlers:
+            relativePath = os.path.relpath(crawler.var('filePath'), baseDirectory)
+            if cls.__matchParts(relativePath.split(os.sep), patternParts):
+                result.append(relativePath if relative else os.path.join(baseDirectory, relativePath))
+
+        return result
+
+    @staticmethod
+    def __matchParts(relativeParts, patternParts):
+        """
+        Return a boolean telling if the relative path matches the pattern parts (preceded by "**").
+        """
+        # "**" at the end matches everything (except hidden names)
+        if not patternParts:
+            return not relativeParts[-1].startswith('.')
+
+        if len(relativeParts) < len(patternParts):
+            return False
+
+        matchedParts = relativeParts[len(relativeParts) - len(patternParts):]
+        for name, pattern in zip(matchedParts, patternParts):
+            # hidden names are only matched explicitly (same as glob)
+            if name.startswith('.') and not pattern.startswith('.'):
+                return False
+
+            if not fnmatch.fnmatch(name, pattern):
+                return False
+
+        return True
+
 
 # registering task
 Task.register(
@@ -1,4 +1,5 @@
 from ..Task import Task
+from ...Crawler.Fs.Image import ImageCrawler
 
 class ImageThumbnailTask(Task):
     """
@@ -30,6 +31,9 @@ class ImageThumbnailTask(Task):
         width = self.option('width')
         height = self.option('height')
 
+        # probing the resolution of all images upfront
+        ImageCrawler.prefetchVars(self.crawlers(), ['width', 'height'])
+
         result = []
         for crawler in self.crawlers():
             targetFilePath = self.target(crawler)
@@ -2,6 +2,7 @@ import os
 import subprocess
 from collections import OrderedDict
 from ..Task import Task
+from ...Crawler.Fs.Image import SequenceCrawler
 
 class FFmpegTask(Task):
     """
@@ -62,18 +63,27 @@ class FFmpegTask(Task):
         Execute ffmpeg.
         """
         crawler = sequenceCrawlers[0]
-        startFrame = crawler.var('frame')
+
+        # collapsed sequence crawler
+        if isinstance(crawler, SequenceCrawler):
+            startFrame = crawler.var('firstFrame')
+            inputSequence = os.path.join(
+                os.path.dirname(crawler.var('fullPath')),
+                crawler.tag('groupSprintf')
+            )
 
         # building an image sequence name that ffmpeg understands that is a file
         # sequence (aka foo.%04d.ext)
-        inputSequence = os.path.join(
-            os.path.dirname(crawler.var('filePath')),
-            '{name}.%0{padding}d.{ext}'.format(
-                name=crawler.var('name'),
-                padding=crawler.var('padding'),
-                ext=crawler.var('ext')
+        else:
+            startFrame = crawler.var('frame')
+            inputSequence = os.path.join(
+                os.path.dirname(crawler.var('filePath')),
+                '{name}.%0{padding}d.{ext}'.format(
+                    name=crawler.var('name'),
+                    padding=crawler.var('padding'),
+                    ext=crawler.var('ext')
+                )
             )
-        )
 
         # trying to create the directory automatically in case it
         # does not exist yet
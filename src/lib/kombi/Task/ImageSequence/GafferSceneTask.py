@@ -52,6 +52,7 @@ class GafferSceneTask(Task):
         nodes = script.children(GafferDispatch.TaskNode)
 
         for crawlerGroup in Crawler.group(crawlers):
+            frameRange = crawlerGroup.frameRange()
             for crawler in crawlerGroup:
                 # adding context variables and executing task nodes
                 with Gaffer.Context() as context:
@@ -59,10 +60,10 @@ class GafferSceneTask(Task):
                     context.set("targetFile", self.target(crawler))
 
                     # adding frame range information when available
-                    if 'frame' in crawler.varNames():
+                    if crawler.hasVar('frame'):
                         context.setFrame(crawler.var('frame'))
-                        context.set("startFrame", crawlerGroup[0].var('frame'))
-                        context.set("endFrame", crawlerGroup[-1].var('frame'))
+                        context.set("startFrame", frameRange[0])
+                        context.set("endFrame", frameRange[1])
 
                     # passing all the options to the context
                     for optionName in map(str, self.optionNames()):
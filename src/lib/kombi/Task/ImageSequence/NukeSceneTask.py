@@ -1,5 +1,5 @@
 import os
-from ..Task import Task
+from ..Task import Task, TaskError
 from ...Crawler import Crawler
 from ...Crawler.Fs import FsCrawler
 from ...Crawler.Fs.Image import ImageCrawler
@@ -11,6 +11,9 @@ except ImportError:
     from io import StringIO  # python 3
     basestring = str
 
+class NukeSceneTaskFrameRangeError(TaskError):
+    """Nuke Scene Task Frame Range Error."""
+
 class NukeSceneTask(Task):
     r"""
     Executes a nuke script by triggering the write nodes.
@@ -117,8 +120,12 @@ class NukeSceneTask(Task):
         for crawlerGroup in Crawler.group(crawlers):
             sourceCrawler = crawlerGroup[0]
             targetCrawler = FsCrawler.createFromPath(self.target(sourceCrawler))
-            startFrame = crawlerGroup[0].var('frame')
-            endFrame = crawlerGroup[-1].var('frame')
+            frameRange = crawlerGroup.frameRange()
+            if frameRange is None:
+                raise NukeSceneTaskFrameRangeError(
+                    'Cannot find the frame range for {}'.format(sourceCrawler.var('filePath'))
+                )
+            startFrame, endFrame = frameRange
 
             # setting up nuke
             nuke.root()['first_frame'].setValue(startFrame)
@@ -1,5 +1,6 @@
 from collections import OrderedDict
 from ..Task import Task
+from ...Crawler.Fs.Image import SequenceCrawler
 
 class SequenceThumbnailTask(Task):
     """
@@ -36,6 +37,11 @@ class SequenceThumbnailTask(Task):
         for targetThumbnail, thumbnailCrawlers in targetThumbnails.items():
             thumbnailCrawler = thumbnailCrawlers[int(len(thumbnailCrawlers) / 2)]
 
+            # expanding only the middle frame of a collapsed sequence
+            if isinstance(thumbnailCrawler, SequenceCrawler):
+                frames = thumbnailCrawler.frames()
+                thumbnailCrawler = thumbnailCrawler.frameCrawler(frames[int(len(frames) / 2)])
+
             # creating a thumbnail for the image sequence
             imageThumbnailTask = Task.create('imageThumbnail')
             imageThumbnailTask.add(thumbnailCrawler, targetThumbnail)
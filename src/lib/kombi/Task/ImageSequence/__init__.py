@@ -1,4 +1,4 @@
 from .FFmpegTask import FFmpegTask
 from .SequenceThumbnailTask import SequenceThumbnailTask
 from .GafferSceneTask import GafferSceneTask
-from .NukeSceneTask import NukeSceneTask
+from .NukeSceneTask import NukeSceneTask, NukeSceneTaskFrameRangeError
@@ -50,7 +50,7 @@ class SGPublishTask(Task):
         self.__publishData["description"] = self.templateOption('comment', crawler=sourceCrawler)
         self.__publishData["version_number"] = sourceCrawler.var('version')
 
-        if "_sgTask" in sourceCrawler.varNames():
+        if sourceCrawler.hasVar("_sgTask"):
             self.__publishData["task"] = sourceCrawler.var("_sgTask")
 
         publishName = self.templateOption('publishName', crawler=sourceCrawler)
@@ -77,9 +77,9 @@ class SGPublishTask(Task):
         project = sg.find_one('Project', [['name', 'is', sourceCrawler.var('job')]])
         self.__publishData['project'] = project
 
-        if "shot" in sourceCrawler.varNames() or "assetName" in sourceCrawler.varNames():
-            varName = "shot" if "shot" in sourceCrawler.varNames() else "assetName"
-            varType = "Shot" if "shot" in sourceCrawler.varNames() else "Asset"
+        if sourceCrawler.hasVar("shot") or sourceCrawler.hasVar("assetName"):
+            varName = "shot" if sourceCrawler.hasVar("shot") else "assetName"
+            varType = "Shot" if sourceCrawler.hasVar("shot") else "Asset"
 
             filters = [
                 ['code', 'is', sourceCrawler.var(varName)],
@@ -132,9 +132,9 @@ class SGPublishTask(Task):
             if not imageCrawlers:
                 # No images anywhere in the publish, nothing to use as a thumbnail
                 return
-            groups = Crawler.group(filter(lambda x: x.isSequence(), imageCrawlers))
-            if groups:
-                targetCrawler = groups[0][int(len(groups[0]) / 2)]
+            seqGroup = next(Crawler.iterGroup(filter(lambda x: x.isSequence(), imageCrawlers)), None)
+            if seqGroup:
+                targetCrawler = seqGroup[int(len(seqGroup) / 2)]
             else:
                 targetCrawler = imageCrawlers[0]
 
@@ -188,14 +188,13 @@ class SGPublishTask(Task):
         lastFrame = None
         imageSeqPath = None
         movCrawler = FsCrawler.createFromPath(movieFilePath)
-        if firstFrame in movCrawler.varNames():
+        if movCrawler.hasVar(firstFrame):
             firstFrame = movCrawler.var('firstFrame')
             lastFrame = movCrawler.var('lastFrame')
 
         imageCrawlers = sourceCrawler.globFromParent(filterTypes=[ImageCrawler])
-        groups = Crawler.group(filter(lambda x: x.isSequence(), imageCrawlers))
-        if groups:
-            seqGroup = groups[0]
+        seqGroup = next(Crawler.iterGroup(filter(lambda x: x.isSequence(), imageCrawlers)), None)
+        if seqGroup:
             imageSeqPath = os.path.join(
                 os.path.dirname(seqGroup[0].var("filePath")),
                 '{0}.%0{1}d.{2}'.format(
@@ -205,8 +204,7 @@ class SGPublishTask(Task):
                     )
                 )
             if firstFrame is None:
-                firstFrame = seqGroup[0].var('frame')
-                lastFrame = seqGroup[-1].var('frame')
+                firstFrame, lastFrame = seqGroup.frameRange()
 
         # Create the version in Shotgun
         data = {
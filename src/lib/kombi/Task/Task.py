@@ -231,7 +231,7 @@ class Task(object):
             if reporter:
                 reporter.addCrawler(outputCrawler)
 
-            for ctxVarName in filter(lambda x: x not in outputCrawler.varNames(), contextVars):
+            for ctxVarName in filter(lambda x: not outputCrawler.hasVar(x), contextVars):
                 outputCrawler.setVar(
                     ctxVarName,
                     contextVars[ctxVarName],
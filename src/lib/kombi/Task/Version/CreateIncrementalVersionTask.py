@@ -1,5 +1,4 @@
 import os
-import json
 from ..Task import Task
 from ...Template import Template
 from ...Crawler.Fs.FsCrawler import FsCrawler
@@ -62,15 +61,15 @@ class CreateIncrementalVersionTask(CreateVersionTask):
             return
 
         # getting all file paths from the current version
-        currentVersionRelativeFilePaths = list(map(
+        currentVersionRelativeFilePaths = set(map(
             lambda x: x[len(self.versionPath()) + 1:],
             self.files()
         ))
 
-        with open(incrementalVersionData) as f:
-            incrementalVersionContents = json.load(f)
+        # the data file can be big, parsing one entry at the time
+        incrementalVersionContents = FsCrawler.createFromPath(incrementalVersionData).iterItems()
 
-        for fileEntry, fileMetadata in incrementalVersionContents.items():
+        for fileEntry, fileMetadata in incrementalVersionContents:
 
             # file is part of the current version, skipping it
             if fileEntry in currentVersionRelativeFilePaths or fileMetadata['type'] in excludeTypes:
@@ -118,7 +118,7 @@ class CreateVersionTask(CreateDataTask):
 
         # Add generic info that is expected to be on the crawler
         for info in self.__genericCrawlerInfo:
-            if info in crawler.varNames():
+            if crawler.hasVar(info):
                 self.addInfo(info, crawler.var(info))
 
         # looking for the version based on the version folder name
@@ -63,9 +63,8 @@ def __runCollapsed(data, taskHolder, dataJsonFile):
     # loading input crawlers
     crawlers = []
     for taskInputFilePath in taskInputFilePaths:
-        with open(taskInputFilePath) as jsonFile:
-            serializedCrawlers = json.load(jsonFile)
-            crawlers += list(map(lambda x: Crawler.createFromJson(x), serializedCrawlers))
+        with open(taskInputFilePath, 'rb') as serializedFile:
+            crawlers += Crawler.loadMany(serializedFile.read())
 
     dispatcher = Dispatcher.createFromJson(data['dispatcher'])
     dispatchedIds = dispatcher.dispatch(
@@ -129,13 +128,8 @@ def __runExpanded(data, taskHolder, rangeStart, rangeEnd):
     outputCrawlers = taskHolder.run()
 
     # writing resulted crawlers
-    with open(taskResultFilePath, 'w') as jsonFile:
-        data = list(map(lambda x: x.toJson(), outputCrawlers))
-        json.dump(
-            data,
-            jsonFile,
-            indent=4
-        )
+    with open(taskResultFilePath, 'wb') as serializedFile:
+        serializedFile.write(Crawler.dumpMany(outputCrawlers))
 
 def __run(dataJsonFile, rangeStart=None, rangeEnd=None):
     """
@@ -301,7 +301,7 @@ class PythonLoader(Loader):
             for crawlerKey, varExtractorExpression in contents['crawlers'].items():
                 parts = crawlerKey.split('<')
                 BaseCrawler = Crawler
-                if parts > 1:
+                if len(parts) > 1:
                     BaseCrawler = Crawler.registeredType(parts[1].strip())
 
                 Crawler.register(
@@ -320,19 +320,27 @@ class PythonLoader(Loader):
             def __init__(self, *args, **kwargs):
                 super(_CustomCrawler, self).__init__(*args, **kwargs)
 
-                # assigning variables
-                self.assignVars(
-                    VarExtractor(
+                # reusing the var extractor computed by the test when
+                # the crawler is created through Crawler.create
+                varExtractor = self.testResult()
+                if not isinstance(varExtractor, VarExtractor) or \
+                        varExtractor.value() != self.var('baseName') or \
+                        varExtractor.valuePattern() != self.namePattern:
+                    varExtractor = VarExtractor(
                         self.var('baseName'),
                         self.namePattern
                     )
-                )
+
+                # assigning variables
+                self.assignVars(varExtractor)
 
             @classmethod
             def test(cls, data, parentCrawler=None):
                 # perform the tests for the base classes
                 if super(_CustomCrawler, cls).test(data, parentCrawler):
-                    return VarExtractor(data.baseName(), cls.namePattern).match()
+                    varExtractor = VarExtractor(data.baseName(), cls.namePattern)
+                    if varExtractor.match():
+                        return varExtractor
 
                 return False
 
@@ -215,7 +215,7 @@ class TaskHolder(object):
 
                     # in case the variable has already been
                     # defined in the crawler we skip it
-                    if varName in crawler.varNames():
+                    if crawler.hasVar(varName):
                         continue
 
                     crawler.setVar(
@@ -307,10 +307,9 @@ class TaskHolder(object):
             for importTemplate in self.importTemplates():
                 importFilePath = importTemplate.value(self.__vars)
 
-                # loading crawlers
-                with open(importFilePath) as f:
-                    for crawlerJson in json.load(f):
-                        crawler = Crawler.createFromJson(crawlerJson)
+                # loading crawlers (json or binary)
+                with open(importFilePath, 'rb') as f:
+                    for crawler in Crawler.loadMany(f.read()):
 
                         # the imported crawlers need to be validated
                         # by the crawler matcher
@@ -499,8 +498,8 @@ class TaskHolder(object):
                 except OSError:
                     pass
 
-                with open(exportTemplate, 'w') as f:
-                    f.write(json.dumps(list(map(lambda x: x.toJson(), result))))
+                with open(exportTemplate, 'wb') as f:
+                    f.write(Crawler.dumpMany(result))
 
         # nothing to be done
         if taskHolder.status() == 'ignore' or not taskHolder.task().crawlers():
@@ -1,5 +1,4 @@
 import os
-import json
 import platform
 import tempfile
 from ..EnvModifier import EnvModifier
@@ -119,14 +118,10 @@ class SubprocessTaskWrapper(TaskWrapper):
                 )
             )
 
-        # the task passes the result by serializing it as json, we need to load the json file
-        # and re-create the crawlers.
-        result = []
-        with open(serializedTaskFile.name) as jsonFile:
-            for serializedJsonCrawler in json.load(jsonFile):
-                result.append(
-                    Crawler.createFromJson(serializedJsonCrawler)
-                )
+        # the task passes the result by serializing it (json or binary), we need to
+        # load the file and re-create the crawlers.
+        with open(serializedTaskFile.name, 'rb') as serializedFile:
+            result = Crawler.loadMany(serializedFile.read())
 
         # removing temporary file
         os.remove(serializedTaskFile.name)
@@ -146,15 +141,13 @@ class SubprocessTaskWrapper(TaskWrapper):
         # re-creating the task from the json contents
         task = Task.createFromJson(serializedJsonTaskContent)
 
-        # running task and serializing the output as json.
-        serializedCrawlers = []
-        for crawler in task.output():
-            serializedCrawlers.append(crawler.toJson())
+        # running task and serializing the output.
+        serializedCrawlers = Crawler.dumpMany(task.output())
 
         # we use the environment to tell where the result has been serialized
         # so it can be resulted back by the parent process.
-        with open(serializedTaskFilePath, 'w') as f:
-            f.write(json.dumps(serializedCrawlers))
+        with open(serializedTaskFilePath, 'wb') as f:
+            f.write(serializedCrawlers)
 
     def __envModifier(self):
         """
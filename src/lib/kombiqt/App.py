@@ -11,6 +11,7 @@ from kombi.ProcessExecution import ProcessExecution
 from kombi.TaskHolder.Loader import Loader
 from kombi.TaskHolder.Dispatcher import Dispatcher
 from kombi.Crawler import Crawler, PathHolder
+from kombi.Crawler.Fs import DirectoryCrawler, DirectoryWatcher, DirectoryWatcherError
 from .Resource import Resource
 from .Style import Style
 
@@ -27,6 +28,15 @@ class App(QtWidgets.QApplication):
     __viewModes = ["group", "flat"]
     __runOnTheFarm = os.environ.get('KOMBIAPP_RUN_FARM', '0')
 
+    # watching the source directory makes the refresh only apply the changes
+    # found since the previous refresh (local file systems only)
+    __watchSourceDir = os.environ.get('KOMBIAPP_WATCH_SOURCE_DIR', '0')
+
+    # pruning the source directory (comma separated directory patterns
+    # that are not visited and the maximum depth visited)
+    __sourceExcludeDirs = list(filter(None, os.environ.get('KOMBIAPP_SOURCE_EXCLUDE_DIRS', '').split(',')))
+    __sourceMaxDepth = int(os.environ['KOMBIAPP_SOURCE_MAX_DEPTH']) if os.environ.get('KOMBIAPP_SOURCE_MAX_DEPTH') else None
+
     def __init__(self, argv, **kwargs):
         """
         Create a Kombi app.
@@ -36,6 +46,8 @@ class App(QtWidgets.QApplication):
         Style.apply(self)
         self.__configurationDirectory = ""
         self.__uiHintSourceColumns = []
+        self.__watchedSourceCrawler = None
+        self.__watchedSourceKey = None
         self.__buildWidgets()
 
         # getting configuration directory from the args
@@ -138,21 +150,29 @@ class App(QtWidgets.QApplication):
 
         # globbing crawlers
         crawlerList = []
-        if os.path.exists(path):
-            path = PathHolder(path)
+        crawler = self.__sourceCrawler(path)
+
+        # the whole result is sorted before showing it, therefore the
+        # threaded walk (glob) is used rather than streaming it (iterGlob)
+        crawlersFound = crawler.glob(
+            filterTypes,
+            maxDepth=self.__sourceMaxDepth,
+            excludeDirs=self.__sourceExcludeDirs
+        )
 
-        crawler = Crawler.create(path)
-        globCrawlers = crawler.glob(filterTypes)
+        # the watched crawlers are cloned since the source overrides
+        # modify the crawlers in place
+        if crawler is self.__watchedSourceCrawler:
+            crawlersFound = map(lambda x: x.clone(), crawlersFound)
 
-        # filtering the result of the glob, but now using the crawler matcher
-        # this will match the variable types.
-        for taskHolder in self.__taskHolders:
-            for crawlerFound in globCrawlers:
-                if crawlerFound in crawlerList:
-                    continue
+        for crawlerFound in crawlersFound:
 
+            # filtering the result of the glob, but now using the crawler matcher
+            # this will match the variable types.
+            for taskHolder in self.__taskHolders:
                 if taskHolder.matcher().match(crawlerFound):
                     crawlerList.append(crawlerFound)
+                    break
 
         # sorting result by name
         crawlerList.sort(key=lambda x: x.var('name').lower())
@@ -555,19 +575,14 @@ class App(QtWidgets.QApplication):
         """
         groupedCrawlers = OrderedDict()
         groupedCrawlers[None] = []
-        for crawlerList in Crawler.group(crawlers):
-            for crawler in crawlerList:
-                # group
-                if self.__checkedViewMode == 'Group' and 'group' in crawler.tagNames():
-                    groupName = crawler.tag('group')
-                    if groupName not in groupedCrawlers:
-                        groupedCrawlers[groupName] = []
-
-                    groupedCrawlers[groupName].append(crawler)
+        for crawlerList in Crawler.iterGroup(crawlers):
+            # group (each group contains all crawlers sharing the same tag)
+            if self.__checkedViewMode == 'Group' and 'group' in crawlerList[0].tagNames():
+                groupedCrawlers[crawlerList[0].tag('group')] = crawlerList
 
-                # flat
-                else:
-                    groupedCrawlers[None].append(crawler)
+            # flat
+            else:
+                groupedCrawlers[None].extend(crawlerList)
 
         return groupedCrawlers
 
@@ -1172,6 +1187,38 @@ class App(QtWidgets.QApplication):
         if selectedDirectory not in ['', '/']:
             self.__sourcePath.setText(selectedDirectory)
 
+    def __sourceCrawler(self, path):
+        """
+        Return the crawler for the source path.
+
+        When KOMBIAPP_WATCH_SOURCE_DIR is enabled the source directory crawler
+        is watched and reused by the next updates (until the path or the
+        registered crawler types change).
+        """
+        sourceKey = (path, Crawler.registryVersion())
+        if self.__watchedSourceCrawler is not None:
+            if self.__watchedSourceKey == sourceKey:
+                return self.__watchedSourceCrawler
+
+            self.__watchedSourceCrawler.unwatch()
+            self.__watchedSourceCrawler = None
+            self.__watchedSourceKey = None
+
+        if os.path.exists(path):
+            path = PathHolder(path)
+
+        crawler = Crawler.create(path)
+        if self.__watchSourceDir == '1' and isinstance(crawler, DirectoryCrawler) and DirectoryWatcher.isSupported():
+            try:
+                crawler.watch()
+            except DirectoryWatcherError:
+                traceback.print_exc()
+            else:
+                self.__watchedSourceCrawler = crawler
+                self.__watchedSourceKey = sourceKey
+
+        return crawler
+
     def __onRefreshSourceDir(self):
         """
         Slot triggered when refresh button from source tree is triggered.
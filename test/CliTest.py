@@ -64,6 +64,32 @@ class CliTest(BaseTestCase):
             if not fnmatch(outputLine, line):
                 self.assertEqual(outputLine, line)
 
+    def testSnapshot(self):
+        """
+        Test that only the crawlers that changed since the snapshot are dispatched.
+        """
+        resource = Resource.get()
+        resource.load(self.__taskPath)
+
+        snapshotFile = os.path.join(BaseTestCase.tempDirectory(), "cliSnapshot", "snapshot.bin")
+        outputs = []
+        for _ in range(2):
+            outputStream = io.StringIO()
+            Cli().run(
+                (
+                    self.__jsonConfig,
+                    BaseTestCase.dataTestsDirectory(),
+                    '--snapshot',
+                    snapshotFile
+                ),
+                outStream=outputStream
+            )
+            outputs.append(outputStream.getvalue())
+
+        self.assertEqual(len(outputs[0].strip().split('\n')), len(self.__output.strip().split('\n')))
+        self.assertEqual(outputs[1], '')
+        self.assertTrue(os.path.exists(snapshotFile))
+
 
 if __name__ == "__main__":
     unittest.main()
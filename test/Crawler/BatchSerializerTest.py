@@ -0,0 +1,75 @@
+import os
+import json
+import unittest
+from ..BaseTestCase import BaseTestCase
+from kombi.Crawler import Crawler
+from kombi.Crawler import BatchSerializer, BatchSerializerFormatError
+from kombi.Crawler.Fs import FsCrawler
+
+class BatchSerializerTest(BaseTestCase):
+    """Test the batch serialization of crawlers."""
+
+    __dir = os.path.join(BaseTestCase.dataTestsDirectory(), "glob")
+
+    def testRoundTrip(self):
+        """
+        Test that the binary serialization preserves the vars, context vars and tags.
+        """
+        crawlers = FsCrawler.createFromPath(self.__dir).glob()
+        crawlers[0].setVar('negative', -12345, True)
+        crawlers[0].setVar('custom', {'a': [1.5, None, True]})
+        crawlers[0].setTag('group', 'test')
+
+        data = Crawler.dumpMany(crawlers, binary=True)
+        self.assertTrue(BatchSerializer.isBinary(data))
+
+        result = Crawler.loadMany(data)
+        self.assertEqual(len(result), len(crawlers))
+        for crawler, loadedCrawler in zip(crawlers, result):
+            self.assertIs(type(crawler), type(loadedCrawler))
+            self.assertCountEqual(crawler.varNames(), loadedCrawler.varNames())
+            self.assertCountEqual(crawler.contextVarNames(), loadedCrawler.contextVarNames())
+            self.assertCountEqual(crawler.tagNames(), loadedCrawler.tagNames())
+            for varName in crawler.varNames():
+                self.assertEqual(crawler.var(varName), loadedCrawler.var(varName))
+            for tagName in crawler.tagNames():
+                self.assertEqual(crawler.tag(tagName), loadedCrawler.tag(tagName))
+
+    def testJsonFormat(self):
+        """
+        Test that the json format is still supported by loadMany.
+        """
+        crawlers = FsCrawler.createFromPath(self.__dir).glob()
+
+        data = Crawler.dumpMany(crawlers, binary=False)
+        self.assertFalse(BatchSerializer.isBinary(data))
+        self.assertEqual(
+            list(map(lambda x: x.var('fullPath'), Crawler.loadMany(data))),
+            list(map(lambda x: x.var('fullPath'), crawlers))
+        )
+
+        # the data created by the previous json transport
+        data = json.dumps(list(map(lambda x: x.toJson(), crawlers)))
+        self.assertEqual(len(Crawler.loadMany(data)), len(crawlers))
+
+    def testBinarySize(self):
+        """
+        Test that the binary format is smaller than the json format.
+        """
+        crawlers = FsCrawler.createFromPath(self.__dir).glob()
+        self.assertLess(
+            len(Crawler.dumpMany(crawlers, binary=True)),
+            len(Crawler.dumpMany(crawlers, binary=False))
+        )
+
+    def testInvalidData(self):
+        """
+        Test that an invalid binary version raises an exception.
+        """
+        data = bytearray(Crawler.dumpMany([], binary=True))
+        data[len(BatchSerializer.magic)] = 255
+        self.assertRaises(BatchSerializerFormatError, BatchSerializer.load, bytes(data))
+
+
+if __name__ == "__main__":
+    unittest.main()
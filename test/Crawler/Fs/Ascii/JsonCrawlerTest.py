@@ -37,6 +37,54 @@ class JsonCrawlerTest(BaseTestCase):
         }
         self.assertEqual(crawler.contents(), testData)
 
+    def testJsonPartialContents(self):
+        """
+        Test that the members of a json file are queried without parsing the whole file.
+        """
+        crawler = Crawler.create(PathHolder(self.__jsonFile))
+        self.assertEqual(
+            crawler.queryKeys(['testDict', 'testString', 'missing']),
+            {"testDict": {"key": "value", "number": 1}, "testString": "blah"}
+        )
+        self.assertEqual(
+            list(map(lambda x: x[0], crawler.iterItems())),
+            ["testList", "testDict", "testString"]
+        )
+        self.assertFalse(crawler.isParsed())
+
+        # the parsed contents are shared with the clones
+        clonedCrawler = crawler.clone()
+        self.assertIs(crawler.contents(), clonedCrawler.contents())
+        self.assertTrue(clonedCrawler.isParsed())
+        self.assertEqual(clonedCrawler.queryKeys(['testString']), {"testString": "blah"})
+
+    def testJsonPartialContentsDuplicatedKeys(self):
+        """
+        Test that the queried keys resolve to the same values as the parsed contents.
+        """
+        jsonFile = os.path.join(self.tempDirectory(), "duplicatedKeys.json")
+        with open(jsonFile, "w") as f:
+            f.write('{"a": 1, "b": 2, "a": 3}')
+
+        crawler = Crawler.create(PathHolder(jsonFile))
+        self.assertEqual(crawler.queryKeys(['a', 'b']), {"a": 3, "b": 2})
+        self.assertEqual(crawler.queryKeys(['a']), {"a": 3})
+        self.assertFalse(crawler.isParsed())
+        self.assertEqual(crawler.queryKeys(['a', 'b']), crawler.contents())
+
+    def testJsonMappedContents(self):
+        """
+        Test the access to the bytes and lines of the file.
+        """
+        crawler = Crawler.create(PathHolder(self.__jsonFile))
+        with open(self.__jsonFile, 'rb') as f:
+            data = f.read()
+
+        with crawler.mappedContents() as mappedData:
+            self.assertEqual(mappedData[:], data)
+        with open(self.__jsonFile, 'r') as f:
+            self.assertEqual(''.join(crawler.iterLines()), f.read())
+
 
 if __name__ == "__main__":
     unittest.main()
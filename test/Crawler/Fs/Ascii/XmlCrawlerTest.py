@@ -34,6 +34,22 @@ class XmlCrawlerTest(BaseTestCase):
         self.assertEqual(crawler.queryTag('{TestNamespace}testD1', ignoreNameSpace=False)[0], "1 2 3")
         self.assertEqual(crawler.queryTag('testB')[1]['id'], "123")
 
+    def testXmlQueryTags(self):
+        """
+        Test that multiple tags are queried at once.
+        """
+        crawler = FsCrawler.createFromPath(self.__xmlFile)
+        result = crawler.queryTags(['testD1', 'testB', 'testA'])
+        self.assertEqual(sorted(result.keys()), ['testA', 'testB', 'testD1'])
+        self.assertEqual(result['testD1'][0], "1 2 3")
+        self.assertEqual(result['testB'][1]['id'], "123")
+        self.assertEqual(result['testA'][0].strip(), "")
+
+        # the parsed tags are shared with the clones
+        self.assertIs(crawler.clone().queryTag('testB')[1], result['testB'][1])
+        self.assertRaises(ValueError, crawler.queryTags, ['testC', 'testE'])
+        self.assertRaises(ValueError, crawler.queryTag, 'testD1', False)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,66 @@
+import os
+import time
+import unittest
+from ...BaseTestCase import BaseTestCase
+from kombi.Crawler.Fs import FsCrawler
+from kombi.Crawler.Fs import CrawlIndex
+
+class CrawlIndexTest(BaseTestCase):
+    """Test the crawl index."""
+
+    __dir = os.path.join(BaseTestCase.tempDirectory(), "crawlIndex")
+    __cacheDir = os.path.join(BaseTestCase.tempDirectory(), "crawlIndexCache")
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Create the directory tree used by the tests.
+        """
+        for dirName in ("a", os.path.join("a", "b")):
+            os.makedirs(os.path.join(cls.__dir, dirName))
+            for fileName in ("test.txt", "test.json", "test.0001.exr"):
+                open(os.path.join(cls.__dir, dirName, fileName), "w").close()
+
+    def testCrawlIndexGlob(self):
+        """
+        Test that globbing through the index returns the same crawlers.
+        """
+        crawler = FsCrawler.createFromPath(self.__dir)
+        expected = list(map(lambda x: (x.var('filePath'), x.var('type')), crawler.glob()))
+
+        for _ in range(2):
+            crawlIndex = CrawlIndex(self.__cacheDir)
+            crawler = FsCrawler.createFromPath(self.__dir, crawlIndex=crawlIndex)
+            self.assertIs(crawler.crawlIndex(), crawlIndex)
+            result = list(map(lambda x: (x.var('filePath'), x.var('type')), crawler.glob()))
+            self.assertEqual(result, expected)
+            crawlIndex.close()
+
+        self.assertTrue(os.path.exists(os.path.join(self.__cacheDir, "crawlIndex.sqlite3")))
+
+    def testCrawlIndexInvalidation(self):
+        """
+        Test that the index is only used when the directory has not changed.
+        """
+        crawlIndex = CrawlIndex(self.__cacheDir)
+        crawler = FsCrawler.createFromPath(os.path.join(self.__dir, "a"), crawlIndex=crawlIndex)
+        crawler.children()
+
+        def __computeChildren():
+            raise AssertionError("directory should not be listed")
+
+        children = crawlIndex.children(crawler, __computeChildren)
+        self.assertEqual(len(children), 4)
+        self.assertEqual(children[0].var('type'), 'directory')
+        self.assertEqual(children[1].var('frame'), 1)
+
+        # changing the directory contents
+        time.sleep(0.01)
+        open(os.path.join(self.__dir, "a", "test.0002.exr"), "w").close()
+        self.assertEqual(len(crawler.children()), 5)
+        self.assertEqual(len(crawlIndex.children(crawler, __computeChildren)), 5)
+        crawlIndex.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
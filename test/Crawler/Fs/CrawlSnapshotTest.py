@@ -0,0 +1,83 @@
+import os
+import time
+import shutil
+import unittest
+from ...BaseTestCase import BaseTestCase
+from kombi.Crawler import Crawler, BatchSerializer
+from kombi.Crawler.Fs import FsCrawler
+from kombi.Crawler.Fs import CrawlSnapshot
+from kombi.Crawler.Fs import CrawlSnapshotFormatError
+
+class CrawlSnapshotTest(BaseTestCase):
+    """Test the crawl snapshot."""
+
+    __dir = os.path.join(BaseTestCase.tempDirectory(), "crawlSnapshot")
+    __snapshotFile = os.path.join(BaseTestCase.tempDirectory(), "crawlSnapshotData", "snapshot.bin")
+
+    def testCrawlSnapshotDiff(self):
+        """
+        Test that the added, removed and modified crawlers are detected between two crawls.
+        """
+        for dirName in ("a", os.path.join("a", "b")):
+            os.makedirs(os.path.join(self.__dir, dirName))
+            for fileName in ("test.txt", "test.json", "test.0001.exr"):
+                open(os.path.join(self.__dir, dirName, fileName), "w").close()
+
+        crawlers = FsCrawler.createFromPath(self.__dir).glob()
+        snapshot = CrawlSnapshot.create(crawlers)
+        self.assertEqual(len(snapshot), len(crawlers))
+        self.assertEqual(snapshot.diff(CrawlSnapshot.create(crawlers)), ([], [], []))
+
+        # round-trip through the file
+        snapshot.save(self.__snapshotFile)
+        loadedSnapshot = CrawlSnapshot.load(self.__snapshotFile)
+        self.assertCountEqual(loadedSnapshot.paths(), snapshot.paths())
+        self.assertEqual(loadedSnapshot.diff(snapshot), ([], [], []))
+        self.assertEqual(loadedSnapshot.crawlerType(crawlers[0].var('fullPath')), crawlers[0].var('type'))
+        self.assertEqual(len(CrawlSnapshot.load(self.__snapshotFile + ".missing")), 0)
+        self.assertRaises(CrawlSnapshotFormatError, CrawlSnapshot.loads, b'invalid')
+
+        # the snapshot is stored in the binary batch format
+        self.assertTrue(BatchSerializer.isBinary(snapshot.dump()))
+        self.assertRaises(CrawlSnapshotFormatError, CrawlSnapshot.loads, Crawler.dumpMany(crawlers, binary=True))
+
+        # changing the tree
+        time.sleep(0.01)
+        modifiedFile = os.path.join(self.__dir, "a", "test.txt")
+        with open(modifiedFile, "w") as f:
+            f.write("modified")
+        removedFile = os.path.join(self.__dir, "a", "b", "test.json")
+        os.remove(removedFile)
+        addedFile = os.path.join(self.__dir, "a", "b", "test.0002.exr")
+        open(addedFile, "w").close()
+
+        newSnapshot = CrawlSnapshot.create(FsCrawler.createFromPath(self.__dir).glob())
+        self.assertEqual(
+            newSnapshot.diff(loadedSnapshot),
+            ([addedFile], [removedFile], [modifiedFile])
+        )
+
+    def testCrawlSnapshotLazyVars(self):
+        """
+        Test that the digest does not depend on the vars computed on demand.
+        """
+        directory = os.path.join(self.tempDirectory(), "crawlSnapshotLazyVars")
+        os.makedirs(directory)
+        shutil.copy(os.path.join(self.dataTestsDirectory(), "test.png"), directory)
+
+        crawler = FsCrawler.createFromPath(os.path.join(directory, "test.png"))
+        digest = CrawlSnapshot.digest(crawler)
+        self.assertFalse(crawler.hasVar('width'))
+        self.assertIn('width', crawler.lazyVarNames())
+
+        crawler.var('width')
+        self.assertTrue(crawler.hasVar('width'))
+        self.assertEqual(CrawlSnapshot.digest(crawler), digest)
+
+        # assigned vars are part of the digest
+        crawler.setVar('custom', 1)
+        self.assertNotEqual(CrawlSnapshot.digest(crawler), digest)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -40,6 +40,70 @@ class DirectoryCrawlerTest(BaseTestCase):
         crawlerPaths = map(lambda x: x.var("filePath"), crawler.children())
         self.assertNotIn(os.path.join(self.__dir, "bad file.txt"), crawlerPaths)
 
+    def testChildrenStat(self):
+        """
+        Test that the path holders of the children provide the stat information.
+        """
+        crawler = Crawler.create(PathHolder(self.dataTestsDirectory()))
+        for childCrawler in crawler.children():
+            pathHolder = childCrawler.pathHolder()
+            stat = os.stat(pathHolder.path())
+            self.assertTrue(pathHolder.exists())
+            self.assertEqual(pathHolder.isDirectory(), os.path.isdir(pathHolder.path()))
+            self.assertEqual(pathHolder.inode(), stat.st_ino)
+            self.assertEqual(pathHolder.mtime(), stat.st_mtime)
+            self.assertEqual(pathHolder.mtimeNs(), getattr(stat, 'st_mtime_ns', pathHolder.mtimeNs()))
+            if not pathHolder.isDirectory():
+                self.assertEqual(pathHolder.size(), stat.st_size)
+
+            # the inode and device are provided as vars (not inherited by the children)
+            self.assertEqual(childCrawler.var("device"), stat.st_dev)
+            self.assertEqual(childCrawler.var("inode"), stat.st_ino)
+            self.assertNotIn("inode", childCrawler.varNames())
+
+    @unittest.skipUnless(hasattr(os, "symlink") and hasattr(os, "link"), "requires symlinks and hardlinks")
+    def testSymlinksAndHardlinks(self):
+        """
+        Test that symlink loops are not followed and the duplicated data can be skipped.
+        """
+        rootDir = os.path.join(self.tempDirectory(), "directoryLinks")
+        os.makedirs(os.path.join(rootDir, "a", "b"))
+        os.makedirs(os.path.join(rootDir, "c"))
+        open(os.path.join(rootDir, "a", "test.txt"), "w").close()
+        os.link(os.path.join(rootDir, "a", "test.txt"), os.path.join(rootDir, "c", "test.txt"))
+        os.symlink(os.path.join(rootDir, "a"), os.path.join(rootDir, "a", "b", "loop"))
+        os.symlink(os.path.join(rootDir, "a"), os.path.join(rootDir, "c", "alias"))
+
+        crawler = Crawler.create(PathHolder(rootDir))
+        crawlerPaths = [
+            "a",
+            "a/b",
+            "a/b/loop",
+            "a/test.txt",
+            "c",
+            "c/alias",
+            "c/alias/b",
+            "c/alias/b/loop",
+            "c/alias/test.txt",
+            "c/test.txt"
+        ]
+        for workers in (1, 4):
+            crawlers = crawler.glob(useCache=False, workers=workers)
+            self.assertEqual(
+                list(map(lambda x: os.path.relpath(x.var("filePath"), rootDir).replace(os.sep, "/"), crawlers)),
+                crawlerPaths
+            )
+        self.assertTrue(crawlers[2].isLoop())
+        self.assertEqual(crawlers[2].children(), [])
+        self.assertFalse(crawlers[5].isLoop())
+
+        # skipping the duplicated data
+        for crawlers in (crawler.glob(skipDuplicates=True), list(crawler.iterGlob(skipDuplicates=True))):
+            self.assertEqual(
+                list(map(lambda x: os.path.relpath(x.var("filePath"), rootDir).replace(os.sep, "/"), crawlers)),
+                ["a", "a/b", "a/test.txt", "c"]
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,156 @@
+import os
+import shutil
+import unittest
+from ...BaseTestCase import BaseTestCase
+from kombi.Crawler.Fs import FsCrawler
+from kombi.Crawler.Fs import DirectoryWatcher
+
+@unittest.skipUnless(DirectoryWatcher.isSupported(), "inotify is not available")
+class DirectoryWatcherTest(BaseTestCase):
+    """Test the directory watcher."""
+
+    __dir = os.path.join(BaseTestCase.tempDirectory(), "directoryWatcher")
+
+    def setUp(self):
+        """
+        Create the directory tree used by the tests.
+        """
+        for dirName in ("a", os.path.join("a", "b")):
+            os.makedirs(os.path.join(self.__dir, dirName))
+            for fileName in ("test.txt", "test.json", "test.0001.exr"):
+                open(os.path.join(self.__dir, dirName, fileName), "w").close()
+
+    def tearDown(self):
+        """
+        Remove the directory tree used by the tests.
+        """
+        shutil.rmtree(self.__dir)
+
+    def testWatchedGlob(self):
+        """
+        Test that the glob of a watched directory follows the changes under it.
+        """
+        crawler = FsCrawler.createFromPath(self.__dir)
+        crawler.watch()
+        self.assertTrue(crawler.isWatched())
+        self.assertEqual(self.__globResult(crawler), self.__expectedResult())
+
+        # unchanged tree returns the cached crawlers
+        self.assertIs(crawler.glob()[0], crawler.glob()[0])
+
+        # created files and directories
+        open(os.path.join(self.__dir, "a", "new.txt"), "w").close()
+        os.makedirs(os.path.join(self.__dir, "c", "d"))
+        open(os.path.join(self.__dir, "c", "d", "test.0002.exr"), "w").close()
+        self.assertEqual(self.__globResult(crawler), self.__expectedResult())
+
+        # renamed files and directories
+        os.rename(
+            os.path.join(self.__dir, "a", "test.txt"),
+            os.path.join(self.__dir, "a", "renamed.txt")
+        )
+        os.rename(
+            os.path.join(self.__dir, "a", "b"),
+            os.path.join(self.__dir, "c", "b")
+        )
+        self.assertEqual(self.__globResult(crawler), self.__expectedResult())
+
+        # files created under a directory moved into the tree are also watched
+        open(os.path.join(self.__dir, "c", "b", "late.json"), "w").close()
+        self.assertEqual(self.__globResult(crawler), self.__expectedResult())
+
+        # removed files and directories
+        os.remove(os.path.join(self.__dir, "a", "new.txt"))
+        shutil.rmtree(os.path.join(self.__dir, "c"))
+        self.assertEqual(self.__globResult(crawler), self.__expectedResult())
+
+        # filtering the watched result
+        self.assertEqual(
+            list(map(lambda x: x.var('filePath'), crawler.glob(['txt']))),
+            [os.path.join(self.__dir, "a", "renamed.txt")]
+        )
+
+        crawler.unwatch()
+        self.assertFalse(crawler.isWatched())
+
+    def testWrittenFiles(self):
+        """
+        Test that the crawlers of the files are created again once they are written.
+        """
+        crawler = FsCrawler.createFromPath(self.__dir)
+        crawler.watch()
+
+        filePath = os.path.join(self.__dir, "a", "test.txt")
+        self.assertEqual(self.__fileCrawler(crawler, filePath).pathHolder().size(), 0)
+        with open(filePath, "a") as f:
+            f.write("written")
+        self.assertEqual(self.__fileCrawler(crawler, filePath).pathHolder().size(), 7)
+        crawler.unwatch()
+
+    @unittest.skipUnless(hasattr(os, "symlink"), "requires symlinks")
+    def testSymlinkLoop(self):
+        """
+        Test that symlink loops created under a watched directory are not followed.
+        """
+        crawler = FsCrawler.createFromPath(self.__dir)
+        crawler.watch()
+        os.symlink(self.__dir, os.path.join(self.__dir, "a", "loop"))
+        self.assertEqual(self.__globResult(crawler), self.__expectedResult())
+        crawler.unwatch()
+
+    @unittest.skipUnless(hasattr(os, "symlink"), "requires symlinks")
+    def testSymlinkedDirectory(self):
+        """
+        Test that the changes are reported for all paths reaching the same directory.
+        """
+        os.symlink(os.path.join(self.__dir, "a", "b"), os.path.join(self.__dir, "link"))
+        crawler = FsCrawler.createFromPath(self.__dir)
+        crawler.watch()
+
+        # the directory is reached through both paths
+        open(os.path.join(self.__dir, "a", "b", "new.txt"), "w").close()
+        self.assertEqual(self.__globResult(crawler), self.__expectedResult())
+        self.assertIn(
+            (os.path.join(self.__dir, "link", "new.txt"), "txt"),
+            self.__globResult(crawler)
+        )
+
+        # removing one of the paths keeps watching the other
+        os.remove(os.path.join(self.__dir, "link"))
+        self.assertEqual(self.__globResult(crawler), self.__expectedResult())
+        open(os.path.join(self.__dir, "a", "b", "late.txt"), "w").close()
+        self.assertEqual(self.__globResult(crawler), self.__expectedResult())
+        crawler.unwatch()
+
+    def testCloneIsNotWatched(self):
+        """
+        Test that cloning a watched directory does not share the watcher.
+        """
+        crawler = FsCrawler.createFromPath(self.__dir)
+        crawler.watch()
+        self.assertFalse(crawler.clone().isWatched())
+        crawler.unwatch()
+
+    def __expectedResult(self):
+        """
+        Return the result of crawling the directory from scratch.
+        """
+        return self.__globResult(FsCrawler.createFromPath(self.__dir))
+
+    @staticmethod
+    def __fileCrawler(crawler, filePath):
+        """
+        Return the crawler found by glob for the file path.
+        """
+        return list(filter(lambda x: x.var('filePath') == filePath, crawler.glob()))[0]
+
+    @staticmethod
+    def __globResult(crawler):
+        """
+        Return a list of tuples (filePath, type) for the crawlers found by glob.
+        """
+        return list(map(lambda x: (x.var('filePath'), x.var('type')), crawler.glob()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,10 +5,13 @@ from kombi.Crawler import Crawler
 from kombi.Crawler.Fs import FsCrawler
 from kombi.Crawler.Fs import FileCrawler
 from kombi.Crawler.PathHolder import PathHolder
+from kombi.Crawler.Walker import Walker
 from kombi.Crawler.Fs.Render import ExrRenderCrawler
 from kombi.Crawler.Fs.Image import ExrCrawler
 from kombi.Crawler.Crawler import CrawlerInvalidVarError
 from kombi.Crawler.Crawler import CrawlerInvalidTagError
+from kombi.Crawler import Matcher
+from kombi.Template import Template, TemplateVarNotFoundError
 
 class FsCrawlerTest(BaseTestCase):
     """Test Directory crawler."""
@@ -60,6 +63,131 @@ class FsCrawlerTest(BaseTestCase):
         otherCrawlerPaths = list(map(lambda x: x.var("filePath"), otherCrawlers))
         self.assertCountEqual(crawlerPaths, otherCrawlerPaths)
 
+    def testFsCrawlerGlobWorkers(self):
+        """
+        Test that the glob returns the same result regardless of the number of workers.
+        """
+        rootDir = os.path.join(self.tempDirectory(), "globWorkers")
+        for dirName in ("a", os.path.join("a", "b"), os.path.join("a", "b", "c"), "d"):
+            os.makedirs(os.path.join(rootDir, dirName))
+            for fileName in ("test.txt", "test.json"):
+                open(os.path.join(rootDir, dirName, fileName), "w").close()
+
+        crawler = Crawler.create(PathHolder(rootDir))
+        crawlerPaths = list(map(lambda x: x.var("filePath"), crawler.glob(workers=1)))
+        self.assertCountEqual(crawlerPaths, self.collectFiles(rootDir))
+
+        # depth-first order sorted by name
+        self.assertEqual(crawlerPaths[:4], [
+            os.path.join(rootDir, "a"),
+            os.path.join(rootDir, "a", "b"),
+            os.path.join(rootDir, "a", "b", "c"),
+            os.path.join(rootDir, "a", "b", "c", "test.json")
+        ])
+
+        for workers in (2, 8):
+            crawlers = crawler.glob(useCache=False, workers=workers)
+            self.assertEqual(list(map(lambda x: x.var("filePath"), crawlers)), crawlerPaths)
+
+        crawlers = crawler.glob(filterTypes=["txt"], useCache=False, workers=4)
+        self.assertEqual(
+            list(map(lambda x: x.var("filePath"), crawlers)),
+            list(filter(lambda x: x.endswith(".txt"), crawlerPaths))
+        )
+
+    @unittest.skipUnless(Walker.supportsProcesses(), "requires forked processes")
+    def testFsCrawlerGlobProcesses(self):
+        """
+        Test that the glob sharded across processes returns the same result as the threaded one.
+        """
+        rootDir = os.path.join(self.tempDirectory(), "globProcesses")
+        for dirName in ("a", os.path.join("a", "b"), os.path.join("a", "b", "c"), "d", os.path.join("d", "e")):
+            os.makedirs(os.path.join(rootDir, dirName))
+            for fileName in ("test.txt", "test.json"):
+                open(os.path.join(rootDir, dirName, fileName), "w").close()
+
+        crawler = Crawler.create(PathHolder(rootDir))
+        for kwargs in ({}, {"filterTypes": ["txt"], "maxDepth": 2}):
+            crawlers = crawler.glob(useCache=False, workers=1, **kwargs)
+            otherCrawlers = crawler.glob(useCache=False, workers=1, processes=2, **kwargs)
+            self.assertEqual(
+                list(map(lambda x: (x.var("filePath"), x.var("type")), otherCrawlers)),
+                list(map(lambda x: (x.var("filePath"), x.var("type")), crawlers))
+            )
+
+    def testFsCrawlerIterGlob(self):
+        """
+        Test that iterGlob yields the same crawlers found by glob.
+        """
+        rootDir = os.path.join(self.tempDirectory(), "iterGlob")
+        for dirName in ("a", os.path.join("a", "b"), "c"):
+            os.makedirs(os.path.join(rootDir, dirName))
+            for fileName in ("test.txt", "test.json"):
+                open(os.path.join(rootDir, dirName, fileName), "w").close()
+
+        crawler = Crawler.create(PathHolder(rootDir))
+        crawlerPaths = list(map(lambda x: x.var("filePath"), crawler.glob()))
+
+        crawlers = crawler.iterGlob()
+        self.assertNotIsInstance(crawlers, list)
+        self.assertEqual(list(map(lambda x: x.var("filePath"), crawlers)), crawlerPaths)
+
+        crawlers = list(crawler.iterGlob(depthFirst=False))
+        self.assertCountEqual(list(map(lambda x: x.var("filePath"), crawlers)), crawlerPaths)
+        self.assertEqual(crawlers[0].var("filePath"), os.path.join(rootDir, "a"))
+        self.assertEqual(crawlers[1].var("filePath"), os.path.join(rootDir, "c"))
+
+        crawlers = crawler.iterGlob(filterTypes=["json"])
+        self.assertEqual(
+            list(map(lambda x: x.var("filePath"), crawlers)),
+            list(filter(lambda x: x.endswith(".json"), crawlerPaths))
+        )
+
+    def testFsCrawlerPrunedGlob(self):
+        """
+        Test pruning the glob by depth, excluded directories and descend filter.
+        """
+        rootDir = os.path.join(self.tempDirectory(), "prunedGlob")
+        for dirName in ("a", os.path.join("a", "b"), os.path.join("a", "cache"), "cache", "c"):
+            os.makedirs(os.path.join(rootDir, dirName))
+            for fileName in ("test.txt", "test.json"):
+                open(os.path.join(rootDir, dirName, fileName), "w").close()
+
+        def relativePaths(crawlers):
+            return list(map(lambda x: os.path.relpath(x.var("filePath"), rootDir), crawlers))
+
+        options = [
+            ({'maxDepth': 1}, ['a', 'c', 'cache']),
+            ({'maxDepth': 2, 'filterTypes': ['json']}, ['a/test.json', 'c/test.json', 'cache/test.json']),
+            ({'excludeDirs': ['cache'], 'filterTypes': ['txt']}, ['a/b/test.txt', 'a/test.txt', 'c/test.txt']),
+            ({'excludeDirs': ['*/a/cache']}, ['a', 'a/b', 'a/b/test.json', 'a/b/test.txt', 'a/test.json', 'a/test.txt', 'c', 'c/test.json', 'c/test.txt', 'cache', 'cache/test.json', 'cache/test.txt']),
+            ({'descendFilter': ['a', 'b'], 'filterTypes': ['directory']}, ['a', 'a/b', 'a/cache', 'c', 'cache']),
+            ({'descendFilter': lambda x: x.var('baseName') == 'c'}, ['a', 'c', 'c/test.json', 'c/test.txt', 'cache'])
+        ]
+
+        for kwargs, expected in options:
+            # walking from scratch (with the filter types pushed down)
+            crawler = Crawler.create(PathHolder(rootDir))
+            self.assertEqual(sorted(relativePaths(crawler.glob(**kwargs))), expected)
+
+            # the pruned result is not cached
+            self.assertEqual(len(crawler.glob()), 15)
+
+            # pruning the cached result
+            self.assertEqual(sorted(relativePaths(crawler.glob(**kwargs))), expected)
+
+            crawlers = Crawler.create(PathHolder(rootDir)).iterGlob(**kwargs)
+            self.assertEqual(sorted(relativePaths(crawlers)), expected)
+
+        # the options come in the same order used by Crawler.glob
+        crawler = Crawler.create(PathHolder(rootDir))
+        self.assertEqual(sorted(relativePaths(crawler.glob([], False, 1, 1))), ['a', 'c', 'cache'])
+
+        # files that can't produce the filter types are not created
+        createFilter = Crawler.createFilter(['json'])
+        self.assertTrue(createFilter(PathHolder(os.path.join(rootDir, 'a', 'test.json'))))
+        self.assertFalse(createFilter(PathHolder(os.path.join(rootDir, 'a', 'test.txt'))))
+
     def testPathVariables(self):
         """
         Test that the crawler variables are set properly.
@@ -73,6 +201,69 @@ class FsCrawlerTest(BaseTestCase):
         self.assertEqual(crawler.var('sourceDirectory'), os.path.dirname(name))
         self.assertRaises(CrawlerInvalidVarError, crawler.var, "dummyVar")
 
+    def testStatVariables(self):
+        """
+        Test the inode and device vars provided by the path holder.
+        """
+        filePath = os.path.join(self.tempDirectory(), "statVariables.txt")
+        open(filePath, "w").close()
+        crawler = FsCrawler.createFromPath(filePath)
+        stat = os.stat(filePath)
+        self.assertTrue(crawler.hasVar('inode'))
+        self.assertTrue(crawler.hasVar('device'))
+        self.assertNotIn('inode', crawler.varNames())
+        self.assertTrue(Matcher(matchVars={'inode': stat.st_ino}).match(crawler))
+
+        # paths that do not exist don't provide them
+        crawler = FsCrawler.createFromPath(os.path.join(self.tempDirectory(), "missing.txt"))
+        self.assertFalse(crawler.hasVar('inode'))
+        self.assertFalse(crawler.hasVar('device'))
+        self.assertRaises(CrawlerInvalidVarError, crawler.var, 'inode')
+        self.assertRaises(TemplateVarNotFoundError, Template('{inode}').valueFromCrawler, crawler)
+
+    def testCrawlerInheritedVars(self):
+        """
+        Test that the vars inherited from the parent crawler are isolated between the crawlers.
+        """
+        parentCrawler = Crawler.create(PathHolder(self.__dir))
+        parentCrawler.setVar('job', 'abc', True)
+        parentCrawler.setVar('seq', 'def')
+
+        crawler = Crawler.create(PathHolder(os.path.join(self.__dir, "test.json")), parentCrawler)
+        self.assertEqual(crawler.var('job'), 'abc')
+        self.assertIn('job', crawler.varNames())
+        self.assertIn('job', crawler.contextVarNames())
+        self.assertNotIn('seq', crawler.contextVarNames())
+
+        # changes in the parent should not affect the existing children
+        parentCrawler.setVar('job', 'xyz', True)
+        parentCrawler.setVar('shot', 'ghi')
+        self.assertEqual(crawler.var('job'), 'abc')
+        self.assertNotIn('shot', crawler.varNames())
+
+        # overriding an inherited context var
+        crawler.setVar('job', 'foo')
+        self.assertEqual(crawler.var('job'), 'foo')
+        self.assertNotIn('job', crawler.contextVarNames())
+        self.assertIn('job', parentCrawler.contextVarNames())
+        self.assertEqual(parentCrawler.var('job'), 'xyz')
+
+        otherCrawler = Crawler.create(PathHolder(os.path.join(self.__dir, "test.txt")), parentCrawler)
+        self.assertEqual(otherCrawler.var('job'), 'xyz')
+        self.assertEqual(otherCrawler.var('shot'), 'ghi')
+        self.assertCountEqual(otherCrawler.varNames(), set(otherCrawler.varNames()))
+
+    def testCrawlerSlots(self):
+        """
+        Test that the crawlers and path holders don't allocate an instance dict.
+        """
+        crawler = Crawler.create(PathHolder(self.__turntableFile))
+        self.assertFalse(hasattr(crawler, '__dict__'))
+        self.assertFalse(hasattr(crawler.pathHolder(), '__dict__'))
+
+        crawler = Crawler.create(PathHolder(self.__dir))
+        self.assertFalse(hasattr(crawler, '__dict__'))
+
     def testCrawlerTags(self):
         """
         Test that the Crawler tags are set properly.
@@ -94,6 +285,71 @@ class FsCrawlerTest(BaseTestCase):
         self.assertIn(DummyCrawler, Crawler.registeredSubclasses("file"))
         self.assertIn(DummyCrawler, Crawler.registeredSubclasses(FsCrawler))
 
+    def testCrawlerDispatch(self):
+        """
+        Test that the static selectors skip the types that can't handle the path.
+        """
+        testedPaths = []
+
+        class DispatchCrawler(FileCrawler):
+            testExtensions = ('dispatch',)
+
+            @classmethod
+            def test(cls, pathHolder, parentCrawler):
+                if not super(DispatchCrawler, cls).test(pathHolder, parentCrawler):
+                    return False
+                testedPaths.append(pathHolder.path())
+                return pathHolder.ext() == 'dispatch'
+
+        Crawler.register("dispatchTest", DispatchCrawler)
+        crawler = Crawler.create(PathHolder(self.__turntableFile))
+        self.assertEqual(crawler.var('type'), 'turntable')
+        self.assertEqual(testedPaths, [])
+
+        pathHolder = PathHolder("/tmp/test.dispatch", isDirectory=False)
+        crawler = Crawler.create(pathHolder)
+        self.assertIsInstance(crawler, DispatchCrawler)
+        self.assertEqual(testedPaths, [pathHolder.path()])
+
+        # registrations done later are tested first
+        class OverrideDispatchCrawler(DispatchCrawler):
+            pass
+
+        Crawler.register("dispatchOverrideTest", OverrideDispatchCrawler)
+        crawler = Crawler.create(pathHolder)
+        self.assertEqual(crawler.var('type'), 'dispatchOverrideTest')
+
+    def testCrawlerTestResult(self):
+        """
+        Test that the match object returned by the test is handed off to the constructor.
+        """
+        testResults = []
+
+        class HandoffCrawler(FileCrawler):
+            testExtensions = ('handoff',)
+
+            def __init__(self, *args, **kwargs):
+                super(HandoffCrawler, self).__init__(*args, **kwargs)
+                testResults.append(self.testResult())
+
+            @classmethod
+            def test(cls, pathHolder, parentCrawler):
+                if not super(HandoffCrawler, cls).test(pathHolder, parentCrawler):
+                    return False
+                return {'parts': pathHolder.baseName().split('_')}
+
+        Crawler.register("handoffTest", HandoffCrawler)
+        crawler = Crawler.create(PathHolder("/tmp/a_b.handoff", isDirectory=False))
+        self.assertIsInstance(crawler, HandoffCrawler)
+        self.assertEqual(testResults, [{'parts': ['a', 'b.handoff']}])
+
+        # the test result is only available during the construction
+        self.assertIsNone(crawler.testResult())
+
+        # crawlers created directly don't have a test result
+        FsCrawler.createFromPath("/tmp/a_b.handoff", "handoffTest")
+        self.assertIsNone(testResults[-1])
+
     def testCrawlerClone(self):
         """
         Test that cloning crawlers works.
@@ -103,6 +359,18 @@ class FsCrawlerTest(BaseTestCase):
         self.assertCountEqual(crawler.varNames(), clone.varNames())
         self.assertCountEqual(crawler.contextVarNames(), clone.contextVarNames())
         self.assertCountEqual(crawler.tagNames(), clone.tagNames())
+        self.assertIs(type(crawler), type(clone))
+        self.assertIs(crawler.pathHolder(), clone.pathHolder())
+
+        # modifying the clone should not affect the original crawler
+        clone.setVar('cloneVar', 'a', True)
+        clone.setTag('cloneTag', 'b')
+        self.assertNotIn('cloneVar', crawler.varNames())
+        self.assertNotIn('cloneTag', crawler.tagNames())
+        crawler.setVar('originalVar', 'c')
+        self.assertNotIn('originalVar', clone.varNames())
+        self.assertEqual(clone.var('cloneVar'), 'a')
+        self.assertIn('cloneVar', clone.contextVarNames())
 
     def testCrawlerJson(self):
         """
@@ -2,7 +2,7 @@ import os
 import unittest
 import glob
 from ....BaseTestCase import BaseTestCase
-from kombi.Crawler import Crawler
+from kombi.Crawler import Crawler, CrawlerGroup
 from kombi.Crawler.PathHolder import PathHolder
 from kombi.Crawler.Fs.Image import ExrCrawler
 
@@ -85,6 +85,23 @@ class ExrCrawlerTest(BaseTestCase):
         reversedPaths = list(map(lambda x: x.var("filePath"), reversedGrouped[0]))
         self.assertEqual(reversedPaths, sorted(paths, reverse=True))
 
+    def testImageSequenceGroupFrameRange(self):
+        """
+        Test the frame range and the lazy iteration about the grouped crawlers.
+        """
+        paths = glob.glob("{}/testSeq.*.exr".format(self.dataTestsDirectory()))
+        crawlers = list(map(lambda x: Crawler.create(PathHolder(x)), reversed(sorted(paths))))
+        crawlers.insert(1, Crawler.create(PathHolder(self.__exrFile)))
+        grouped = list(ExrCrawler.iterGroup(crawlers))
+        self.assertEqual(grouped, ExrCrawler.group(crawlers))
+        self.assertEqual(len(grouped), 2)
+        self.assertIsInstance(grouped[0], CrawlerGroup)
+        self.assertEqual(list(map(lambda x: x.var("filePath"), grouped[0])), sorted(paths))
+
+        frames = list(map(lambda x: int(os.path.basename(x).split('.')[1]), paths))
+        self.assertEqual(grouped[0].frameRange(), (min(frames), max(frames)))
+        self.assertIsNone(grouped[1].frameRange())
+
 
 if __name__ == "__main__":
     unittest.main()
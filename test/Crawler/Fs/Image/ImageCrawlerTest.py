@@ -1,7 +1,9 @@
 import os
+import glob
 import unittest
 from ....BaseTestCase import BaseTestCase
 from kombi.Crawler import Crawler
+from kombi.Crawler import CrawlerInvalidVarError
 from kombi.Crawler.Fs.Image import ImageCrawler
 from kombi.Crawler.PathHolder import PathHolder
 
@@ -68,6 +70,66 @@ class ImageCrawlerTest(BaseTestCase):
         self.assertEqual(sequenceCrawler.isSequence(), True)
         self.assertEqual(sequenceCrawler.var("imageType"), "sequence")
 
+    def testPrefetchVars(self):
+        """
+        Test that the lazy vars can be computed for a list of crawlers upfront.
+        """
+        probedPaths = []
+
+        class ProbeImageCrawler(ImageCrawler):
+            def var(self, name):
+                if name in ('width', 'height') and name not in self.varNames():
+                    probedPaths.append(self.pathHolder().path())
+                    self.setVar('width', 1920)
+                    self.setVar('height', 1080)
+                return super(ProbeImageCrawler, self).var(name)
+
+        sequenceFiles = sorted(glob.glob(os.path.join(BaseTestCase.dataTestsDirectory(), "testSeq.*.exr")))
+        crawlers = list(map(lambda x: ProbeImageCrawler(PathHolder(x)), sequenceFiles))
+        ImageCrawler.prefetchVars(crawlers, ['width', 'height'], workers=4)
+        self.assertCountEqual(probedPaths, sequenceFiles)
+
+        # only one frame should be probed per group
+        del probedPaths[:]
+        crawlers = list(map(lambda x: ProbeImageCrawler(PathHolder(x)), sequenceFiles))
+        crawlers.append(ProbeImageCrawler(PathHolder(self.__singleFile)))
+        ImageCrawler.prefetchVars(crawlers, ['width', 'height'], useGroupRepresentative=True)
+        self.assertEqual(sorted(probedPaths), sorted([sequenceFiles[0], self.__singleFile]))
+        for crawler in crawlers:
+            self.assertEqual(crawler.var('width'), 1920)
+            self.assertEqual(crawler.var('height'), 1080)
+        self.assertEqual(len(probedPaths), 2)
+
+        # same-named sequences under different directories are probed separately
+        del probedPaths[:]
+        otherFile = os.path.join(self.tempDirectory(), "prefetchVars", os.path.basename(sequenceFiles[0]))
+        os.makedirs(os.path.dirname(otherFile))
+        open(otherFile, "w").close()
+        crawlers = list(map(lambda x: ProbeImageCrawler(PathHolder(x)), sequenceFiles + [otherFile]))
+        ImageCrawler.prefetchVars(crawlers, ['width', 'height'], useGroupRepresentative=True)
+        self.assertEqual(sorted(probedPaths), sorted([sequenceFiles[0], otherFile]))
+
+    def testHeaderVarsComputedOnce(self):
+        """
+        Test that the header is only read once for the vars that are not supplied by the format.
+        """
+        headerReads = []
+
+        class CountImageCrawler(ImageCrawler):
+            def _computeHeaderVars(self):
+                headerReads.append(self.pathHolder().path())
+                return super(CountImageCrawler, self)._computeHeaderVars()
+
+            def _probeVars(self):
+                pass
+
+        crawler = CountImageCrawler(PathHolder(os.path.join(BaseTestCase.dataTestsDirectory(), "test.png")))
+        width = crawler.var('width')
+        for _ in range(2):
+            self.assertRaises(CrawlerInvalidVarError, crawler.var, 'displayWindow')
+        self.assertEqual(crawler.var('width'), width)
+        self.assertEqual(len(headerReads), 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,100 @@
+import os
+import struct
+import unittest
+from ....BaseTestCase import BaseTestCase
+from kombi.Crawler import Crawler
+from kombi.Crawler.PathHolder import PathHolder
+from kombi.Crawler.Fs.Image import ImageHeader, ImageHeaderError, ImageHeaderUnsupportedError
+
+class ImageHeaderTest(BaseTestCase):
+    """Test the image header reader."""
+
+    __exrFile = os.path.join(BaseTestCase.dataTestsDirectory(), "test.exr")
+    __pngFile = os.path.join(BaseTestCase.dataTestsDirectory(), "test.png")
+    __jpgFile = os.path.join(BaseTestCase.dataTestsDirectory(), "test.jpg")
+    __txtFile = os.path.join(BaseTestCase.dataTestsDirectory(), "test.txt")
+
+    def testExrHeader(self):
+        """
+        Test reading the header of an exr file.
+        """
+        result = ImageHeader.read(self.__exrFile, 'exr')
+        self.assertEqual(result['width'], 1920)
+        self.assertEqual(result['height'], 1080)
+        self.assertEqual(result['channels'], 3)
+        self.assertEqual(result['pixelType'], 'half')
+        self.assertEqual(result['compression'], 'zips')
+        self.assertEqual(result['dataWindow'], [0, 0, 1919, 1079])
+        self.assertEqual(result['displayWindow'], [0, 0, 1919, 1079])
+
+    def testPngHeader(self):
+        """
+        Test reading the header of a png file.
+        """
+        result = ImageHeader.read(self.__pngFile, 'png')
+        self.assertEqual(result['width'], 512)
+        self.assertEqual(result['height'], 512)
+        self.assertEqual(result['channels'], 4)
+        self.assertEqual(result['pixelType'], 'uint8')
+
+    def testJpgHeader(self):
+        """
+        Test reading the header of a jpg file.
+        """
+        result = ImageHeader.read(self.__jpgFile, 'jpg')
+        self.assertEqual(result['width'], 512)
+        self.assertEqual(result['height'], 512)
+        self.assertEqual(result['channels'], 3)
+        self.assertEqual(result['pixelType'], 'uint8')
+
+    def testDpxHeader(self):
+        """
+        Test reading the header of a dpx file.
+        """
+        dpxFile = os.path.join(self.tempDirectory(), "header.dpx")
+        header = bytearray(2048)
+        header[0:4] = b'SDPX'
+        header[772:780] = struct.pack('>2I', 2048, 1556)
+        header[800] = 50
+        header[803] = 10
+        with open(dpxFile, 'wb') as f:
+            f.write(bytes(header))
+
+        result = ImageHeader.read(dpxFile, 'dpx')
+        self.assertEqual(result['width'], 2048)
+        self.assertEqual(result['height'], 1556)
+        self.assertEqual(result['channels'], 3)
+        self.assertEqual(result['pixelType'], 'uint10')
+
+    def testInvalidHeader(self):
+        """
+        Test that reading invalid headers raise an exception.
+        """
+        self.assertRaises(ImageHeaderError, ImageHeader.read, self.__txtFile, 'exr')
+        self.assertRaises(ImageHeaderError, ImageHeader.read, self.__txtFile, 'png')
+        self.assertRaises(ImageHeaderUnsupportedError, ImageHeader.read, self.__txtFile, 'txt')
+
+        # channel name without the null terminator
+        exrFile = os.path.join(self.tempDirectory(), "malformedChannels.exr")
+        with open(exrFile, 'wb') as f:
+            f.write(b'\x76\x2f\x31\x01' + struct.pack('<i', 2))
+            f.write(b'channels\x00chlist\x00' + struct.pack('<i', 1) + b'R')
+            f.write(b'\x00')
+        self.assertRaises(ImageHeaderError, ImageHeader.read, exrFile, 'exr')
+
+    def testCrawlerHeaderVars(self):
+        """
+        Test that the crawler uses the header information as lazy vars.
+        """
+        crawler = Crawler.create(PathHolder(self.__exrFile))
+        self.assertNotIn('width', crawler.varNames())
+        self.assertEqual(crawler.var('width'), 1920)
+        self.assertEqual(crawler.var('height'), 1080)
+        self.assertEqual(crawler.var('compression'), 'zips')
+
+        crawler = Crawler.create(PathHolder(self.__pngFile))
+        self.assertEqual(crawler.var('channels'), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
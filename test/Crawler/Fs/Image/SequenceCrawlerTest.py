@@ -0,0 +1,124 @@
+import os
+import glob
+import unittest
+from ....BaseTestCase import BaseTestCase
+from kombi.Crawler import Crawler
+from kombi.Crawler.PathHolder import PathHolder
+from kombi.Crawler.Fs import FsCrawler
+from kombi.Crawler.Fs.Image import ExrCrawler, SequenceCrawler
+
+class SequenceCrawlerTest(BaseTestCase):
+    """Test Sequence crawler."""
+
+    __sequenceFiles = sorted(glob.glob(os.path.join(BaseTestCase.dataTestsDirectory(), "testSeq.*.exr")))
+    __singleFile = os.path.join(BaseTestCase.dataTestsDirectory(), "test.exr")
+
+    def testCollapse(self):
+        """
+        Test that the frames of a sequence are collapsed into a sequence crawler.
+        """
+        crawlers = [Crawler.create(PathHolder(self.__singleFile))]
+        crawlers += list(map(lambda x: Crawler.create(PathHolder(x)), self.__sequenceFiles))
+        result = SequenceCrawler.collapse(crawlers)
+
+        self.assertEqual(len(result), 2)
+        self.assertIsInstance(result[0], ExrCrawler)
+        sequenceCrawler = result[1]
+        self.assertIsInstance(sequenceCrawler, SequenceCrawler)
+        self.assertEqual(sequenceCrawler.var('type'), 'sequence')
+        self.assertEqual(sequenceCrawler.var('name'), 'testSeq')
+        self.assertEqual(sequenceCrawler.var('padding'), 4)
+        self.assertEqual(sequenceCrawler.var('ext'), 'exr')
+        self.assertEqual(sequenceCrawler.var('firstFrame'), 1)
+        self.assertEqual(sequenceCrawler.var('lastFrame'), 12)
+        self.assertEqual(sequenceCrawler.var('frameRanges'), '1-12')
+        self.assertEqual(sequenceCrawler.tag('group'), 'testSeq.####.exr')
+        self.assertEqual(
+            sequenceCrawler.var('fullPath'),
+            os.path.join(BaseTestCase.dataTestsDirectory(), 'testSeq.####.exr')
+        )
+
+    def testFrameExpansion(self):
+        """
+        Test that the frame crawlers are created on demand.
+        """
+        crawlers = list(map(lambda x: Crawler.create(PathHolder(x)), self.__sequenceFiles))
+        del crawlers[4:6]
+        sequenceCrawler = SequenceCrawler.collapse(crawlers)[0]
+        self.assertEqual(sequenceCrawler.var('frameRanges'), '1-4,7-12')
+        self.assertEqual(sequenceCrawler.missingFrames(), [5, 6])
+        self.assertEqual(len(sequenceCrawler.frames()), 10)
+
+        frameCrawlers = list(sequenceCrawler.frameCrawlers())
+        self.assertEqual(
+            list(map(lambda x: x.var('fullPath'), frameCrawlers)),
+            list(map(lambda x: x.var('fullPath'), crawlers))
+        )
+        self.assertIs(type(frameCrawlers[0]), type(crawlers[0]))
+        self.assertEqual(frameCrawlers[0].var('type'), crawlers[0].var('type'))
+        self.assertEqual(frameCrawlers[-1].var('frame'), 12)
+
+    def testSequenceVars(self):
+        """
+        Test that the sequence and its frame crawlers carry the vars of the globbed frames.
+        """
+        rootDir = os.path.join(self.tempDirectory(), "sequenceVars")
+        os.makedirs(os.path.join(rootDir, "shot", "plates"))
+        for frame in (1001, 1002, 1003):
+            open(os.path.join(rootDir, "shot", "plates", "plate.{}.exr".format(frame)), "w").close()
+
+        crawler = FsCrawler.createFromPath(rootDir)
+        frameCrawlers = crawler.glob(['exr'])
+        sequenceCrawler = crawler.glob(['exr'], collapseSequences=True)[0]
+        self.assertIsInstance(sequenceCrawler, SequenceCrawler)
+
+        frameVarNames = ('type', 'frame', 'name', 'padding', 'imageType', 'filePath', 'fullPath', 'baseName')
+        for varName in frameCrawlers[0].varNames():
+            if varName not in frameVarNames:
+                self.assertEqual(sequenceCrawler.var(varName), frameCrawlers[0].var(varName), varName)
+        self.assertEqual(sequenceCrawler.var('sourceDirectory'), rootDir)
+
+        # the vars are passed back to the frame crawlers
+        expandedCrawlers = list(sequenceCrawler.frameCrawlers())
+        self.assertEqual(len(expandedCrawlers), len(frameCrawlers))
+        for frameCrawler, expandedCrawler in zip(frameCrawlers, expandedCrawlers):
+            self.assertEqual(
+                dict((x, expandedCrawler.var(x)) for x in expandedCrawler.varNames()),
+                dict((x, frameCrawler.var(x)) for x in frameCrawler.varNames())
+            )
+            self.assertCountEqual(expandedCrawler.contextVarNames(), frameCrawler.contextVarNames())
+
+    def testFrameRanges(self):
+        """
+        Test the encoding of frame ranges.
+        """
+        self.assertEqual(SequenceCrawler.encodeFrameRanges([5, 1, 2, 3, 10, 9, -2]), '-2,1-3,5,9-10')
+        self.assertEqual(
+            SequenceCrawler.decodeFrameRanges('-5--3,1-3,5'),
+            [(-5, -3), (1, 3), (5, 5)]
+        )
+
+    def testGlobCollapse(self):
+        """
+        Test that glob emits sequence crawlers when requested.
+        """
+        crawler = FsCrawler.createFromPath(BaseTestCase.dataTestsDirectory())
+        result = crawler.glob(['exr'], collapseSequences=True)
+        sequenceCrawlers = list(filter(lambda x: isinstance(x, SequenceCrawler), result))
+        self.assertIn('testSeq.####.exr', list(map(lambda x: x.tag('group'), sequenceCrawlers)))
+        self.assertLess(len(result), len(crawler.glob(['exr'])))
+
+    def testSequenceJson(self):
+        """
+        Test that a sequence crawler can be serialized.
+        """
+        crawlers = list(map(lambda x: Crawler.create(PathHolder(x)), self.__sequenceFiles))
+        sequenceCrawler = SequenceCrawler.collapse(crawlers)[0]
+        result = Crawler.createFromJson(sequenceCrawler.toJson())
+        self.assertIsInstance(result, SequenceCrawler)
+        self.assertEqual(result.frames(), sequenceCrawler.frames())
+        self.assertEqual(result.tag('groupSprintf'), 'testSeq.%04d.exr')
+
+
+if __name__ == "__main__":
+    unittest.main()
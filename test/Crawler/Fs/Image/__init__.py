@@ -3,3 +3,5 @@ from .DpxCrawlerTest import DpxCrawlerTest
 from .ExrCrawlerTest import ExrCrawlerTest
 from .JpgCrawlerTest import JpgCrawlerTest
 from .PngCrawlerTest import PngCrawlerTest
+from .ImageHeaderTest import ImageHeaderTest
+from .SequenceCrawlerTest import SequenceCrawlerTest
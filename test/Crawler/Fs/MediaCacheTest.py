@@ -0,0 +1,107 @@
+import os
+import sys
+import time
+import shutil
+import unittest
+from ...BaseTestCase import BaseTestCase
+from kombi.Crawler import Crawler
+from kombi.Crawler.PathHolder import PathHolder
+from kombi.Crawler.Fs import MediaCache
+
+class MediaCacheTest(BaseTestCase):
+    """Test the media cache."""
+
+    __exrFile = os.path.join(BaseTestCase.dataTestsDirectory(), "test.exr")
+    __dir = os.path.join(BaseTestCase.tempDirectory(), "mediaCache")
+    __cacheDir = os.path.join(BaseTestCase.tempDirectory(), "mediaCacheDatabase")
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Create the files used by the tests.
+        """
+        os.makedirs(cls.__dir)
+        for index in range(5):
+            with open(os.path.join(cls.__dir, "test.{}.txt".format(index)), "w") as f:
+                f.write("test")
+
+    def testMediaCacheVars(self):
+        """
+        Test that the cached vars are invalidated when the file changes.
+        """
+        mediaCache = MediaCache(self.__cacheDir)
+        filePath = os.path.join(self.__dir, "test.0.txt")
+        self.assertEqual(mediaCache.vars(filePath), {})
+
+        mediaCache.setVars(filePath, {'width': 1920})
+        mediaCache.setVars(filePath, {'height': 1080})
+        self.assertEqual(mediaCache.vars(filePath), {'width': 1920, 'height': 1080})
+
+        # changing the file contents
+        time.sleep(0.01)
+        with open(filePath, "w") as f:
+            f.write("modified")
+        self.assertEqual(mediaCache.vars(filePath), {})
+        mediaCache.close()
+
+    @unittest.skipIf(sys.version_info[0] < 3, "os.utime does not support nanoseconds")
+    def testMediaCacheNanoseconds(self):
+        """
+        Test that the cached vars are invalidated by a modification time change smaller than a microsecond.
+        """
+        mediaCache = MediaCache(self.__cacheDir)
+        filePath = os.path.join(self.__dir, "test.1.txt")
+        mtimeNs = os.stat(filePath).st_mtime_ns - os.stat(filePath).st_mtime_ns % 1000000000 + 500
+        os.utime(filePath, ns=(mtimeNs, mtimeNs))
+
+        mediaCache.setVars(filePath, {'width': 1920})
+        self.assertEqual(mediaCache.vars(filePath), {'width': 1920})
+
+        os.utime(filePath, ns=(mtimeNs + 1, mtimeNs + 1))
+        if os.stat(filePath).st_mtime_ns != mtimeNs + 1:
+            mediaCache.close()
+            self.skipTest("file system does not store nanoseconds")
+        self.assertEqual(PathHolder(filePath).mtimeNs(), mtimeNs + 1)
+        self.assertEqual(mediaCache.vars(filePath), {})
+        mediaCache.close()
+
+    def testMediaCacheEviction(self):
+        """
+        Test that the least recently used entries are evicted.
+        """
+        mediaCache = MediaCache(os.path.join(self.__cacheDir, "eviction"), maxEntries=2)
+        for index in range(5):
+            mediaCache.setVars(os.path.join(self.__dir, "test.{}.txt".format(index)), {'index': index})
+            time.sleep(0.001)
+        mediaCache.evict()
+
+        result = []
+        for index in range(5):
+            result.append(mediaCache.vars(os.path.join(self.__dir, "test.{}.txt".format(index))))
+        self.assertEqual(result, [{}, {}, {}, {'index': 3}, {'index': 4}])
+        mediaCache.close()
+
+    def testCrawlerMediaCache(self):
+        """
+        Test that the crawler lazy vars are shared through the media cache.
+        """
+        os.environ['KOMBI_MEDIA_CACHE_DIR'] = os.path.join(self.__cacheDir, "crawler")
+        try:
+            crawler = Crawler.create(PathHolder(self.__exrFile))
+            self.assertEqual(crawler.var('width'), 1920)
+
+            # the vars should come from the cache
+            MediaCache.default().setVars(self.__exrFile, {'width': 1, 'height': 2})
+            crawler = Crawler.create(PathHolder(self.__exrFile))
+            self.assertEqual(crawler.var('width'), 1)
+            self.assertEqual(crawler.var('height'), 2)
+        finally:
+            MediaCache.default().close()
+            del os.environ['KOMBI_MEDIA_CACHE_DIR']
+            shutil.rmtree(os.path.join(self.__cacheDir, "crawler"))
+
+        self.assertIsNone(MediaCache.default())
+
+
+if __name__ == "__main__":
+    unittest.main()
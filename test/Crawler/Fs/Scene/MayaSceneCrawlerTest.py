@@ -37,6 +37,12 @@ class MayaSceneCrawlerTest(BaseTestCase):
         self.assertCountEqual(MayaSceneCrawler.extensions(), ["ma", "mb"])
         self.assertRaises(NotImplementedError, SceneCrawler.extensions)
 
+        # the extensions are used by the type dispatch and pushdown
+        createFilter = Crawler.createFilter(["mayaScene"])
+        self.assertTrue(createFilter(PathHolder(self.__maFile)))
+        self.assertTrue(createFilter(PathHolder(self.__mbFile)))
+        self.assertFalse(createFilter(PathHolder(self.__maFile[:-2] + "exr")))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,9 +1,9 @@
 import os
 import unittest
 from ....BaseTestCase import BaseTestCase
-from kombi.Crawler import Crawler
+from kombi.Crawler import Crawler, CrawlerInvalidVarError
 from kombi.Crawler.PathHolder import PathHolder
-from kombi.Crawler.Fs.Video import MovCrawler
+from kombi.Crawler.Fs.Video import MovCrawler, QuickTimeHeader, QuickTimeHeaderError
 
 class MovTest(BaseTestCase):
     """Test Texture crawler."""
@@ -34,6 +34,26 @@ class MovTest(BaseTestCase):
         self.assertEqual(crawler.var("firstFrame"), 0)
         self.assertEqual(crawler.var("lastFrame"), 23)
 
+    def testMovHeaderVars(self):
+        """
+        Test that the vars are read from the QuickTime header.
+        """
+        result = QuickTimeHeader.read(self.__movFile)
+        self.assertEqual(result['width'], 1920)
+        self.assertEqual(result['height'], 1080)
+        self.assertEqual(result['codec'], 'ap4h')
+        self.assertEqual(result['frameRate'], 24.0)
+        self.assertEqual(result['firstFrame'], 1)
+        self.assertEqual(result['lastFrame'], 12)
+
+        crawler = Crawler.create(PathHolder(self.__movFile))
+        self.assertNotIn('codec', crawler.varNames())
+        self.assertEqual(crawler.var('codec'), 'ap4h')
+        self.assertEqual(crawler.var('frameRate'), 24.0)
+
+        textFile = os.path.join(BaseTestCase.dataTestsDirectory(), "test.txt")
+        self.assertRaises(QuickTimeHeaderError, QuickTimeHeader.read, textFile)
+
     def testMovTags(self):
         """
         Test that the tags are set properly.
@@ -41,6 +61,29 @@ class MovTest(BaseTestCase):
         crawler = Crawler.create(PathHolder(self.__movFile))
         self.assertEqual(crawler.tag("video"), "video.mov")
 
+    def testMovMediaVarsComputedOnce(self):
+        """
+        Test that the media vars are only computed once for the vars that are not supplied by the file.
+        """
+        computeCalls = []
+
+        class CountMovCrawler(MovCrawler):
+            def _computeHeaderVars(self):
+                computeCalls.append('header')
+                return super(CountMovCrawler, self)._computeHeaderVars()
+
+            def _probeVars(self):
+                computeCalls.append('probe')
+
+        movFile = os.path.join(self.tempDirectory(), "invalidHeader.mov")
+        with open(movFile, "w") as f:
+            f.write("invalid")
+
+        crawler = CountMovCrawler(PathHolder(movFile))
+        for varName in ('firstFrame', 'firstFrame', 'width', 'codec'):
+            self.assertRaises(CrawlerInvalidVarError, crawler.var, varName)
+        self.assertEqual(computeCalls, ['header', 'probe'])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -7,3 +7,7 @@ from . import Texture
 from . import Video
 from .DirectoryCrawlerTest import DirectoryCrawlerTest
 from .FsCrawlerTest import FsCrawlerTest
+from .CrawlIndexTest import CrawlIndexTest
+from .MediaCacheTest import MediaCacheTest
+from .DirectoryWatcherTest import DirectoryWatcherTest
+from .CrawlSnapshotTest import CrawlSnapshotTest
@@ -61,6 +61,18 @@ class HashmapCrawlerTest(BaseTestCase):
 
         self.assertEqual(len(hashmap), 0)
 
+    def testCloneData(self):
+        """
+        Test that the cloned hashmap holds its own data.
+        """
+        hashmap = Crawler.create({"a": 1})
+        clone = hashmap.clone()
+        clone["b"] = 2
+
+        self.assertEqual(len(hashmap), 1)
+        self.assertEqual(len(clone), 2)
+        self.assertEqual(clone['a'], 1)
+
     def testItemsData(self):
         """
         Test items, keys and values for the data.
@@ -0,0 +1,63 @@
+import os
+import unittest
+from ..BaseTestCase import BaseTestCase
+from kombi.Crawler import Crawler, Matcher
+from kombi.Crawler.PathHolder import PathHolder
+from kombi.Crawler.Fs import FileCrawler
+
+class MatcherTest(BaseTestCase):
+    """Test the crawler matcher."""
+
+    __exrFile = os.path.join(BaseTestCase.dataTestsDirectory(), "testSeq.0001.exr")
+    __txtFile = os.path.join(BaseTestCase.dataTestsDirectory(), "test.txt")
+
+    def testMatchTypes(self):
+        """
+        Test matching the crawler types (including derived types).
+        """
+        exrCrawler = Crawler.create(PathHolder(self.__exrFile))
+        txtCrawler = Crawler.create(PathHolder(self.__txtFile))
+
+        self.assertTrue(Matcher().match(exrCrawler))
+        self.assertTrue(Matcher(['file']).match(exrCrawler))
+        self.assertTrue(Matcher(['exr']).match(exrCrawler))
+        self.assertFalse(Matcher(['exr']).match(txtCrawler))
+        self.assertTrue(Matcher(['jpg', 'txt']).match(txtCrawler))
+
+    def testMatchVars(self):
+        """
+        Test matching the crawler vars using glob syntax.
+        """
+        crawler = Crawler.create(PathHolder(self.__exrFile))
+
+        self.assertTrue(Matcher(['exr'], {'name': 'test*'}).match(crawler))
+        self.assertTrue(Matcher(['exr'], {'name': ['a*', 'testS?q']}).match(crawler))
+        self.assertTrue(Matcher(['exr'], {'frame': '1'}).match(crawler))
+        self.assertFalse(Matcher(['exr'], {'name': 'a*'}).match(crawler))
+        self.assertFalse(Matcher(['exr'], {'missingVar': '*'}).match(crawler))
+
+        # vars restricted to a type
+        self.assertTrue(Matcher([], {'txt=name': 'a*'}).match(crawler))
+        self.assertFalse(Matcher([], {'exr=name': 'a*'}).match(crawler))
+
+    def testRegistryInvalidation(self):
+        """
+        Test that the compiled matcher is updated when a new type is registered.
+        """
+        class MatcherTestCrawler(FileCrawler):
+            @classmethod
+            def test(cls, pathHolder, parentCrawler):
+                return False
+
+        crawler = MatcherTestCrawler(PathHolder(self.__txtFile))
+        crawler.setVar('type', 'matcherTest')
+
+        matcher = Matcher(['file'])
+        self.assertFalse(matcher.match(crawler))
+
+        Crawler.register('matcherTest', MatcherTestCrawler)
+        self.assertTrue(matcher.match(crawler))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -116,6 +116,65 @@ class VarExtractorTest(BaseTestCase):
             raiseOnFail=True
         )
 
+    def testContextVarsAndTypes(self):
+        """
+        Test extracting context vars converted to the var types.
+        """
+        varExtractor = VarExtractor(
+            "shotA_plate_v003.1001.exr",
+            "{@shot:S}_{name}_v{@version:3i}.{frame:f}.{ext:2}"
+        )
+
+        self.assertTrue(varExtractor.match())
+        self.assertEqual(varExtractor.var('shot'), 'SHOTA')
+        self.assertEqual(varExtractor.var('name'), 'plate')
+        self.assertEqual(varExtractor.var('version'), 3)
+        self.assertEqual(varExtractor.var('frame'), 1001.0)
+        self.assertEqual(varExtractor.var('ext'), 'ex')
+        self.assertListEqual(varExtractor.contextVarNames(), ['shot', 'version'])
+
+    def testFixedSizeAtTheEnd(self):
+        """
+        Test that a fixed size var gets truncated at the end of the value.
+        """
+        varExtractor = VarExtractor("abc_de", "abc_{name:4}")
+
+        self.assertTrue(varExtractor.match())
+        self.assertEqual(varExtractor.var('name'), 'de')
+
+    def testCannotFindExpectedCharAfterVar(self):
+        """
+        Test cannot find expected char after a var.
+        """
+        varExtractor = VarExtractor("abc__def", "abc_{name}_def")
+
+        self.assertFalse(varExtractor.match())
+        self.assertIsInstance(
+            varExtractor.error(),
+            VarExtractorCannotFindExpectedCharError
+        )
+
+    def testMatchMany(self):
+        """
+        Test matching multiple values against the same value pattern.
+        """
+        valuePattern = "{job:3}_{seq:3}_*_{plateName}_V{version:4i}.####.{ext}"
+        values = [
+            "PRO_ABC_D-E-F_FOO_V0001.0001.png",
+            "PRO_ABC_D-E-F_FOO_VABCD.0001.png",
+            "PRO_ABC_FOO.png",
+            "FOO_DEF_G-H_BAR_V0012.1001.exr"
+        ]
+
+        self.assertListEqual(
+            VarExtractor.matchMany(values, valuePattern),
+            list(map(lambda x: VarExtractor(x, valuePattern).match(), values))
+        )
+        self.assertListEqual(
+            VarExtractor.matchMany(values, valuePattern),
+            [True, False, False, True]
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
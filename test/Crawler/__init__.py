@@ -1,2 +1,5 @@
 from . import Fs
 from . import Generic
+from .BatchSerializerTest import BatchSerializerTest
+from .MatcherTest import MatcherTest
+from .VarExtractorTest import VarExtractorTest
@@ -1,5 +1,6 @@
 import unittest
 import os
+import sys
 from ...BaseTestCase import BaseTestCase
 from kombi.Task import Task
 from kombi.Template import Template
@@ -7,6 +8,12 @@ from kombi.Crawler.Fs import FsCrawler, DirectoryCrawler
 from kombi.Crawler.Fs.Image import ExrCrawler
 from kombi.Crawler.Fs.Ascii import JsonCrawler, TxtCrawler
 
+# python 2 does not support recursion in the glob syntax
+if sys.version_info[0] < 3:
+    from kombithirdparty.glob2 import glob
+else:
+    from glob import glob
+
 class GlobTaskTest(BaseTestCase):
     """Test Glob task."""
 
@@ -140,6 +147,80 @@ class GlobTaskTest(BaseTestCase):
             self.assertIsInstance(resultCrawler, ExrCrawler)
             self.assertIn(resultCrawler.var('baseName'), self.__globFiles['exr'])
 
+    def testGlobPruned(self):
+        """
+        Test the glob task options used to prune the directories and files.
+        """
+        rootDir = os.path.join(BaseTestCase.tempDirectory(), "globPruned")
+        for dirName in ("a", os.path.join("a", "b"), "cache", ".hidden"):
+            os.makedirs(os.path.join(rootDir, dirName))
+            for fileName in ("test.txt", "test.json"):
+                open(os.path.join(rootDir, dirName, fileName), "w").close()
+
+        crawler = FsCrawler.createFromPath(rootDir)
+        for options, expected in (
+                ({}, ['a/b/test.json', 'a/test.json', 'cache/test.json']),
+                ({'excludeDirs': ['cache']}, ['a/b/test.json', 'a/test.json']),
+                ({'maxDepth': 2}, ['a/test.json', 'cache/test.json']),
+                ({'excludeDirs': ['*/a/b'], 'filterTypes': ['json']}, ['a/test.json', 'cache/test.json']),
+                ({'filterTypes': ['txt']}, [])):
+            globTask = Task.create('glob')
+            for optionName, optionValue in options.items():
+                globTask.setOption(optionName, optionValue)
+            globTask.add(crawler, os.path.join(rootDir, "**", "*.json"))
+
+            result = globTask.output()
+            self.assertEqual(
+                sorted(map(lambda x: os.path.relpath(x.var('filePath'), rootDir), result)),
+                expected
+            )
+
+    @unittest.skipUnless(hasattr(os, 'symlink'), "symlinks are not supported")
+    def testGlobPrunedSymlinks(self):
+        """
+        Test that the pruned glob task resolves the same paths as glob (following symlinks).
+        """
+        rootDir = os.path.join(BaseTestCase.tempDirectory(), "globPrunedSymlinks")
+        for dirName in (os.path.join("a", "b"), "c", ".hidden"):
+            os.makedirs(os.path.join(rootDir, dirName))
+            for fileName in ("test.txt", "test.json"):
+                open(os.path.join(rootDir, dirName, fileName), "w").close()
+        os.symlink(os.path.join("..", "c"), os.path.join(rootDir, "a", "linked"))
+
+        crawler = FsCrawler.createFromPath(rootDir)
+        currentDirectory = os.getcwd()
+        os.chdir(rootDir)
+        try:
+            for pattern in (
+                    os.path.join(rootDir, "**", "*.json"),
+                    os.path.join(rootDir, "a", "**"),
+                    os.path.join("**", "*.json"),
+                    os.path.join("**", "*")):
+                globTask = Task.create('glob')
+                globTask.setOption('excludeDirs', ['cache'])
+                globTask.add(crawler, pattern)
+
+                self.assertEqual(
+                    sorted(map(lambda x: x.var('filePath').rstrip(os.sep), globTask.output())),
+                    sorted(map(lambda x: x.rstrip(os.sep), glob(pattern, recursive=True)))
+                )
+
+            # directories pointing to one of their ancestors are not visited
+            os.symlink(os.pardir, os.path.join(rootDir, "c", "loop"))
+            globTask = Task.create('glob')
+            globTask.setOption('excludeDirs', ['cache'])
+            globTask.add(crawler, os.path.join("**", "*.json"))
+            self.assertEqual(
+                sorted(map(lambda x: x.var('filePath'), globTask.output())),
+                [
+                    os.path.join('a', 'b', 'test.json'),
+                    os.path.join('a', 'linked', 'test.json'),
+                    os.path.join('c', 'test.json')
+                ]
+            )
+        finally:
+            os.chdir(currentDirectory)
+
 
 if __name__ == "__main__":
     unittest.main()